@@ -0,0 +1,86 @@
+"""Compare the results of a benchmark run with a baseline and flag regressions.
+
+Usage
+-----
+python benchmarks/compare.py benchmarks/baselines/<baseline>.json <results>.json [--stat median] [--threshold 0.2]
+
+Both files are JSON reports of pytest-benchmark, as written with ``--benchmark-json``.
+The exit code is 1 if at least one benchmark is slower than the baseline by more than the threshold.
+
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(filepath, stat):
+    with open(filepath, "r") as f:
+        report = json.load(f)
+    return {item["fullname"]: item["stats"][stat] for item in report["benchmarks"]}
+
+
+def compare(baseline, results, threshold):
+    """Compare the timings of two runs.
+
+    Parameters
+    ----------
+    baseline : dict[str, float]
+        The timings of the baseline, per benchmark.
+    results : dict[str, float]
+        The timings of the new run, per benchmark.
+    threshold : float
+        The relative slowdown above which a benchmark is considered a regression.
+
+    Returns
+    -------
+    list[tuple[str, float | None, float | None, float | None, str]]
+        The name, the baseline and new timings, the relative change, and the status of every benchmark.
+
+    """
+    rows = []
+    for name in sorted(set(baseline) | set(results)):
+        old = baseline.get(name)
+        new = results.get(name)
+        if old is None:
+            rows.append((name, old, new, None, "new"))
+        elif new is None:
+            rows.append((name, old, new, None, "missing"))
+        else:
+            change = (new - old) / old if old else 0.0
+            if change > threshold:
+                status = "REGRESSION"
+            elif change < -threshold:
+                status = "improved"
+            else:
+                status = "ok"
+            rows.append((name, old, new, change, status))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("results")
+    parser.add_argument("--stat", default="median", choices=["min", "max", "mean", "median"])
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown flagged as regression.")
+    args = parser.parse_args()
+
+    rows = compare(load(args.baseline, args.stat), load(args.results, args.stat), args.threshold)
+
+    width = max([len(row[0]) for row in rows] + [9])
+    print("{:<{w}} {:>12} {:>12} {:>9}  {}".format("benchmark", "baseline [s]", "current [s]", "change", "status", w=width))
+    for name, old, new, change, status in rows:
+        old = "-" if old is None else "{:.6f}".format(old)
+        new = "-" if new is None else "{:.6f}".format(new)
+        change = "-" if change is None else "{:+.1%}".format(change)
+        print("{:<{w}} {:>12} {:>12} {:>9}  {}".format(name, old, new, change, status, w=width))
+
+    regressions = [row for row in rows if row[4] == "REGRESSION"]
+    if regressions:
+        print("\n{} regression(s) above {:.0%}.".format(len(regressions), args.threshold))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
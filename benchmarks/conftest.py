@@ -0,0 +1,89 @@
+"""Configuration and models of the benchmark suite.
+
+The models are generated from the templates of :mod:`compas_assembly.geometry`,
+and from a synthetic wall in running bond,
+at sizes of 10**2 to 10**5 blocks.
+Only the sizes up to ``--max-blocks`` are included in a run.
+
+"""
+
+from math import ceil
+from math import sqrt
+
+import pytest
+
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+from compas_assembly.geometry import Arch
+from compas_assembly.geometry import Dome
+
+SIZES = [100, 1000, 10000, 100000]
+
+
+def arch_assembly(n):
+    return Assembly.from_template(Arch(rise=5, span=10, thickness=0.7, depth=0.5, n=n))
+
+
+def dome_assembly(n):
+    hoops = max(2, int(round(sqrt(n / 2))))
+    return Assembly.from_template(Dome(meridians=2 * hoops, hoops=hoops))
+
+
+def wall_assembly(n):
+    courses = max(1, int(round(sqrt(n / 3))))
+    columns = int(ceil(n / courses))
+    assembly = Assembly()
+    for k in range(courses):
+        offset = 0.5 if k % 2 else 0.0
+        for i in range(columns):
+            frame = Frame([i + offset, 0, 0.15 + k * 0.3], [1, 0, 0], [0, 1, 0])
+            assembly.add_block(Block.from_shape(Box(1.0, 0.5, 0.3, frame)))
+    return assembly
+
+
+# the generator and the interface detection parameters per model
+MODELS = {
+    "arch": (arch_assembly, dict(nmax=10, tmax=1e-3, amin=1e-4)),
+    "dome": (dome_assembly, dict(nmax=20, tmax=1e-1, amin=1e-3)),
+    "wall": (wall_assembly, dict(nmax=10, tmax=1e-6, amin=1e-2)),
+}
+
+_cache = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption("--max-blocks", type=int, default=100, help="The maximum number of blocks of the benchmark models.")
+
+
+def pytest_generate_tests(metafunc):
+    if "model" in metafunc.fixturenames:
+        nmax = metafunc.config.getoption("--max-blocks")
+        models = [(name, n) for name in MODELS for n in SIZES if n <= nmax]
+        metafunc.parametrize("model", models, ids=["{}-{}".format(name, n) for name, n in models])
+
+
+@pytest.fixture
+def params(model):
+    """The interface detection parameters of the model."""
+    return MODELS[model[0]][1]
+
+
+@pytest.fixture
+def assembly(model, benchmark):
+    """The model, without interfaces."""
+    if model not in _cache:
+        _cache[model] = MODELS[model[0]][0](model[1])
+    benchmark.extra_info["blocks"] = _cache[model].number_of_blocks()
+    return _cache[model]
+
+
+@pytest.fixture
+def assembly_with_interfaces(model, assembly, params):
+    """The model, with interfaces."""
+    key = model + ("interfaces",)
+    if key not in _cache:
+        _cache[key] = assembly_interfaces_numpy(assembly.copy(), **params)
+    return _cache[key]
@@ -0,0 +1,60 @@
+"""Speedup of the parallel interface detection versus the number of worker processes.
+
+Usage
+-----
+python benchmarks/parallel_interfaces.py [--meridians 80] [--hoops 40] [--workers 1 2 4 8]
+
+"""
+
+import argparse
+import os
+import time
+
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.algorithms import assembly_interfaces_parallel
+from compas_assembly.datastructures import Assembly
+from compas_assembly.geometry import Dome
+
+
+def interfaces_signature(assembly):
+    signature = []
+    for u, v in assembly.edges():
+        for interface in assembly.edge_interfaces((u, v)):
+            signature.append((u, v, interface.size, tuple(map(tuple, interface.points))))
+    return signature
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meridians", type=int, default=80)
+    parser.add_argument("--hoops", type=int, default=40)
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    workers = args.workers or sorted(set([1, 2, 4, 8, 16, cpus]) & set(range(1, cpus + 1)))
+
+    dome = Dome(meridians=args.meridians, hoops=args.hoops)
+    params = dict(nmax=20, tmax=1e-1, amin=1e-3)
+
+    assembly = Assembly.from_template(dome)
+    t0 = time.perf_counter()
+    assembly_interfaces_numpy(assembly, **params)
+    serial = time.perf_counter() - t0
+    reference = interfaces_signature(assembly)
+
+    print("Dome(meridians={}, hoops={}): {} blocks".format(args.meridians, args.hoops, assembly.number_of_blocks()))
+    print("{:>8} {:>10} {:>8} {:>10}".format("workers", "time [s]", "speedup", "identical"))
+    print("{:>8} {:>10.3f} {:>8.2f} {:>10}".format("serial", serial, 1.0, "-"))
+
+    for n in workers:
+        assembly = Assembly.from_template(dome)
+        t0 = time.perf_counter()
+        assembly_interfaces_parallel(assembly, workers=n, **params)
+        t = time.perf_counter() - t0
+        identical = interfaces_signature(assembly) == reference
+        print("{:>8} {:>10.3f} {:>8.2f} {:>10}".format(n, t, serial / t, str(identical)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import pytest
+
+import compas
+from compas_assembly.algorithms import assembly_hull
+from compas_assembly.algorithms import assembly_hull_numpy
+from compas_assembly.algorithms import assembly_interfaces
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.algorithms import merge_coplanar_interfaces
+
+ROUNDS = 3
+
+# the convex hull algorithm of compas is pure Python and scales badly with the number of points
+HULL_BLOCKS = 8
+
+
+@pytest.mark.benchmark(group="interfaces")
+def test_assembly_interfaces(benchmark, assembly, params):
+    benchmark.pedantic(assembly_interfaces, args=(assembly,), kwargs=params, rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="interfaces")
+def test_assembly_interfaces_numpy(benchmark, assembly, params):
+    benchmark.pedantic(assembly_interfaces_numpy, args=(assembly,), kwargs=params, rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="interfaces")
+def test_merge_coplanar_interfaces(benchmark, assembly_with_interfaces):
+    def setup():
+        return (assembly_with_interfaces.copy(),), {}
+
+    benchmark.pedantic(merge_coplanar_interfaces, setup=setup, rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="hull")
+def test_assembly_hull(benchmark, assembly):
+    keys = list(assembly.nodes())[:HULL_BLOCKS]
+    benchmark.extra_info["blocks"] = len(keys)
+    benchmark.pedantic(assembly_hull, args=(assembly,), kwargs=dict(keys=keys), rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="hull")
+def test_assembly_hull_numpy(benchmark, assembly):
+    benchmark.pedantic(assembly_hull_numpy, args=(assembly,), rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="serialization")
+def test_json_roundtrip(benchmark, assembly_with_interfaces):
+    benchmark.pedantic(lambda: compas.json_loads(compas.json_dumps(assembly_with_interfaces)), rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="serialization")
+def test_assembly_copy(benchmark, assembly_with_interfaces):
+    benchmark.pedantic(assembly_with_interfaces.copy, rounds=ROUNDS)
@@ -3,20 +3,50 @@ from __future__ import absolute_import
 import compas
 
 from .hull import assembly_hull
+from .profiling import AssemblyProfiler
+from .profiling import assembly_profiler
+from .profiling import active_profiler
 
-__all__ = ["assembly_hull"]
+__all__ = [
+    "assembly_hull",
+    "AssemblyProfiler",
+    "assembly_profiler",
+    "active_profiler",
+]
 
 if not compas.IPY:
+    from .deformation_numpy import assembly_deformation_frames
+    from .deformation_numpy import assembly_deformed
+    from .deformation_numpy import assembly_displacement_matrices
+    from .equilibrium import assembly_equilibrium_matrix
+    from .forces_numpy import assembly_force_lines_numpy
+    from .forces_numpy import assembly_resultants_numpy
     from .hull_numpy import assembly_hull_numpy
     from .interfaces import assembly_interfaces
     from .interfaces import mesh_mesh_interfaces
     from .interfaces import merge_coplanar_interfaces
+    from .interfaces_cache import InterfaceCache
     from .interfaces_numpy import assembly_interfaces_numpy
+    from .interfaces_parallel import assembly_interfaces_parallel
+    from .interfaces_update import assembly_update_interfaces
+    from .moments_numpy import interface_moments_numpy
+    from .moments_numpy import assembly_interface_moments_numpy
 
     __all__ += [
+        "assembly_deformation_frames",
+        "assembly_deformed",
+        "assembly_displacement_matrices",
+        "assembly_equilibrium_matrix",
+        "assembly_force_lines_numpy",
+        "assembly_resultants_numpy",
         "assembly_hull_numpy",
         "assembly_interfaces",
         "mesh_mesh_interfaces",
         "merge_coplanar_interfaces",
+        "InterfaceCache",
         "assembly_interfaces_numpy",
+        "assembly_interfaces_parallel",
+        "assembly_update_interfaces",
+        "interface_moments_numpy",
+        "assembly_interface_moments_numpy",
     ]
@@ -0,0 +1,51 @@
+from numpy import arange
+from numpy import asarray
+from numpy import concatenate
+from numpy import cumsum
+from numpy import float64
+from numpy import int64
+from numpy import repeat
+from numpy import zeros
+
+from compas_assembly.datastructures import BlockView
+
+
+def block_points(assembly, keys):
+    """Stack the vertices of a number of blocks of an assembly in one array.
+
+    Parameters
+    ----------
+    assembly : :class:`compas_assembly.datastructures.Assembly`
+        The assembly data structure.
+    keys : list[int]
+        The identifiers of the nodes of the blocks.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray]
+        The vertices of the blocks, with shape (n, 3),
+        and the offsets of the blocks in the stack, with shape (len(keys) + 1,).
+
+    Notes
+    -----
+    If the blocks are views on the shared buffer of a compact assembly,
+    the coordinates are read from the buffer directly.
+
+    """
+    blocks = [assembly.node_block(key) for key in keys]
+    buffer = assembly.buffer
+    if buffer is not None and all(isinstance(block, BlockView) and block.buffer is buffer for block in blocks):
+        index = asarray([block.index for block in blocks], dtype=int64)
+        starts = buffer.vertex_offsets[index]
+        counts = buffer.vertex_offsets[index + 1] - starts
+    else:
+        arrays = [block.xyz if isinstance(block, BlockView) else asarray(block.vertices_attributes("xyz"), dtype=float64).reshape((-1, 3)) for block in blocks]
+        counts = asarray([len(xyz) for xyz in arrays], dtype=int64)
+        starts = None
+    offsets = zeros(len(blocks) + 1, dtype=int64)
+    offsets[1:] = cumsum(counts)
+    if starts is None:
+        points = concatenate(arrays) if arrays else zeros((0, 3), dtype=float64)
+    else:
+        points = buffer.xyz[repeat(starts - offsets[:-1], counts) + arange(offsets[-1])]
+    return points, offsets
@@ -0,0 +1,211 @@
+from numpy import abs as npabs
+from numpy import array
+from numpy import asarray
+from numpy import cross
+from numpy import einsum
+from numpy import float64
+from numpy import int64
+from numpy import maximum
+from numpy import minimum
+from numpy import ones
+from numpy import stack
+from numpy.linalg import eigh
+
+from compas_assembly.datastructures import BlockView
+
+
+def aabbs_numpy(clouds):
+    """Compute the axis-aligned bounding boxes of a number of point clouds.
+
+    Parameters
+    ----------
+    clouds : list[array_like]
+        The XYZ coordinates of the points of every cloud.
+
+    Returns
+    -------
+    ndarray
+        The min and max corners of the boxes, with shape (n, 2, 3).
+
+    """
+    boxes = []
+    for cloud in clouds:
+        cloud = asarray(cloud, dtype=float64).reshape((-1, 3))
+        boxes.append([cloud.min(axis=0), cloud.max(axis=0)])
+    return array(boxes, dtype=float64).reshape((-1, 2, 3))
+
+
+def blocks_aabbs_numpy(blocks):
+    """Collect the axis-aligned bounding boxes of a number of blocks.
+
+    Parameters
+    ----------
+    blocks : list[:class:`compas_assembly.datastructures.Block` | :class:`compas_assembly.datastructures.BlockView`]
+        The blocks.
+
+    Returns
+    -------
+    ndarray
+        The min and max corners of the boxes, with shape (n, 2, 3).
+
+    Notes
+    -----
+    If all blocks are views on the same buffer, the boxes are computed from the vertex array of the buffer,
+    in one pass over all its blocks.
+    Otherwise, the boxes are the bounds of the blocks, which are cached by the blocks themselves.
+
+    """
+    buffer = blocks[0].buffer if blocks and isinstance(blocks[0], BlockView) else None
+    if buffer is not None and all(isinstance(block, BlockView) and block.buffer is buffer for block in blocks):
+        offsets = buffer.vertex_offsets
+        if (offsets[1:] > offsets[:-1]).all():
+            lower = minimum.reduceat(buffer.xyz, offsets[:-1], axis=0)
+            upper = maximum.reduceat(buffer.xyz, offsets[:-1], axis=0)
+            index = asarray([block.index for block in blocks], dtype=int64)
+            return stack((lower[index], upper[index]), axis=1)
+    return asarray([block.bounds() for block in blocks], dtype=float64).reshape((-1, 2, 3))
+
+
+def obbs_numpy(clouds):
+    """Compute oriented bounding boxes of a number of point clouds.
+
+    Parameters
+    ----------
+    clouds : list[array_like]
+        The XYZ coordinates of the points of every cloud.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray, ndarray]
+        The centers of the boxes, with shape (n, 3).
+        The orthonormal axes of the boxes, with shape (n, 3, 3), one axis per row.
+        The half extents of the boxes along their axes, with shape (n, 3).
+
+    Notes
+    -----
+    The axes of the boxes are the principal directions of the points.
+    The boxes are therefore not necessarily the smallest ones possible,
+    but they are tight for the prismatic blocks of typical assemblies, and they are cheap to compute.
+
+    """
+    centers = []
+    axes = []
+    extents = []
+    for cloud in clouds:
+        cloud = asarray(cloud, dtype=float64).reshape((-1, 3))
+        mean = cloud.mean(axis=0)
+        _, vectors = eigh((cloud - mean).T.dot(cloud - mean))
+        uvw = vectors.T
+        uvw[2] = cross(uvw[0], uvw[1])
+        local = (cloud - mean).dot(uvw.T)
+        lower = local.min(axis=0)
+        upper = local.max(axis=0)
+        centers.append(mean + (0.5 * (lower + upper)).dot(uvw))
+        axes.append(uvw)
+        extents.append(0.5 * (upper - lower))
+    return (
+        array(centers, dtype=float64).reshape((-1, 3)),
+        array(axes, dtype=float64).reshape((-1, 3, 3)),
+        array(extents, dtype=float64).reshape((-1, 3)),
+    )
+
+
+def aabbs_overlap(boxes, pairs, tol=0.0):
+    """Verify which pairs of axis-aligned bounding boxes overlap.
+
+    Parameters
+    ----------
+    boxes : ndarray
+        The min and max corners of the boxes, with shape (n, 2, 3).
+    pairs : ndarray
+        The index pairs of the boxes that should be tested, with shape (m, 2).
+    tol : float, optional
+        The boxes are inflated by this amount before testing.
+
+    Returns
+    -------
+    ndarray
+        A boolean mask per pair, with shape (m,).
+
+    """
+    a = boxes[pairs[:, 0]]
+    b = boxes[pairs[:, 1]]
+    return ((a[:, 0] <= b[:, 1] + tol) & (b[:, 0] <= a[:, 1] + tol)).all(axis=1)
+
+
+def obbs_overlap(obbs, pairs, tol=0.0):
+    """Verify which pairs of oriented bounding boxes overlap using the separating axis theorem.
+
+    Parameters
+    ----------
+    obbs : tuple[ndarray, ndarray, ndarray]
+        The centers, axes, and half extents of the boxes, as returned by :func:`obbs_numpy`.
+    pairs : ndarray
+        The index pairs of the boxes that should be tested, with shape (m, 2).
+    tol : float, optional
+        The boxes are inflated by this amount before testing.
+
+    Returns
+    -------
+    ndarray
+        A boolean mask per pair, with shape (m,).
+
+    """
+    centers, axes, extents = obbs
+    i = pairs[:, 0]
+    j = pairs[:, 1]
+    A = axes[i]
+    B = axes[j]
+    ea = extents[i] + 0.5 * tol
+    eb = extents[j] + 0.5 * tol
+    d = centers[j] - centers[i]
+
+    overlap = ones(len(pairs), dtype=bool)
+
+    # the 3 axes of A, the 3 axes of B, and their 9 cross products
+    candidates = [A[:, k] for k in range(3)] + [B[:, k] for k in range(3)]
+    candidates += [cross(A[:, k], B[:, m]) for k in range(3) for m in range(3)]
+
+    for axis in candidates:
+        # the projections of the half extents of both boxes onto the candidate separating axis
+        ra = (npabs(einsum("nkj,nj->nk", A, axis)) * ea).sum(axis=1)
+        rb = (npabs(einsum("nkj,nj->nk", B, axis)) * eb).sum(axis=1)
+        distance = npabs(einsum("nj,nj->n", d, axis))
+        # parallel axes produce degenerate cross products, for which the test is void
+        overlap &= distance <= ra + rb + 1e-12
+    return overlap
+
+
+def broadphase_pairs(clouds, pairs, tol=0.0, oriented=False, boxes=None):
+    """Remove the pairs of point clouds of which the bounding boxes don't overlap.
+
+    Parameters
+    ----------
+    clouds : list[array_like] | None
+        The XYZ coordinates of the points of every cloud.
+        Only required if ``boxes`` is not provided, or if ``oriented`` is True.
+    pairs : ndarray
+        The index pairs of the clouds, with shape (m, 2).
+    tol : float, optional
+        The boxes are inflated by this amount before testing.
+    oriented : bool, optional
+        If True, the pairs with overlapping axis-aligned bounding boxes
+        are also tested for overlap of their oriented bounding boxes.
+    boxes : ndarray, optional
+        The axis-aligned bounding boxes of the clouds, with shape (n, 2, 3).
+        If not provided, the boxes are computed from the points with :func:`aabbs_numpy`.
+
+    Returns
+    -------
+    ndarray
+        The remaining pairs.
+
+    """
+    if not len(pairs):
+        return pairs
+    if boxes is None:
+        boxes = aabbs_numpy(clouds)
+    pairs = pairs[aabbs_overlap(boxes, pairs, tol=tol)]
+    if oriented and len(pairs):
+        pairs = pairs[obbs_overlap(obbs_numpy(clouds), pairs, tol=tol)]
+    return pairs
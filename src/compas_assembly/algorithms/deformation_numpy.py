@@ -0,0 +1,152 @@
+from numpy import add
+from numpy import arange
+from numpy import asarray
+from numpy import cos
+from numpy import cross
+from numpy import einsum
+from numpy import eye
+from numpy import float64
+from numpy import maximum
+from numpy import sin
+from numpy import zeros
+from numpy.linalg import norm
+
+from compas_assembly.algorithms._arrays import block_points
+from compas_assembly.datastructures import Assembly
+
+
+def assembly_displacement_matrices(assembly: Assembly, scale=1.0):
+    """Convert the displacements of all blocks of an assembly to transformation matrices.
+
+    Parameters
+    ----------
+    assembly : :class:`compas_assembly.datastructures.Assembly`
+        An assembly with block displacements.
+    scale : float, optional
+        The scale factor of the displacements.
+
+    Returns
+    -------
+    ndarray
+        The transformation matrices of the blocks, with shape (n, 4, 4), in the order of
+        :meth:`compas_assembly.datastructures.Assembly.nodes`.
+
+    Notes
+    -----
+    The ``displacement`` of a block consists of a translation ``[ux, uy, uz]`` of its centroid,
+    and a rotation vector ``[rx, ry, rz]`` about its centroid, of which the length is the angle of rotation in radians.
+    Both are multiplied by the scale factor.
+
+    The matrices can be applied to the assembly in place with :meth:`compas_assembly.datastructures.Assembly.transform`.
+
+    """
+    nodes = list(assembly.nodes())
+    points, offsets = block_points(assembly, nodes)
+    centroids, translations, axes, angles = _block_displacements(assembly, nodes, points, offsets)
+
+    angles = angles * scale
+    K = zeros((len(nodes), 3, 3), dtype=float64)
+    K[:, 0, 1], K[:, 0, 2], K[:, 1, 2] = -axes[:, 2], axes[:, 1], -axes[:, 0]
+    K -= K.transpose((0, 2, 1))
+    R = eye(3) + sin(angles)[:, None, None] * K + (1 - cos(angles))[:, None, None] * (K @ K)
+
+    M = zeros((len(nodes), 4, 4), dtype=float64)
+    M[:, :3, :3] = R
+    M[:, :3, 3] = centroids + scale * translations - einsum("nij,nj->ni", R, centroids)
+    M[:, 3, 3] = 1.0
+    return M
+
+
+def assembly_deformed(assembly: Assembly, scale=1.0):
+    """Compute the vertex coordinates of all blocks of an assembly after applying their displacements.
+
+    Parameters
+    ----------
+    assembly : :class:`compas_assembly.datastructures.Assembly`
+        An assembly with block displacements.
+    scale : float, optional
+        The scale factor of the displacements.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray]
+        The deformed vertex coordinates of all blocks, stacked in the order of
+        :meth:`compas_assembly.datastructures.Assembly.nodes`, with shape (V, 3).
+        The index of the first vertex of every block, with shape (n + 1,).
+
+    Notes
+    -----
+    The assembly is not modified.
+    The displacements are interpreted as in :func:`assembly_displacement_matrices`.
+
+    See Also
+    --------
+    :func:`assembly_deformation_frames`
+
+    """
+    nodes = list(assembly.nodes())
+    points, offsets = block_points(assembly, nodes)
+    return next(_deformed(assembly, nodes, points, offsets, [scale])), offsets
+
+
+def assembly_deformation_frames(assembly: Assembly, scales):
+    """Generate the deformed vertex coordinates of all blocks of an assembly for a sequence of scale factors.
+
+    Parameters
+    ----------
+    assembly : :class:`compas_assembly.datastructures.Assembly`
+        An assembly with block displacements.
+    scales : iterable[float]
+        The scale factors of the displacements, for example one per frame of an animation.
+
+    Yields
+    ------
+    ndarray
+        The deformed vertex coordinates of all blocks, with shape (V, 3),
+        in the layout of :func:`assembly_deformed`.
+
+    Notes
+    -----
+    The assembly is not copied nor modified.
+    Its vertex coordinates, centroids, and displacements are collected once,
+    after which every frame requires only a few operations on the stacked coordinates.
+
+    Examples
+    --------
+    >>> from math import sin, pi
+    >>> scales = [sin(2 * pi * i / 60) for i in range(60)]
+    >>> for points in assembly_deformation_frames(assembly, scales):
+    ...     pass
+
+    """
+    nodes = list(assembly.nodes())
+    points, offsets = block_points(assembly, nodes)
+    return _deformed(assembly, nodes, points, offsets, scales)
+
+
+def _block_displacements(assembly, nodes, points, offsets):
+    # the centroids, translations, rotation axes, and rotation angles of the blocks
+    counts = offsets[1:] - offsets[:-1]
+    centroids = zeros((len(nodes), 3), dtype=float64)
+    nonempty = counts > 0
+    centroids[nonempty] = add.reduceat(points, offsets[:-1][nonempty], axis=0) / counts[nonempty, None]
+
+    displacements = asarray(assembly.graph.nodes_attribute("displacement", keys=nodes), dtype=float64).reshape((-1, 6))
+    rotations = displacements[:, 3:]
+    angles = norm(rotations, axis=1)
+    axes = rotations / maximum(angles, 1e-300)[:, None]
+    return centroids, displacements[:, :3], axes, angles
+
+
+def _deformed(assembly, nodes, points, offsets, scales):
+    # rotate the vertices about the centroids with the formula of Rodrigues, and translate them
+    centroids, translations, axes, angles = _block_displacements(assembly, nodes, points, offsets)
+    owners = arange(len(nodes)).repeat(offsets[1:] - offsets[:-1])
+    local = points - centroids[owners]
+    k = axes[owners]
+    kxp = cross(k, local)
+    kdp = k * einsum("pi,pi->p", k, local)[:, None]
+    for scale in scales:
+        c = cos(angles * scale)[owners, None]
+        s = sin(angles * scale)[owners, None]
+        yield local * c + kxp * s + kdp * (1 - c) + (centroids + scale * translations)[owners]
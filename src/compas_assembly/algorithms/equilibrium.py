@@ -0,0 +1,105 @@
+from numpy import arange
+from numpy import array
+from numpy import asarray
+from numpy import bool_
+from numpy import concatenate
+from numpy import cross
+from numpy import float64
+from numpy import full
+from numpy import int64
+from scipy.sparse import coo_matrix
+from scipy.sparse import csr_matrix
+from scipy.sparse import eye
+from scipy.sparse import kron
+
+from compas_assembly.datastructures import Assembly
+
+
+def assembly_equilibrium_matrix(assembly: Assembly, mu=0.84, fmt="csr"):
+    """Construct the sparse equilibrium and friction cone matrices of an assembly from its interfaces.
+
+    Parameters
+    ----------
+    assembly : :class:`compas_assembly.datastructures.Assembly`
+        An assembly with identified interfaces.
+    mu : float, optional
+        The friction coefficient of the linearised friction cones.
+    fmt : Literal["csr", "coo"], optional
+        The sparse format of the matrices.
+
+    Returns
+    -------
+    tuple[scipy.sparse.spmatrix, scipy.sparse.spmatrix, ndarray]
+        The equilibrium matrix, with shape (6 * m, 3 * P),
+        with ``m`` the number of free blocks and ``P`` the total number of interface corner points.
+        The friction cone matrix, with shape (4 * P, 3 * P).
+        The indices of the free blocks in the order of :meth:`compas_assembly.datastructures.Assembly.nodes`,
+        with shape (m,).
+
+    Raises
+    ------
+    ValueError
+        If the format is not supported.
+
+    Notes
+    -----
+    Every interface corner point has three force components, expressed in the frame of its interface:
+    a normal component, positive in compression, and two tangential components along the x and y axis of the frame.
+    The columns of the matrices are ordered per corner point, in the order of
+    :meth:`compas_assembly.datastructures.Assembly.interface_arrays`, as ``[n, u, v]``.
+
+    The rows of the equilibrium matrix are ordered per free block, as the three force components in global coordinates,
+    followed by the three moment components about the centroid of the block.
+    The forces act in the direction of the frame axes on the "to" block of an interface edge,
+    and in the opposite direction on the "from" block.
+    Blocks that are marked as supports (``is_support``) have no equilibrium rows.
+
+    The friction cone matrix ``F`` describes the linearised (pyramidal) friction cones as ``F @ x <= 0``,
+    with four rows per corner point: ``u - mu * n <= 0``, ``-u - mu * n <= 0``, ``v - mu * n <= 0``, and ``-v - mu * n <= 0``.
+
+    """
+    if fmt not in ("csr", "coo"):
+        raise ValueError("Sparse format not supported: {}".format(fmt))
+
+    arrays = assembly.interface_arrays()
+    nodes = arrays.nodes
+    n = len(nodes)
+    p = len(arrays.points)
+
+    is_support = asarray([bool(assembly.graph.node_attribute(node, "is_support")) for node in nodes], dtype=bool_).reshape(-1)
+    free = arange(n)[~is_support]
+    row = full(n, -1, dtype=int64)
+    row[free] = arange(len(free))
+
+    owners = arrays.owners
+    # the frame axes of every corner point, ordered as the columns n, u, v
+    axes = arrays.uvw[owners][:, [2, 0, 1]]
+    centroids = asarray([assembly.node_block(node).centroid() for node in nodes], dtype=float64).reshape((-1, 3))
+
+    rows = []
+    cols = []
+    data = []
+    for blocks, sign in ((arrays.edges[owners, 1], 1.0), (arrays.edges[owners, 0], -1.0)):
+        select = row[blocks] >= 0
+        if not select.any():
+            continue
+        points = arrays.points[select]
+        a = axes[select]
+        r = points - centroids[blocks[select]]
+        m = cross(r[:, None, :], a)
+        # the entries of a corner point form a (6, 3) block, with the forces in the first three rows
+        values = sign * array([a.transpose((0, 2, 1)), m.transpose((0, 2, 1))]).transpose((1, 0, 2, 3)).reshape((-1, 6, 3))
+        base = 6 * row[blocks[select]]
+        rows.append((base[:, None, None] + arange(6)[None, :, None]).repeat(3, axis=2).ravel())
+        cols.append((3 * arange(p)[select][:, None, None] + arange(3)[None, None, :]).repeat(6, axis=1).ravel())
+        data.append(values.ravel())
+
+    if rows:
+        A = coo_matrix((concatenate(data), (concatenate(rows), concatenate(cols))), shape=(6 * len(free), 3 * p))
+    else:
+        A = coo_matrix((6 * len(free), 3 * p), dtype=float64)
+
+    cone = array([[-mu, 1.0, 0.0], [-mu, -1.0, 0.0], [-mu, 0.0, 1.0], [-mu, 0.0, -1.0]])
+    F = kron(eye(p, format="csr"), csr_matrix(cone), format=fmt)
+
+    return A.asformat(fmt), F, free
@@ -0,0 +1,123 @@
+from numpy import add
+from numpy import arange
+from numpy import array
+from numpy import bool_
+from numpy import full
+from numpy import isnan
+from numpy import nan
+from numpy import stack
+from numpy import zeros
+
+from compas_assembly.datastructures import Assembly
+
+
+def assembly_resultants_numpy(assembly: Assembly):
+    """Compute the resultant contact force of every interface of an assembly.
+
+    Parameters
+    ----------
+    assembly : :class:`compas_assembly.datastructures.Assembly`
+        An assembly with interface forces.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray]
+        The points of application of the resultants, with shape (K, 3).
+        The resultant force vectors, in global coordinates, with shape (K, 3).
+        Interfaces without resultant normal force have NaN as point of application.
+
+    Notes
+    -----
+    The results are the same as :attr:`compas_assembly.datastructures.Interface.resultantpoint`
+    and :attr:`compas_assembly.datastructures.Interface.resultantforce`,
+    of which the line runs from ``point + 0.5 * vector`` to ``point - 0.5 * vector``.
+
+    """
+    arrays = assembly.interface_arrays()
+    forces = assembly.interface_forces()
+    owners = arrays.owners
+    k = len(arrays)
+
+    normal = forces[:, 0] - forces[:, 1]
+    sums = zeros((k, 3))
+    add.at(sums, owners, stack((normal, forces[:, 2], forces[:, 3]), axis=1))
+    moments = zeros((k, 3))
+    add.at(moments, owners, arrays.points * normal[:, None])
+
+    points = full((k, 3), nan)
+    select = sums[:, 0] != 0
+    points[select] = moments[select] / sums[select, 0][:, None]
+
+    uvw = arrays.uvw
+    vectors = uvw[:, 2] * sums[:, 0, None] + uvw[:, 0] * sums[:, 1, None] + uvw[:, 1] * sums[:, 2, None]
+    return points, vectors
+
+
+def assembly_force_lines_numpy(assembly: Assembly, kind="normal"):
+    """Compute the lines representing the contact forces of all interfaces of an assembly.
+
+    Parameters
+    ----------
+    assembly : :class:`compas_assembly.datastructures.Assembly`
+        An assembly with interface forces.
+    kind : Literal["normal", "compression", "tension", "friction", "resultant"], optional
+        The force components represented by the lines.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray]
+        The start and end points of the lines, with shape (Q, 2, 3).
+        The index of the interface of every line, with shape (Q,).
+
+    Raises
+    ------
+    ValueError
+        If the kind of force is not supported.
+
+    Notes
+    -----
+    The lines are the same as the ones of
+    :attr:`compas_assembly.datastructures.Interface.normalforces`,
+    :attr:`compas_assembly.datastructures.Interface.compressionforces`,
+    :attr:`compas_assembly.datastructures.Interface.tensionforces`,
+    :attr:`compas_assembly.datastructures.Interface.frictionforces`,
+    and :attr:`compas_assembly.datastructures.Interface.resultantforce`,
+    for all interfaces at once.
+    Interfaces without forces have no lines,
+    and interfaces without resultant normal force have no resultant line.
+
+    """
+    if kind == "resultant":
+        points, vectors = assembly_resultants_numpy(assembly)
+        index = arange(len(points))
+        select = ~isnan(points).any(axis=1)
+        points = points[select]
+        vectors = 0.5 * vectors[select]
+        return stack((points + vectors, points - vectors), axis=1), index[select]
+
+    if kind not in ("normal", "compression", "tension", "friction"):
+        raise ValueError("Kind of force not supported: {}".format(kind))
+
+    arrays = assembly.interface_arrays()
+    forces = assembly.interface_forces()
+    owners = arrays.owners
+    points = arrays.points
+    uvw = arrays.uvw[owners]
+
+    # interfaces without forces have no lines
+    has_forces = array([interface.force_view is not None or bool(interface.forces) for interface in assembly.interfaces()], dtype=bool_)
+    select = has_forces[owners]
+
+    if kind == "friction":
+        vectors = (uvw[:, 0] * forces[:, 2, None] + uvw[:, 1] * forces[:, 3, None]) * 0.5
+    else:
+        normal = forces[:, 0] - forces[:, 1]
+        vectors = uvw[:, 2] * normal[:, None] * 0.5
+        if kind == "compression":
+            select &= normal > 0
+        elif kind == "tension":
+            select &= normal < 0
+
+    points = points[select]
+    vectors = vectors[select]
+    return stack((points + vectors, points - vectors), axis=1), owners[select]
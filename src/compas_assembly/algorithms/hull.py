@@ -35,7 +35,7 @@ def assembly_hull(assembly, keys=None, unify=True):
 
     points = []
     for key in keys:
-        block = assembly.blocks[key]
+        block = assembly.node_block(key)
         points.extend(block.vertices_attributes("xyz"))
 
     faces = convex_hull(points)
@@ -47,6 +47,6 @@ def assembly_hull(assembly, keys=None, unify=True):
     faces = [[i_index[i] for i in face] for face in faces]
 
     if unify:
-        faces = unify_cycles(vertices, faces)
+        unify_cycles(vertices, faces)
 
     return vertices, faces
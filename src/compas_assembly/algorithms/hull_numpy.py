@@ -1,5 +1,19 @@
-from compas.geometry import convex_hull_numpy
-from compas.topology import unify_cycles
+from itertools import product
+
+from numpy import argmax
+from numpy import asarray
+from numpy import cross
+from numpy import einsum
+from numpy import float64
+from numpy import maximum
+from numpy import minimum
+from numpy import repeat
+from numpy import unique
+from numpy.linalg import norm
+from scipy.spatial import ConvexHull
+from scipy.spatial import QhullError
+
+from compas_assembly.algorithms._arrays import block_points
 
 
 def assembly_hull_numpy(assembly, keys=None, unify=True):
@@ -13,37 +27,83 @@ def assembly_hull_numpy(assembly, keys=None, unify=True):
         The identifiers of the blocks to include in the hull calculation.
         Defaults to all blocks.
     unify : bool, optional
-        Unify the face cycles of the hull.
+        Orient the faces of the hull consistently, with their normals pointing outwards.
         Default is ``True``.
 
     Returns
     -------
     tuple
         The vertices and faces of the hull.
+        The faces are triangles.
 
     Warnings
     --------
     This function requires Numpy and cannot be used directly inside Rhino.
 
+    Notes
+    -----
+    The vertices of the blocks are collected in one array.
+    If the blocks are views on the shared buffer of a compact assembly, the coordinates are read from the buffer directly,
+    also if only a subset of the blocks is included through ``keys``.
+
+    Before the hull is computed, all blocks of which the bounding box lies inside the hull of a small number of extreme points,
+    and all remaining points inside that hull, are discarded.
+    The faces are oriented with the outward normals computed by Qhull, instead of by unifying the cycles of the hull mesh.
+
     Examples
     --------
-    >>>
+    >>> from compas.geometry import Box
+    >>> from compas.geometry import Frame
+    >>> from compas_assembly.datastructures import Assembly
+    >>> from compas_assembly.datastructures import Block
+    >>> assembly = Assembly()
+    >>> for i in range(3):
+    ...     _ = assembly.add_block(Block.from_shape(Box(1.0, frame=Frame([i, 0, 0], [1, 0, 0], [0, 1, 0]))))
+    >>> vertices, faces = assembly_hull_numpy(assembly)
+    >>> len(vertices), len(faces)
+    (8, 12)
+
     """
     keys = keys or list(assembly.nodes())
 
-    points = []
-    for key in keys:
-        block = assembly.blocks[key]
-        points.extend(block.vertices_attributes("xyz"))
+    points, offsets = block_points(assembly, keys)
+    points = _discard_interior(points, offsets)
+    hull = ConvexHull(points)
 
-    vertices, faces = convex_hull_numpy(points)
+    faces = hull.simplices
+    if unify:
+        a = points[faces[:, 0]]
+        normals = cross(points[faces[:, 1]] - a, points[faces[:, 2]] - a)
+        flip = einsum("ij,ij->i", normals, hull.equations[:, :3]) < 0
+        faces[flip] = faces[flip][:, ::-1]
 
-    i_index = {i: index for index, i in enumerate(vertices)}
+    indices, faces = unique(faces, return_inverse=True)
+    vertices = points[indices]
+    return vertices.tolist(), faces.reshape((-1, 3)).tolist()
 
-    vertices = [points[index] for index in vertices]
-    faces = [[i_index[i] for i in face] for face in faces]
 
-    if unify:
-        faces = unify_cycles(vertices, faces)
+def _discard_interior(points, offsets, tol=1e-9):
+    # the extreme points in the directions of the faces, edges and corners of a cube span a polytope inside the hull
+    directions = asarray([d for d in product((-1.0, 0.0, 1.0), repeat=3) if any(d)], dtype=float64)
+    extremes = unique(argmax(directions @ points.T, axis=1))
+    try:
+        inner = ConvexHull(points[extremes])
+    except QhullError:
+        return points
+
+    normals = inner.equations[:, :3]
+    # a facet equation is negative on the inside of the polytope
+    d = inner.equations[:, 3] + tol * max(1.0, float(norm(points[extremes], axis=1).max()))
+
+    # blocks of which all corners of the bounding box are strictly inside
+    counts = offsets[1:] - offsets[:-1]
+    nonempty = counts > 0
+    starts = offsets[:-1][nonempty]
+    lo = minimum.reduceat(points, starts, axis=0)
+    hi = maximum.reduceat(points, starts, axis=0)
+    reach = 0.5 * (lo + hi) @ normals.T + 0.5 * (hi - lo) @ abs(normals).T + d
+    inside = (reach < 0).all(axis=1)
+    points = points[repeat(~inside, counts[nonempty])]
 
-    return vertices, faces
+    # points strictly inside
+    return points[((points @ normals.T + d) >= 0).any(axis=1)]
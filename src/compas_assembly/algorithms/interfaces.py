@@ -1,23 +1,46 @@
 from math import fabs
+from timeit import default_timer as timer
 from typing import List
 
+from numpy import abs as npabs
+from numpy import add
+from numpy import arange
+from numpy import argsort
+from numpy import asarray
+from numpy import bincount
+from numpy import concatenate
+from numpy import cross
+from numpy import cumsum
+from numpy import float64
+from numpy import int64
+from numpy import logical_and
+from numpy import maximum
+from numpy import minimum
+from numpy import ones
+from numpy import repeat
+from numpy import roll
+from numpy import zeros
+from numpy.linalg import norm
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
 from shapely.geometry import Polygon as ShapelyPolygon
 
 from compas.datastructures import Mesh
 from compas.geometry import Frame
-from compas.geometry import Plane
-from compas.geometry import Polygon
 from compas.geometry import Transformation
 from compas.geometry import centroid_polygon
-from compas.geometry import is_colinear
-from compas.geometry import is_coplanar
 from compas.geometry import transform_points
-from compas.itertools import window
-from compas_assembly.algorithms.nnbrs import find_nearest_neighbours
+from compas_assembly.algorithms.interfaces_cache import InterfaceCache
+from compas_assembly.algorithms.nnbrs import find_block_pairs
+from compas_assembly.algorithms.profiling import active_profiler
 from compas_assembly.datastructures import Assembly
 from compas_assembly.datastructures import Block
 from compas_assembly.datastructures import Interface
 
+# the name of the contact kernel in the keys of the interface cache
+CACHE_METHOD = "python:2"
+
 
 def assembly_interfaces(
     assembly: Assembly,
@@ -25,6 +48,9 @@ def assembly_interfaces(
     tmax: float = 1e-6,
     amin: float = 1e-1,
     nnbrs_dims: int = 3,
+    nnbrs_mode: str = "knn",
+    obb: bool = False,
+    cache: InterfaceCache = None,
 ):
     """Identify the interfaces between the blocks of an assembly.
 
@@ -34,51 +60,110 @@ def assembly_interfaces(
         An assembly of discrete blocks.
     nmax : int, optional
         Maximum number of neighbours per block.
+        Only used if ``nnbrs_mode`` is ``"knn"``.
     tmax : float, optional
         Maximum deviation from the perfectly flat interface plane.
     amin : float, optional
         Minimum area of a "face-face" interface.
+    nnbrs_dims : int, optional
+        The number of coordinate dimensions used for the neighbour search.
+    nnbrs_mode : Literal["knn", "radius", "index"], optional
+        The neighbour search mode.
+        With ``"knn"``, the ``nmax`` nearest blocks of every block are considered.
+        With ``"radius"``, all blocks with overlapping bounding spheres are considered.
+        With ``"index"``, all blocks with overlapping bounding boxes in the spatial index of the assembly are considered.
+    obb : bool, optional
+        If True, candidate pairs are also rejected if their oriented bounding boxes don't overlap.
+        Axis-aligned bounding boxes are always tested.
+    cache : :class:`compas_assembly.algorithms.InterfaceCache`, optional
+        A persistent cache of the interfaces of block pairs.
+        The interfaces of pairs found in the cache are not recomputed,
+        and the interfaces of all other pairs are added to the cache.
 
     Returns
     -------
     :class:`Assembly`
 
+    Notes
+    -----
+    The stages of the algorithm are timed, and the candidate pairs and rejected face pairs are counted,
+    if the function is called in the context of :func:`compas_assembly.algorithms.assembly_profiler`.
+    Pairs served from the cache are counted as ``"cached pairs"``.
+
     """
-    node_index = {node: index for index, node in enumerate(assembly.nodes())}
-    index_node = {index: node for index, node in enumerate(assembly.nodes())}
+    profiler = active_profiler()
 
     blocks: List[Block] = list(assembly.blocks())
 
-    nmax = min(nmax, len(blocks))
-
-    block_cloud = [block.centroid() for block in blocks]
-    block_nnbrs = find_nearest_neighbours(block_cloud, nmax, dims=nnbrs_dims)
-
-    assembly.graph.edge = {node: {} for node in assembly.graph.nodes()}
-
-    for node in assembly.graph.nodes():
-        i = node_index[node]
-
+    if profiler:
+        t0 = timer()
+
+    block_pairs = find_block_pairs(
+        blocks,
+        nmax=nmax,
+        tmax=tmax,
+        dims=nnbrs_dims,
+        mode=nnbrs_mode,
+        obb=obb,
+        index=assembly.spatial_index if nnbrs_mode == "index" else None,
+        keys=list(assembly.nodes()),
+    )
+
+    if profiler:
+        nodes = list(assembly.nodes())
+        profiler.add_time("neighbours", timer() - t0)
+        profiler.count("blocks", len(blocks))
+        profiler.count("candidate pairs", len(block_pairs))
+
+    assembly.clear_interfaces()
+
+    block_pairs = block_pairs.tolist()
+    cached = {}
+    served = {}
+    computed = []
+    if cache is not None:
+        from compas_assembly.algorithms.interfaces_numpy import mesh_face_arrays
+
+        keys = cache.pair_keys(block_pairs, lambda index: mesh_face_arrays(blocks[index]), CACHE_METHOD, tmax, amin)
+        cached = cache.get_many(keys)
+
+        if profiler:
+            profiler.count("cached pairs", len(cached))
+
+    for n, (i, j) in enumerate(block_pairs):
         block = blocks[i]
-        nbrs = block_nnbrs[i][1]
-
-        for j in nbrs:
-            n = index_node[j]
-
-            if n == node:
-                # a block has no interfaces with itself
-                continue
+        nbr = blocks[j]
+
+        if profiler:
+            t0 = timer()
+
+        interfaces = None
+        if cache is not None:
+            if keys[n] in served:
+                # a pair with the same geometry as an earlier pair
+                interfaces = [interface.copy() for interface in served[keys[n]]]
+            elif keys[n] in cached:
+                interfaces = served[keys[n]] = cached.pop(keys[n])
+        if interfaces is None:
+            interfaces = mesh_mesh_interfaces(block, nbr, tmax, amin)
+            if cache is not None:
+                served[keys[n]] = interfaces
+                computed.append((keys[n], interfaces))
 
-            if assembly.graph.has_edge((n, node), directed=False):
-                # the interfaces between these two blocks have already been identified
-                continue
+        if profiler:
+            t1 = timer()
+            profiler.add_pair(nodes[i], nodes[j], t1 - t0)
 
-            nbr = blocks[j]
+        if interfaces:
+            assembly.add_block_block_interfaces(block, nbr, interfaces)
 
-            interfaces = mesh_mesh_interfaces(block, nbr, tmax, amin)
+            if profiler:
+                profiler.add_time("insertion", timer() - t1)
+                profiler.count("pairs with interfaces")
+                profiler.count("interfaces", len(interfaces))
 
-            if interfaces:
-                assembly.add_block_block_interfaces(block, nbr, interfaces)
+    if cache is not None:
+        cache.put_many(computed)
 
     return assembly
 
@@ -104,13 +189,50 @@ def mesh_mesh_interfaces(
     -------
     List[:class:`Interface`]
 
+    Notes
+    -----
+    The faces of ``b`` are tested against the planes of the faces of ``a``.
+    If no interfaces are found, the faces of ``a`` are tested against the planes of the faces of ``b``,
+    and the interfaces that are found are reversed, such that their frames point from ``a`` to ``b``.
+    The same pairs of meshes therefore have interfaces in both orientations,
+    also if the faces of one of them are not perfectly planar.
+
     """
+    interfaces = _oriented_interfaces(a, b, tmax, amin)
+    if interfaces:
+        return interfaces
+    return [_reversed_interface(interface) for interface in _oriented_interfaces(b, a, tmax, amin)]
+
+
+def _reversed_interface(interface):
+    # the same interface, with the frame pointing in the opposite direction
+    frame = interface.frame
+    return Interface(size=interface.size, points=interface.points[::-1], frame=Frame(frame.point, frame.xaxis, frame.yaxis.scaled(-1)))
+
+
+def _oriented_interfaces(a, b, tmax, amin):
+    # the interfaces of the faces of b with the faces of a, in the frames of the faces of a
+    profiler = active_profiler()
+
+    if profiler:
+        t0 = timer()
+
     world = Frame.worldXY()
     interfaces = []
     frames = a.frames()
 
+    b_points = {test: b.face_coordinates(test) for test in b.faces()}
+    b_boxes = {test: _bounding_box(points) for test, points in b_points.items()}
+
+    if profiler:
+        profiler.add_time("frames", timer() - t0)
+
     for face in a.faces():
+        if profiler:
+            t0 = timer()
+
         points = a.face_coordinates(face)
+        box = _bounding_box(points)
         # result = bestfit_frame_numpy(points)
         frame = frames[face]
         matrix = Transformation.from_change_of_basis(world, frame)
@@ -118,23 +240,50 @@ def mesh_mesh_interfaces(
         p0 = ShapelyPolygon(projected)
 
         for test in b.faces():
-            points = b.face_coordinates(test)
+            if profiler:
+                profiler.count("face pairs")
+
+            if not _bounding_boxes_overlap(box, b_boxes[test], tmax):
+                if profiler:
+                    profiler.reject("bbox")
+                continue
+
+            points = b_points[test]
             projected = transform_points(points, matrix)
-            p1 = ShapelyPolygon(projected)
 
             if not all(fabs(point[2]) < tmax for point in projected):
+                if profiler:
+                    profiler.reject("tmax")
                 continue
 
+            p1 = ShapelyPolygon(projected)
+
             if p1.area < amin:
+                if profiler:
+                    profiler.reject("amin")
                 continue
 
+            if profiler:
+                t1 = timer()
+                profiler.add_time("projection", t1 - t0)
+
             if not p0.intersects(p1):
+                if profiler:
+                    profiler.reject("no intersection")
+                    t0 = timer()
+                    profiler.add_time("intersection", t0 - t1)
                 continue
 
             intersection = p0.intersection(p1)
             area = intersection.area
 
+            if profiler:
+                t0 = timer()
+                profiler.add_time("intersection", t0 - t1)
+
             if area < amin:
+                if profiler:
+                    profiler.reject("amin")
                 continue
 
             coords = [[x, y, 0.0] for x, y, _ in intersection.exterior.coords]
@@ -152,9 +301,21 @@ def mesh_mesh_interfaces(
 
             interfaces.append(interface)
 
+        if profiler:
+            profiler.add_time("projection", timer() - t0)
+
     return interfaces
 
 
+def _bounding_box(points):
+    xs, ys, zs = zip(*points)
+    return (min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs))
+
+
+def _bounding_boxes_overlap(a, b, tol):
+    return all(a[0][i] <= b[1][i] + tol and b[0][i] <= a[1][i] + tol for i in range(3))
+
+
 def merge_coplanar_interfaces(assembly, tol=1e-6):
     """Merge connected coplanar interfaces between pairs of blocks.
 
@@ -169,68 +330,200 @@ def merge_coplanar_interfaces(assembly, tol=1e-6):
     -------
     None
 
+    Notes
+    -----
+    Pairs of blocks with a single interface are skipped.
+    The interfaces of all other pairs are processed together:
+    their colinear corners are removed, their corners are welded within the tolerance,
+    and their planes are computed, with a few array operations.
+
+    Every interface that is not yet part of a group starts a new group,
+    and the adjacent interfaces of the group of which all corners lie in the plane of its first interface,
+    within the tolerance, are added to it.
+    Every group is replaced by the boundary of the union of its interfaces,
+    with a frame of which the Z axis points in the same direction as the Z axis of the frame of the first interface of the group.
+    Groups of which the union is not bounded by a single cycle of edges, for example because it has a hole, are not merged.
+
     """
+    edges = []
+    polygons = []
+    zaxes = []
     for edge in assembly.edges():
         interfaces: List[Interface] = assembly.graph.edge_attribute(edge, "interfaces")
-
-        if interfaces:
-            polygons = []
-            for interface in interfaces:
-                points = []
-                for a, b, c in window(interface.points + interface.points[:2], 3):
-                    if not is_colinear(a, b, c):
-                        points.append(b)
-
-                polygons.append(Polygon(points))
-
-            temp = Mesh.from_polygons(polygons)
-            try:
-                temp.unify_cycles()
-            except Exception:
+        if interfaces and len(interfaces) > 1:
+            edges.append(edge)
+            polygons.append([interface.points for interface in interfaces])
+            zaxes += [interface.frame.zaxis for interface in interfaces]
+
+    if edges:
+        for edge, groups in zip(edges, _merge_coplanar_polygons(polygons, zaxes, tol)):
+            if groups is None:
                 continue
 
-            reconstruct = False
-
-            while True:
-                if temp.number_of_faces() < 2:
-                    break
-
-                has_merged = False
-
-                for face in temp.faces():
-                    nbrs = temp.face_neighbors(face)
-                    points = temp.face_coordinates(face)
-                    vertices = temp.face_vertices(face)
-
-                    for nbr in nbrs:
-                        for vertex in temp.face_vertices(nbr):
-                            if vertex not in vertices:
-                                points.append(temp.vertex_coordinates(vertex))
-
-                        if is_coplanar(points, tol=tol):
-                            temp.merge_faces([face, nbr])
-                            has_merged = True
-                            reconstruct = True
-                            break
-
-                    if has_merged:
-                        break
-
-                if not has_merged:
-                    break
-
-            if reconstruct:
-                interfaces = []
-                for face in temp.faces():
-                    points = temp.face_coordinates(face)
-                    area = temp.face_area(face)
-                    frame = Frame.from_plane(Plane(temp.face_centroid(face), temp.face_normal(face)))
-                    interface = Interface(
-                        size=area,
-                        points=points,
-                        frame=frame,
-                        mesh=Mesh.from_polygons([points]),
-                    )
-                    interfaces.append(interface)
-
-                assembly.graph.edge_attribute(edge, "interfaces", interfaces)
+            interfaces = assembly.graph.edge_attribute(edge, "interfaces")
+            merged = []
+            for group in groups:
+                if isinstance(group, int):
+                    merged.append(interfaces[group])
+                else:
+                    merged.append(_polygon_interface(*group))
+            assembly.graph.edge_attribute(edge, "interfaces", merged)
+
+    assembly.invalidate_cache()
+
+
+def _merge_coplanar_polygons(polygons, zaxes, tol):
+    # polygons is a list with the corner points of the interfaces of every pair of blocks
+    # zaxes are the normals of the frames of all interfaces, in the same order
+    # per pair, the result is None if there is nothing to merge,
+    # or a list with the index of every interface that is kept as is,
+    # and the boundary points and the normal of every merged group
+    # the normal of a merged group points in the direction of the frame of its first interface
+    counts = [len(points) for items in polygons for points in items]
+    npolygons = len(counts)
+    pair = repeat(arange(len(polygons)), [len(items) for items in polygons])
+    owner = repeat(arange(npolygons), counts)
+    xyz = asarray([point for items in polygons for points in items for point in points], dtype=float64).reshape((-1, 3))
+    zaxes = asarray(zaxes, dtype=float64).reshape((-1, 3))
+
+    # remove the corners that lie on the line through their neighbours
+    offsets = concatenate(([0], cumsum(counts)))
+    after = arange(len(xyz)) + 1
+    after[offsets[1:] - 1] = offsets[:-1]
+    before = arange(len(xyz)) - 1
+    before[offsets[:-1]] = offsets[1:] - 1
+    a = xyz[after] - xyz[before]
+    distance = norm(cross(a, xyz - xyz[before]), axis=1) / maximum(norm(a, axis=1), 1e-300)
+    keep = distance > tol
+    xyz = xyz[keep]
+    owner = owner[keep]
+    counts = bincount(owner, minlength=npolygons)
+    offsets = concatenate(([0], cumsum(counts)))
+    after = arange(len(xyz)) + 1
+    after[offsets[1:] - 1] = offsets[:-1]
+    valid = counts > 2
+
+    # weld the corners of the interfaces of the same pair
+    close = cKDTree(xyz).query_pairs(tol, output_type="ndarray")
+    close = close[pair[owner[close[:, 0]]] == pair[owner[close[:, 1]]]]
+    graph = coo_matrix((ones(len(close)), (close[:, 0], close[:, 1])), shape=(len(xyz), len(xyz)))
+    _, labels = connected_components(graph, directed=False)
+
+    # the planes of the interfaces
+    newell = cross(xyz, xyz[after])
+    normals = zeros((npolygons, 3), dtype=float64)
+    normals[valid] = add.reduceat(newell, offsets[:-1][valid], axis=0)
+    normals[valid] /= norm(normals[valid], axis=1)[:, None]
+    origins = zeros((npolygons, 3), dtype=float64)
+    origins[valid] = add.reduceat(xyz, offsets[:-1][valid], axis=0) / counts[valid, None]
+
+    # the interfaces sharing an edge
+    u = labels
+    v = labels[after]
+    edges = minimum(u, v).astype(int64) * len(xyz) + maximum(u, v)
+    shared = valid[owner] & (u != v)
+    order = argsort(edges[shared], kind="stable")
+    sorted_edges = edges[shared][order]
+    sorted_owners = owner[shared][order]
+    same = (sorted_edges[1:] == sorted_edges[:-1]) & (sorted_owners[1:] != sorted_owners[:-1])
+    adjacency = [[] for _ in range(npolygons)]
+    for i, j in zip(sorted_owners[:-1][same].tolist(), sorted_owners[1:][same].tolist()):
+        adjacency[i].append(j)
+        adjacency[j].append(i)
+
+    # the coordinates of the welded corners
+    corners = zeros((labels.max() + 1 if len(labels) else 0, 3), dtype=float64)
+    corners[labels] = xyz
+
+    labels = labels.tolist()
+    owner_offsets = offsets.tolist()
+    pair_offsets = concatenate(([0], cumsum([len(items) for items in polygons]))).tolist()
+
+    results = []
+    for index in range(len(polygons)):
+        p0 = pair_offsets[index]
+        p1 = pair_offsets[index + 1]
+        v0 = owner_offsets[p0]
+        v1 = owner_offsets[p1]
+
+        # all corners of all interfaces of the pair are tested against the plane of the first interface of a group at once
+        grouped = set()
+        groups = []
+        for seed in range(p0, p1):
+            if seed in grouped:
+                continue
+            grouped.add(seed)
+            members = [seed]
+            if valid[seed] and adjacency[seed]:
+                inplane = npabs((xyz[v0:v1] - origins[seed]).dot(normals[seed])) <= tol
+                starts = minimum(offsets[p0:p1] - v0, v1 - v0 - 1)
+                coplanar = (logical_and.reduceat(inplane, starts) & valid[p0:p1]).tolist()
+                frontier = [seed]
+                while frontier:
+                    for nbr in adjacency[frontier.pop()]:
+                        if nbr not in grouped and coplanar[nbr - p0]:
+                            grouped.add(nbr)
+                            members.append(nbr)
+                            frontier.append(nbr)
+            groups.append(members)
+
+        if len(groups) == p1 - p0:
+            results.append(None)
+            continue
+
+        merged = []
+        for members in groups:
+            cycle = _boundary([labels[owner_offsets[k] : owner_offsets[k + 1]] for k in members]) if len(members) > 1 else None
+            if cycle is None:
+                merged += [k - p0 for k in members]
+            else:
+                normal = normals[members[0]]
+                if normal.dot(zaxes[members[0]]) < 0:
+                    normal = -normal
+                    cycle = cycle[::-1]
+                merged.append((corners[cycle].tolist(), normal.tolist()))
+        results.append(merged)
+    return results
+
+
+def _boundary(cycles):
+    # the boundary of a group of polygons, given as cycles of welded vertices, as a single cycle of vertices
+    # or None if the boundary consists of more than one cycle
+    halfedges = set()
+    for cycle in cycles:
+        halfedges.update((u, v) for u, v in zip(cycle, cycle[1:] + cycle[:1]) if u != v)
+    following = {}
+    for u, v in halfedges:
+        if (v, u) in halfedges:
+            continue
+        if u in following:
+            return None
+        following[u] = v
+    start = next((vertex for vertex in cycles[0] if vertex in following), None)
+    if start is None:
+        return None
+    cycle = [start]
+    while True:
+        vertex = following.get(cycle[-1])
+        if vertex is None or len(cycle) > len(following):
+            return None
+        if vertex == start:
+            break
+        cycle.append(vertex)
+    if len(cycle) != len(following):
+        return None
+    return cycle
+
+
+def _polygon_interface(points, normal):
+    # an interface with the given corner points, in the plane with the given normal
+    # the frame is only constructed when it is accessed
+    xyz = asarray(points, dtype=float64)
+    area = 0.5 * npabs(cross(xyz, roll(xyz, -1, axis=0)).sum(axis=0).dot(normal))
+    xaxis = xyz[1] - xyz[0]
+    xaxis -= xaxis.dot(normal) * asarray(normal)
+    xaxis /= norm(xaxis)
+    yaxis = cross(normal, xaxis)
+    interface = Interface(size=float(area), points=points)
+    interface._frame_axes = (centroid_polygon(points), xaxis.tolist(), yaxis.tolist())
+    return interface
@@ -0,0 +1,354 @@
+import os
+import sqlite3
+import time
+from hashlib import blake2b
+
+from numpy import ascontiguousarray
+from numpy import float64
+from numpy import frombuffer
+from numpy import int64
+from numpy import nan
+
+from compas_assembly.datastructures import Interface
+
+FORMAT_VERSION = 1
+
+
+class InterfaceCache(object):
+    """Persistent, content-addressed storage of the interfaces between pairs of blocks.
+
+    Parameters
+    ----------
+    path : str, optional
+        The path of the SQLite database file.
+        Defaults to the value of the environment variable ``COMPAS_ASSEMBLY_CACHE``,
+        or to ``interfaces.sqlite`` in the folder ``compas_assembly`` of the user cache directory.
+    max_size : int, optional
+        The maximum size of the stored keys and values, in bytes.
+        When it is exceeded, the least recently used entries are removed.
+
+    Attributes
+    ----------
+    path : str
+        The path of the database file.
+    max_size : int
+        The maximum size of the stored entries, in bytes.
+    hits : int
+        The number of block pairs served from the cache since it was opened.
+    misses : int
+        The number of block pairs not found in the cache since it was opened.
+
+    Notes
+    -----
+    The key of a block pair is a hash of the vertex coordinates and faces of both blocks,
+    the identification method, and its parameters.
+    Any change of the geometry of one of the blocks therefore results in a different key.
+    The value is the list of interfaces of the pair, also if it is empty.
+
+    The database can be shared by several processes.
+
+    Examples
+    --------
+    >>> with InterfaceCache("interfaces.sqlite") as cache:
+    ...     assembly_interfaces_numpy(assembly, tmax=1e-3, amin=1e-2, cache=cache)
+
+    """
+
+    def __init__(self, path=None, max_size=256 * 2**20):
+        if path is None:
+            path = os.environ.get("COMPAS_ASSEMBLY_CACHE")
+        if path is None:
+            root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+            path = os.path.join(root, "compas_assembly", "interfaces.sqlite")
+        folder = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._used = 0.0
+        self._connection = sqlite3.connect(path, timeout=60)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS interfaces (key BLOB PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS interfaces_used ON interfaces (used)")
+        self._connection.commit()
+
+    def _now(self):
+        # the time of use, strictly increasing within this process, such that entries used in quick succession keep their order
+        self._used = max(time.time(), self._used + 1e-6)
+        return self._used
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM interfaces").fetchone()[0]
+
+    # ==========================================================================
+    # properties
+    # ==========================================================================
+
+    @property
+    def nbytes(self):
+        """int - The total size of the stored keys and values, in bytes."""
+        return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM interfaces").fetchone()[0]
+
+    # ==========================================================================
+    # keys
+    # ==========================================================================
+
+    def pair_keys(self, pairs, arrays, method, tmax, amin):
+        """Compute the keys of a sequence of block pairs.
+
+        Parameters
+        ----------
+        pairs : list[tuple[int, int]]
+            The pairs of block indices.
+        arrays : callable
+            A function returning the vertex coordinates, padded face vertex indices, and face degrees of a block, per index,
+            as returned by :func:`compas_assembly.algorithms.interfaces_numpy.mesh_face_arrays`.
+        method : str
+            The name of the identification method.
+        tmax : float
+            Maximum deviation from the perfectly flat interface plane.
+        amin : float
+            Minimum area of a "face-face" interface.
+
+        Returns
+        -------
+        list[bytes]
+
+        """
+        digests = {}
+        params = "{}|{}|{!r}|{!r}".format(FORMAT_VERSION, method, float(tmax), float(amin)).encode()
+        keys = []
+        for i, j in pairs:
+            for index in (i, j):
+                if index not in digests:
+                    digests[index] = block_digest(*arrays(index))
+            keys.append(blake2b(digests[i] + digests[j] + params, digest_size=20).digest())
+        return keys
+
+    # ==========================================================================
+    # storage
+    # ==========================================================================
+
+    def get(self, key):
+        """Retrieve the interfaces of a block pair.
+
+        Parameters
+        ----------
+        key : bytes
+            The key of the pair.
+
+        Returns
+        -------
+        list[:class:`compas_assembly.datastructures.Interface`] | None
+            The interfaces, or None if the pair is not in the cache.
+
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys):
+        """Retrieve the interfaces of a sequence of block pairs.
+
+        Parameters
+        ----------
+        keys : list[bytes]
+            The keys of the pairs.
+
+        Returns
+        -------
+        dict[bytes, list[:class:`compas_assembly.datastructures.Interface`]]
+            The interfaces of the pairs that are in the cache.
+
+        """
+        keys = list(set(keys))
+        values = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            query = "SELECT key, value FROM interfaces WHERE key IN ({})".format(", ".join("?" * len(chunk)))
+            values.update(self._connection.execute(query, chunk).fetchall())
+        self.hits += len(values)
+        self.misses += len(keys) - len(values)
+        if values:
+            used = self._now()
+            self._connection.executemany("UPDATE interfaces SET used = ? WHERE key = ?", [(used, key) for key in values])
+            self._connection.commit()
+        return {key: decode_interfaces(value) for key, value in values.items()}
+
+    def put(self, key, interfaces):
+        """Store the interfaces of a block pair.
+
+        Parameters
+        ----------
+        key : bytes
+            The key of the pair.
+        interfaces : list[:class:`compas_assembly.datastructures.Interface`]
+            The interfaces.
+
+        Returns
+        -------
+        None
+
+        """
+        self.put_many([(key, interfaces)])
+
+    def put_many(self, items):
+        """Store the interfaces of a sequence of block pairs, and remove the least recently used entries if the cache is full.
+
+        Parameters
+        ----------
+        items : iterable[tuple[bytes, list[:class:`compas_assembly.datastructures.Interface`]]]
+            The keys and interfaces of the pairs.
+
+        Returns
+        -------
+        None
+
+        """
+        used = self._now()
+        rows = []
+        for key, interfaces in items:
+            value = encode_interfaces(interfaces)
+            rows.append((key, value, len(key) + len(value), used))
+        if not rows:
+            return
+        self._connection.executemany("INSERT OR REPLACE INTO interfaces (key, value, size, used) VALUES (?, ?, ?, ?)", rows)
+        self._connection.commit()
+        self.evict()
+
+    def evict(self, max_size=None):
+        """Remove the least recently used entries until the size of the cache is below the maximum.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            The maximum size, in bytes.
+            Defaults to :attr:`max_size`.
+
+        Returns
+        -------
+        int
+            The number of removed entries.
+
+        """
+        max_size = self.max_size if max_size is None else max_size
+        excess = self.nbytes - max_size
+        if excess <= 0:
+            return 0
+        keys = []
+        for key, size in self._connection.execute("SELECT key, size FROM interfaces ORDER BY used, rowid"):
+            keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._connection.executemany("DELETE FROM interfaces WHERE key = ?", keys)
+        self._connection.commit()
+        return len(keys)
+
+    def clear(self):
+        """Remove all entries.
+
+        Returns
+        -------
+        None
+
+        """
+        self._connection.execute("DELETE FROM interfaces")
+        self._connection.commit()
+
+    def close(self):
+        """Close the database connection.
+
+        Returns
+        -------
+        None
+
+        """
+        self._connection.close()
+
+
+def block_digest(xyz, faces, degrees):
+    """Compute a hash of the geometry of a block from its vertex and face arrays.
+
+    Parameters
+    ----------
+    xyz : ndarray
+        The vertex coordinates, with shape (V, 3).
+    faces : ndarray
+        The padded vertex indices of the faces, with shape (F, D).
+    degrees : ndarray
+        The number of vertices of every face, with shape (F,).
+
+    Returns
+    -------
+    bytes
+
+    """
+    h = blake2b(digest_size=20)
+    h.update(ascontiguousarray(xyz, dtype=float64).tobytes())
+    h.update(ascontiguousarray(faces, dtype=int64).tobytes())
+    h.update(ascontiguousarray(degrees, dtype=int64).tobytes())
+    return h.digest()
+
+
+def encode_interfaces(interfaces):
+    """Serialize the geometry of a list of interfaces into bytes.
+
+    Parameters
+    ----------
+    interfaces : list[:class:`compas_assembly.datastructures.Interface`]
+
+    Returns
+    -------
+    bytes
+
+    Notes
+    -----
+    The size, corner points, and frame of every interface are stored as float64 values.
+    Forces and meshes are not stored.
+
+    """
+    values = [float(len(interfaces))] + [float(len(interface.points)) for interface in interfaces]
+    for interface in interfaces:
+        frame = interface.frame
+        values.append(nan if interface.size is None else float(interface.size))
+        values += list(frame.point) + list(frame.xaxis) + list(frame.yaxis)
+        values += [x for point in interface.points for x in point]
+    return ascontiguousarray(values, dtype=float64).tobytes()
+
+
+def decode_interfaces(value):
+    """Reconstruct a list of interfaces from the bytes produced by :func:`encode_interfaces`.
+
+    Parameters
+    ----------
+    value : bytes
+
+    Returns
+    -------
+    list[:class:`compas_assembly.datastructures.Interface`]
+
+    Notes
+    -----
+    The frames of the interfaces are only constructed when they are accessed.
+
+    """
+    values = frombuffer(value, dtype=float64).tolist()
+    k = int(values[0])
+    counts = [int(count) for count in values[1 : k + 1]]
+    start = k + 1
+    interfaces = []
+    for count in counts:
+        size = values[start]
+        origin, xaxis, yaxis = values[start + 1 : start + 4], values[start + 4 : start + 7], values[start + 7 : start + 10]
+        coords = values[start + 10 : start + 10 + 3 * count]
+        interface = Interface(size=None if size != size else size, points=[coords[i : i + 3] for i in range(0, len(coords), 3)])
+        interface._frame_axes = (origin, xaxis, yaxis)
+        interfaces.append(interface)
+        start += 10 + 3 * count
+    return interfaces
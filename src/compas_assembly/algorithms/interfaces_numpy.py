@@ -1,24 +1,41 @@
-from math import fabs
+from timeit import default_timer as timer
 
+from numpy import abs as npabs
 from numpy import array
+from numpy import asarray
+from numpy import cross
 from numpy import float64
-from scipy.linalg import solve
+from numpy import int64
+from numpy import nonzero
+from numpy import roll
+from numpy import stack
+from numpy.linalg import norm
 from shapely.geometry import Polygon
 
 from compas.geometry import Frame
 from compas.geometry import centroid_points
-from compas.geometry import local_to_world_coordinates_numpy
-from compas_assembly.algorithms.nnbrs import find_nearest_neighbours
+from compas_assembly.algorithms.interfaces_cache import InterfaceCache
+from compas_assembly.algorithms.nnbrs import find_block_pairs
+from compas_assembly.algorithms.profiling import active_profiler
 from compas_assembly.datastructures import Assembly
 from compas_assembly.datastructures import Block
+from compas_assembly.datastructures import BlockView
 from compas_assembly.datastructures import Interface
 
+# the name of the contact kernel in the keys of the interface cache
+# it has to change whenever the results of the kernel change, such that cached results of earlier versions are not used
+CACHE_METHOD = "numpy:3"
+
 
 def assembly_interfaces_numpy(
     assembly: Assembly,
     nmax: int = 10,
     tmax: float = 1e-6,
     amin: float = 1e-1,
+    nnbrs_dims: int = 3,
+    nnbrs_mode: str = "knn",
+    obb: bool = False,
+    cache: InterfaceCache = None,
 ):
     """Identify the interfaces between the blocks of an assembly.
 
@@ -28,55 +45,127 @@ def assembly_interfaces_numpy(
         An assembly of discrete blocks.
     nmax : int, optional
         Maximum number of neighbours per block.
+        Only used if ``nnbrs_mode`` is ``"knn"``.
     tmax : float, optional
         Maximum deviation from the perfectly flat interface plane.
     amin : float, optional
         Minimum area of a "face-face" interface.
+    nnbrs_dims : int, optional
+        The number of coordinate dimensions used for the neighbour search.
+    nnbrs_mode : Literal["knn", "radius", "index"], optional
+        The neighbour search mode.
+        With ``"knn"``, the ``nmax`` nearest blocks of every block are considered.
+        With ``"radius"``, all blocks with overlapping bounding spheres are considered.
+        With ``"index"``, all blocks with overlapping bounding boxes in the spatial index of the assembly are considered.
+    obb : bool, optional
+        If True, candidate pairs are also rejected if their oriented bounding boxes don't overlap.
+        Axis-aligned bounding boxes are always tested.
+    cache : :class:`compas_assembly.algorithms.InterfaceCache`, optional
+        A persistent cache of the interfaces of block pairs.
+        The interfaces of pairs found in the cache are not recomputed,
+        and the interfaces of all other pairs are added to the cache.
 
     Returns
     -------
     :class:`Assembly`
 
+    Notes
+    -----
+    The stages of the algorithm are timed, and the candidate pairs and rejected face pairs are counted,
+    if the function is called in the context of :func:`compas_assembly.algorithms.assembly_profiler`.
+    Pairs served from the cache are counted as ``"cached pairs"``.
+
     References
     ----------
     The identification of interfaces is discussed in detail here [Frick2016]_.
 
     """
-    node_index = {node: index for index, node in enumerate(assembly.nodes())}
-    index_node = {index: node for index, node in enumerate(assembly.nodes())}
+    profiler = active_profiler()
 
     blocks = list(assembly.blocks())
 
-    nmax = min(nmax, len(blocks))
-
-    block_cloud = [block.centroid() for block in blocks]
-    block_nnbrs = find_nearest_neighbours(block_cloud, nmax)
-
-    assembly.graph.edge = {node: {} for node in assembly.graph.nodes()}
-
-    for node in assembly.graph.nodes():
-        i = node_index[node]
-
-        block = blocks[i]
-        nbrs = block_nnbrs[i][1]
-
-        for j in nbrs:
-            n = index_node[j]
-
-            if n == node:
-                # a block has no interfaces with itself
-                continue
-
-            if assembly.graph.has_edge(n, node):
-                # the interfaces between these two blocks have already been identified
-                continue
-
-            nbr = blocks[j]
-
-            interfaces = mesh_mesh_interfaces(block, nbr, tmax, amin)
-
-            if interfaces:
-                assembly.add_block_block_interfaces(block, nbr, interfaces)
+    if profiler:
+        t0 = timer()
+
+    block_pairs = find_block_pairs(
+        blocks,
+        nmax=nmax,
+        tmax=tmax,
+        dims=nnbrs_dims,
+        mode=nnbrs_mode,
+        obb=obb,
+        index=assembly.spatial_index if nnbrs_mode == "index" else None,
+        keys=list(assembly.nodes()),
+    )
+
+    if profiler:
+        nodes = list(assembly.nodes())
+        profiler.add_time("neighbours", timer() - t0)
+        profiler.count("blocks", len(blocks))
+        profiler.count("candidate pairs", len(block_pairs))
+
+    assembly.clear_interfaces()
+
+    # the face arrays and frames of every block are computed only once
+    block_arrays = {}
+    block_data = {}
+
+    def arrays(index):
+        if index not in block_arrays:
+            block_arrays[index] = mesh_face_arrays(blocks[index])
+        return block_arrays[index]
+
+    def data(index):
+        if index not in block_data:
+            if profiler:
+                with profiler.stage("frames"):
+                    block_data[index] = face_arrays_contact_data(*arrays(index))
+            else:
+                block_data[index] = face_arrays_contact_data(*arrays(index))
+        return block_data[index]
+
+    block_pairs = block_pairs.tolist()
+    cached = {}
+    served = {}
+    computed = []
+    if cache is not None:
+        keys = cache.pair_keys(block_pairs, arrays, CACHE_METHOD, tmax, amin)
+        cached = cache.get_many(keys)
+
+        if profiler:
+            profiler.count("cached pairs", len(cached))
+
+    for n, (i, j) in enumerate(block_pairs):
+        if profiler:
+            t0 = timer()
+
+        interfaces = None
+        if cache is not None:
+            if keys[n] in served:
+                # a pair with the same geometry as an earlier pair
+                interfaces = [interface.copy() for interface in served[keys[n]]]
+            elif keys[n] in cached:
+                interfaces = served[keys[n]] = cached.pop(keys[n])
+        if interfaces is None:
+            interfaces = contact_data_interfaces(data(i), data(j), tmax, amin)
+            if cache is not None:
+                served[keys[n]] = interfaces
+                computed.append((keys[n], interfaces))
+
+        if profiler:
+            t1 = timer()
+            profiler.add_pair(nodes[i], nodes[j], t1 - t0)
+
+        if interfaces:
+            assembly.add_block_block_interfaces(blocks[i], blocks[j], interfaces)
+
+            if profiler:
+                profiler.add_time("insertion", timer() - t1)
+                profiler.count("pairs with interfaces")
+                profiler.count("interfaces", len(interfaces))
+
+    if cache is not None:
+        cache.put_many(computed)
 
     return assembly
 
@@ -102,59 +191,323 @@ def mesh_mesh_interfaces(
     -------
     List[:class:`Interface`]
 
+    Notes
+    -----
+    The vertices of all faces of ``b`` are projected onto the local frames of all faces of ``a`` in one stacked operation.
+    Face pairs that are not coplanar within ``tmax``, or for which the projected face of ``b`` is smaller than ``amin``,
+    are rejected before any polygon clipping takes place.
+
     """
-    k_i = {key: index for index, key in enumerate(b.vertices())}
-    frames: dict[int, Frame] = a.frames()
+    return contact_data_interfaces(mesh_contact_data(a), mesh_contact_data(b), tmax, amin)
 
-    interfaces = []
 
-    for f0, frame in frames.items():
-        origin = frame.point
-        uvw = [frame.xaxis, frame.yaxis, frame.zaxis]
+def mesh_contact_data(mesh):
+    """Collect the arrays of a mesh required for the identification of contact interfaces.
 
-        A = array(uvw, dtype=float64)
-        o = array(origin, dtype=float64).reshape((-1, 1))
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+
+    Returns
+    -------
+    tuple[ndarray, ndarray, ndarray, ndarray, ndarray, ndarray]
+        The vertex coordinates, the padded face vertex indices, the face degrees,
+        the origins and axes of the face frames, and the bounding boxes of the faces.
+
+    """
+    return face_arrays_contact_data(*mesh_face_arrays(mesh))
 
-        xyz0 = array(a.face_coordinates(f0), dtype=float64).reshape((-1, 3)).T
-        rst0 = solve(A.T, xyz0 - o).T.tolist()
-        p0 = Polygon(rst0)
 
-        xyz = array(b.vertices_attributes("xyz"), dtype=float64).reshape((-1, 3)).T
-        rst = solve(A.T, xyz - o).T.tolist()
-        rst = {key: rst[k_i[key]] for key in b.vertices()}
+def face_arrays_contact_data(xyz, faces, degrees):
+    """Collect the arrays required for the identification of contact interfaces from the vertex and face arrays of a mesh.
+
+    Parameters
+    ----------
+    xyz : ndarray
+        The vertex coordinates, with shape (V, 3).
+    faces : ndarray
+        The padded vertex indices of the faces, with shape (F, D).
+    degrees : ndarray
+        The number of vertices of every face, with shape (F,).
+
+    Returns
+    -------
+    tuple[ndarray, ndarray, ndarray, ndarray, ndarray, ndarray]
+        The vertex coordinates, the padded face vertex indices, the face degrees,
+        the origins and axes of the face frames, and the bounding boxes of the faces.
+
+    """
+    origins, uvw = face_frames_numpy(xyz, faces, degrees)
+    points = xyz[faces]
+    boxes = stack((points.min(axis=1), points.max(axis=1)), axis=1)
+    return xyz, faces, degrees, origins, uvw, boxes
 
-        for f1 in b.faces():
-            rst1 = [rst[key] for key in b.face_vertices(f1)]
 
-            if any(fabs(t) > tmax for r, s, t in rst1):
-                continue
+def contact_data_interfaces(a, b, tmax=1e-6, amin=1e-1):
+    """Compute all face-face contact interfaces between two meshes from their contact data.
 
-            p1 = Polygon(rst1)
+    Parameters
+    ----------
+    a : tuple
+        The contact data of the first mesh, as returned by :func:`mesh_contact_data`.
+    b : tuple
+        The contact data of the second mesh, as returned by :func:`mesh_contact_data`.
+    tmax : float, optional
+        Maximum deviation from the perfectly flat interface plane.
+    amin : float, optional
+        Minimum area of a "face-face" interface.
 
-            if p1.area < amin:
-                continue
+    Returns
+    -------
+    List[:class:`Interface`]
 
-            if not p0.intersects(p1):
-                continue
+    """
+    return contacts_to_interfaces(contact_data_contacts(a, b, tmax, amin))
 
-            intersection = p0.intersection(p1)
-            area = intersection.area
 
-            if area < amin:
-                continue
+def contacts_to_interfaces(contacts):
+    """Convert raw contacts to interfaces.
 
-            coords = [[x, y, 0.0] for x, y, z in intersection.exterior.coords]
-            coords = local_to_world_coordinates_numpy(Frame(o, A[0], A[1]), coords[:-1]).tolist()
-            interface = Interface(
-                size=area,
-                points=coords,
-                frame=Frame(
-                    centroid_points(coords),
-                    frame.xaxis,
-                    frame.yaxis,
-                ),
-            )
+    Parameters
+    ----------
+    contacts : list[tuple[float, list[list[float]], list[float], list[float]]]
+        The area, corner points, and frame axes of every contact,
+        as returned by :func:`contact_data_contacts`.
 
-            interfaces.append(interface)
+    Returns
+    -------
+    List[:class:`Interface`]
 
+    """
+    interfaces = []
+    for area, coords, xaxis, yaxis in contacts:
+        interface = Interface(
+            size=area,
+            points=coords,
+            frame=Frame(
+                centroid_points(coords),
+                xaxis,
+                yaxis,
+            ),
+        )
+        interfaces.append(interface)
     return interfaces
+
+
+def contact_data_contacts(a, b, tmax=1e-6, amin=1e-1):
+    """Compute the raw geometry of all face-face contacts between two meshes from their contact data.
+
+    Parameters
+    ----------
+    a : tuple
+        The contact data of the first mesh, as returned by :func:`mesh_contact_data`.
+    b : tuple
+        The contact data of the second mesh, as returned by :func:`mesh_contact_data`.
+    tmax : float, optional
+        Maximum deviation from the perfectly flat interface plane.
+    amin : float, optional
+        Minimum area of a "face-face" interface.
+
+    Returns
+    -------
+    list[tuple[float, list[list[float]], list[float], list[float]]]
+        The area, the corner points, and the X and Y axis of the frame of every contact.
+
+    Notes
+    -----
+    The faces of B are tested against the planes of the faces of A.
+    If no contacts are found, the faces of A are tested against the planes of the faces of B,
+    and the contacts that are found are reversed, such that their frames point from A to B.
+    The same pairs of meshes therefore have contacts in both orientations,
+    also if the faces of one of them are not perfectly planar.
+
+    """
+    contacts = _oriented_contacts(a, b, tmax, amin)
+    if contacts:
+        return contacts
+    return [(area, coords[::-1], xaxis, [-y for y in yaxis]) for area, coords, xaxis, yaxis in _oriented_contacts(b, a, tmax, amin)]
+
+
+def _oriented_contacts(a, b, tmax, amin):
+    # the contacts of the faces of B with the faces of A, in the frames of the faces of A
+    profiler = active_profiler()
+    if profiler:
+        t0 = timer()
+
+    xyz_a, faces_a, degrees_a, origins, uvw, boxes_a = a
+    xyz_b, faces_b, degrees_b, _, _, boxes_b = b
+
+    # the bounding boxes of the faces, inflated by tmax, have to overlap
+    overlap = ((boxes_a[:, None, 0] <= boxes_b[None, :, 1] + tmax) & (boxes_b[None, :, 0] <= boxes_a[:, None, 1] + tmax)).all(axis=2)
+
+    if profiler:
+        profiler.count("face pairs", overlap.size)
+        profiler.reject("bbox", overlap.size - int(overlap.sum()))
+
+    if not overlap.any():
+        if profiler:
+            profiler.add_time("projection", timer() - t0)
+        return []
+
+    # local coordinates of all vertices of B with respect to all face frames of A
+    # rst[i, j] are the coordinates of vertex j of B in the frame of face i of A
+    rst = _local_coordinates(xyz_b, origins, uvw)
+
+    # the faces of B have to lie in the planes of the faces of A
+    # padded face entries repeat the last vertex of a face and therefore don't affect the result
+    coplanar = (npabs(rst[:, :, 2][:, faces_b]) <= tmax).all(axis=2)
+
+    candidates = overlap & coplanar
+
+    if profiler:
+        profiler.reject("tmax", int((overlap & ~coplanar).sum()))
+
+    if not candidates.any():
+        if profiler:
+            profiler.add_time("projection", timer() - t0)
+        return []
+
+    # the projected area of the faces of B is computed with the shoelace formula
+    # only for the remaining candidate pairs
+    rows, cols = nonzero(candidates)
+    rs = rst[rows[:, None], faces_b[cols], :2]
+    x = rs[:, :, 0]
+    y = rs[:, :, 1]
+    areas = 0.5 * npabs((x * roll(y, -1, axis=1) - roll(x, -1, axis=1) * y).sum(axis=1))
+
+    if profiler:
+        t1 = timer()
+        profiler.add_time("projection", t1 - t0)
+
+    polygons = {}
+    contacts = []
+
+    for f0, f1, rs1, area1 in zip(rows.tolist(), cols.tolist(), rs, areas.tolist()):
+        if area1 < amin:
+            if profiler:
+                profiler.reject("amin")
+            continue
+
+        # the vertices of both faces are projected with exactly the same arithmetic
+        # such that shared vertices have identical local coordinates, which keeps the overlay robust for coincident edges
+        p0 = polygons.get(f0)
+        if p0 is None:
+            rs0 = _local_coordinates(xyz_a[faces_a[f0, : degrees_a[f0]]], origins[f0 : f0 + 1], uvw[f0 : f0 + 1])[0, :, :2]
+            p0 = polygons[f0] = Polygon(rs0)
+
+        p1 = Polygon(rs1[: degrees_b[f1]])
+
+        if not p0.intersects(p1):
+            if profiler:
+                profiler.reject("no intersection")
+            continue
+
+        intersection = p0.intersection(p1)
+        area = intersection.area
+
+        if area < amin:
+            if profiler:
+                profiler.reject("amin")
+            continue
+
+        coords = array(intersection.exterior.coords, dtype=float64)[:-1, :2]
+        coords = (origins[f0] + coords.dot(uvw[f0, :2])).tolist()
+
+        contacts.append((area, coords, uvw[f0, 0].tolist(), uvw[f0, 1].tolist()))
+
+    if profiler:
+        profiler.add_time("intersection", timer() - t1)
+
+    return contacts
+
+
+def mesh_face_arrays(mesh):
+    """Convert the vertices and faces of a mesh to arrays.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+
+    Returns
+    -------
+    tuple[ndarray, ndarray, ndarray]
+        The vertex coordinates, with shape (V, 3).
+        The vertex indices of the faces, with shape (F, D), with D the maximum face degree.
+        Faces with fewer vertices are padded by repeating their last vertex.
+        The number of vertices of every face, with shape (F,).
+
+    Notes
+    -----
+    The arrays of a :class:`compas_assembly.datastructures.BlockView` are taken from its buffer directly.
+
+    """
+    if isinstance(mesh, BlockView):
+        return mesh.face_arrays()
+
+    vertex_index = mesh.vertex_index()
+    xyz = asarray(mesh.vertices_attributes("xyz"), dtype=float64).reshape((-1, 3))
+    faces = [[vertex_index[vertex] for vertex in mesh.face_vertices(face)] for face in mesh.faces()]
+    degrees = array([len(face) for face in faces], dtype=int64)
+    d = degrees.max() if len(faces) else 0
+    faces = array([face + face[-1:] * (d - len(face)) for face in faces], dtype=int64).reshape((-1, d))
+    return xyz, faces, degrees
+
+
+def face_frames_numpy(xyz, faces, degrees):
+    """Compute the local frames of a set of faces.
+
+    Parameters
+    ----------
+    xyz : ndarray
+        The vertex coordinates, with shape (V, 3).
+    faces : ndarray
+        The padded vertex indices of the faces, with shape (F, D).
+    degrees : ndarray
+        The number of vertices of every face, with shape (F,).
+
+    Returns
+    -------
+    tuple[ndarray, ndarray]
+        The origins of the frames, with shape (F, 3).
+        The orthonormal axes of the frames, with shape (F, 3, 3),
+        such that ``uvw[i, 0]``, ``uvw[i, 1]``, ``uvw[i, 2]`` are the x, y, and z axis of frame ``i``.
+
+    Notes
+    -----
+    The frames are the same as the ones computed by :meth:`compas_assembly.datastructures.Block.frame`.
+
+    """
+    points = xyz[faces]
+    centroids = _face_centroids(points, degrees)
+    a = points - centroids[:, None, :]
+    b = roll(a, -1, axis=1)
+    triangles = cross(a, b)
+    w = 0.5 * triangles.sum(axis=1)
+    w /= norm(w, axis=1)[:, None]
+    # centre of mass of the face polygons
+    # padded entries produce zero-area triangles
+    weights = norm(triangles, axis=2)
+    centers = (weights[:, :, None] * (a + b)).sum(axis=1) / (3 * weights.sum(axis=1)[:, None]) + centroids
+    u = points[:, 1] - points[:, 0]
+    u /= norm(u, axis=1)[:, None]
+    v = cross(w, u)
+    v /= norm(v, axis=1)[:, None]
+    w = cross(u, v)
+    w /= norm(w, axis=1)[:, None]
+    v = cross(w, u)
+    uvw = array([u, v, w]).transpose((1, 0, 2))
+    return centers, uvw
+
+
+def _local_coordinates(xyz, origins, uvw):
+    # the coordinates of all points with respect to all frames, with shape (F, V, 3)
+    # the products are summed explicitly, such that the result for a point doesn't depend on the other points or frames
+    d = xyz[None, :, :] - origins[:, None, :]
+    return d[:, :, 0, None] * uvw[:, None, :, 0] + d[:, :, 1, None] * uvw[:, None, :, 1] + d[:, :, 2, None] * uvw[:, None, :, 2]
+
+
+def _face_centroids(points, degrees):
+    # the padded entries repeat the last vertex and have to be discounted
+    last = points[range(len(degrees)), degrees - 1]
+    padding = points.shape[1] - degrees
+    return (points.sum(axis=1) - padding[:, None] * last) / degrees[:, None]
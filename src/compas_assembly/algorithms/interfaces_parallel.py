@@ -0,0 +1,201 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from timeit import default_timer as timer
+
+from compas_assembly.algorithms.interfaces_cache import InterfaceCache
+from compas_assembly.algorithms.interfaces_numpy import CACHE_METHOD
+from compas_assembly.algorithms.interfaces_numpy import contact_data_contacts
+from compas_assembly.algorithms.interfaces_numpy import contacts_to_interfaces
+from compas_assembly.algorithms.interfaces_numpy import face_arrays_contact_data
+from compas_assembly.algorithms.interfaces_numpy import mesh_face_arrays
+from compas_assembly.algorithms.nnbrs import find_block_pairs
+from compas_assembly.algorithms.profiling import active_profiler
+from compas_assembly.datastructures import Assembly
+
+
+def assembly_interfaces_parallel(
+    assembly: Assembly,
+    nmax: int = 10,
+    tmax: float = 1e-6,
+    amin: float = 1e-1,
+    nnbrs_dims: int = 3,
+    nnbrs_mode: str = "knn",
+    obb: bool = False,
+    workers: int = None,
+    chunksize: int = None,
+    cache: InterfaceCache = None,
+):
+    """Identify the interfaces between the blocks of an assembly using a pool of worker processes.
+
+    Parameters
+    ----------
+    assembly : compas_assembly.datastructures.Assembly
+        An assembly of discrete blocks.
+    nmax : int, optional
+        Maximum number of neighbours per block.
+        Only used if ``nnbrs_mode`` is ``"knn"``.
+    tmax : float, optional
+        Maximum deviation from the perfectly flat interface plane.
+    amin : float, optional
+        Minimum area of a "face-face" interface.
+    nnbrs_dims : int, optional
+        The number of coordinate dimensions used for the neighbour search.
+    nnbrs_mode : Literal["knn", "radius", "index"], optional
+        The neighbour search mode.
+    obb : bool, optional
+        If True, candidate pairs are also rejected if their oriented bounding boxes don't overlap.
+    workers : int, optional
+        The number of worker processes.
+        Defaults to the number of CPUs.
+    chunksize : int, optional
+        The number of candidate block pairs sent to a worker at once.
+        Defaults to a quarter of the number of pairs per worker.
+    cache : :class:`compas_assembly.algorithms.InterfaceCache`, optional
+        A persistent cache of the interfaces of block pairs.
+        Only the pairs that are not found in the cache are sent to the pool,
+        and their interfaces are added to the cache.
+
+    Returns
+    -------
+    :class:`Assembly`
+
+    Notes
+    -----
+    The candidate pairs of the neighbour search are split into chunks of consecutive pairs.
+    Every chunk is sent to the pool together with the vertex and face arrays of the blocks it refers to.
+    The workers compute the raw contact geometry with :func:`compas_assembly.algorithms.interfaces_numpy.contact_data_contacts`,
+    and the interfaces are added to the assembly in the same order as in :func:`assembly_interfaces_numpy`.
+    The result is therefore identical to the result of :func:`assembly_interfaces_numpy`,
+    and it has the same pairs of blocks with interfaces, and the same interface areas, as the result of :func:`assembly_interfaces`.
+    For the same reason, interfaces cached by :func:`assembly_interfaces_numpy` are used as well, and vice versa.
+
+    In the context of :func:`compas_assembly.algorithms.assembly_profiler`,
+    only the stages that run in the main process are timed.
+    The projection and intersection of the faces, and the rejected face pairs, are not recorded.
+
+    """
+    workers = workers or os.cpu_count() or 1
+
+    profiler = active_profiler()
+
+    blocks = list(assembly.blocks())
+
+    if profiler:
+        t0 = timer()
+
+    block_pairs = find_block_pairs(
+        blocks,
+        nmax=nmax,
+        tmax=tmax,
+        dims=nnbrs_dims,
+        mode=nnbrs_mode,
+        obb=obb,
+        index=assembly.spatial_index if nnbrs_mode == "index" else None,
+        keys=list(assembly.nodes()),
+    ).tolist()
+
+    if profiler:
+        t1 = timer()
+        profiler.add_time("neighbours", t1 - t0)
+        profiler.count("blocks", len(blocks))
+        profiler.count("candidate pairs", len(block_pairs))
+
+    assembly.clear_interfaces()
+
+    if not block_pairs:
+        return assembly
+
+    block_arrays = [mesh_face_arrays(block) for block in blocks]
+
+    if profiler:
+        profiler.add_time("frames", timer() - t1)
+
+    if cache is not None:
+        return _cached_interfaces(assembly, blocks, block_pairs, block_arrays, tmax, amin, workers, chunksize, cache)
+
+    chunksize = chunksize or max(1, int(ceil(len(block_pairs) / (4 * workers))))
+    chunks = _chunks(block_pairs, block_arrays, tmax, amin, chunksize)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for pairs, contacts in zip((chunk[0] for chunk in chunks), executor.map(_chunk_contacts, chunks)):
+            if profiler:
+                t0 = timer()
+
+            for (i, j), items in zip(pairs, contacts):
+                if items:
+                    assembly.add_block_block_interfaces(blocks[i], blocks[j], contacts_to_interfaces(items))
+
+                    if profiler:
+                        profiler.count("pairs with interfaces")
+                        profiler.count("interfaces", len(items))
+
+            if profiler:
+                profiler.add_time("insertion", timer() - t0)
+
+    return assembly
+
+
+def _cached_interfaces(assembly, blocks, block_pairs, block_arrays, tmax, amin, workers, chunksize, cache):
+    # serve the pairs in the cache, compute the other pairs in the pool, and add the interfaces in the original order
+    profiler = active_profiler()
+
+    # the workers run the kernel of the numpy version, and therefore share its entries in the cache
+    keys = cache.pair_keys(block_pairs, block_arrays.__getitem__, CACHE_METHOD, tmax, amin)
+    cached = cache.get_many(keys)
+
+    if profiler:
+        profiler.count("cached pairs", len(cached))
+
+    missing = [n for n, key in enumerate(keys) if key not in cached]
+    computed = {}
+    if missing:
+        pairs = [block_pairs[n] for n in missing]
+        chunksize = chunksize or max(1, int(ceil(len(pairs) / (4 * workers))))
+        chunks = _chunks(pairs, block_arrays, tmax, amin, chunksize)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            contacts = [items for result in executor.map(_chunk_contacts, chunks) for items in result]
+        computed = {n: contacts_to_interfaces(items) for n, items in zip(missing, contacts)}
+        cache.put_many([(keys[n], interfaces) for n, interfaces in computed.items()])
+
+    if profiler:
+        t0 = timer()
+
+    served = {}
+    for n, (i, j) in enumerate(block_pairs):
+        if n in computed:
+            interfaces = computed[n]
+        elif keys[n] in cached:
+            interfaces = served[keys[n]] = cached.pop(keys[n])
+        else:
+            # a pair with the same geometry as an earlier pair
+            interfaces = [interface.copy() for interface in served[keys[n]]]
+        if interfaces:
+            assembly.add_block_block_interfaces(blocks[i], blocks[j], interfaces)
+
+            if profiler:
+                profiler.count("pairs with interfaces")
+                profiler.count("interfaces", len(interfaces))
+
+    if profiler:
+        profiler.add_time("insertion", timer() - t0)
+
+    return assembly
+
+
+def _chunks(block_pairs, block_arrays, tmax, amin, chunksize):
+    chunks = []
+    for start in range(0, len(block_pairs), chunksize):
+        pairs = block_pairs[start : start + chunksize]
+        arrays = {}
+        for i, j in pairs:
+            arrays[i] = block_arrays[i]
+            arrays[j] = block_arrays[j]
+        chunks.append((pairs, arrays, tmax, amin))
+    return chunks
+
+
+def _chunk_contacts(chunk):
+    pairs, arrays, tmax, amin = chunk
+    data = {index: face_arrays_contact_data(xyz, faces, degrees) for index, (xyz, faces, degrees) in arrays.items()}
+    return [contact_data_contacts(data[i], data[j], tmax, amin) for i, j in pairs]
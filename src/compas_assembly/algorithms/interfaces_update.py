@@ -0,0 +1,86 @@
+from compas_assembly.algorithms.interfaces_numpy import mesh_mesh_interfaces
+from compas_assembly.datastructures import Assembly
+
+
+def assembly_update_interfaces(
+    assembly: Assembly,
+    nodes,
+    tmax: float = 1e-6,
+    amin: float = 1e-1,
+):
+    """Update the interfaces of an assembly after a number of blocks were added, removed, or moved.
+
+    Parameters
+    ----------
+    assembly : compas_assembly.datastructures.Assembly
+        An assembly of discrete blocks with identified interfaces.
+    nodes : list[hashable]
+        The identifiers of the nodes of which the blocks have changed.
+        Nodes that are no longer part of the assembly are removed from the spatial index.
+    tmax : float, optional
+        Maximum deviation from the perfectly flat interface plane.
+    amin : float, optional
+        Minimum area of a "face-face" interface.
+
+    Returns
+    -------
+    :class:`Assembly`
+
+    Notes
+    -----
+    The bounding boxes of the changed blocks are updated in the persistent spatial index of the assembly.
+    The interfaces of the changed blocks are then removed,
+    and recomputed for all blocks with overlapping bounding boxes, inflated by ``tmax``.
+    All other interfaces are left untouched.
+
+    Blocks that were added to the assembly, or removed from it, without updating the spatial index,
+    are detected automatically and do not have to be included in ``nodes``.
+
+    The result is the same as the result of a full recomputation
+    with :func:`compas_assembly.algorithms.assembly_interfaces_numpy` with ``nnbrs_mode="radius"``,
+    provided that the same values for ``tmax`` and ``amin`` are used.
+
+    """
+    index = assembly.spatial_index
+
+    existing = set(assembly.graph.nodes())
+    changed = set(node for node in nodes if node in existing)
+    changed.update(node for node in existing if node not in index)
+
+    for node in list(index.boxes):
+        if node not in existing:
+            index.remove(node)
+
+    for node in changed:
+        index.update(node, assembly.node_box(node))
+
+    for node in changed:
+        for nbr in assembly.graph.neighbors_out(node):
+            assembly.graph.delete_edge((node, nbr))
+        for nbr in assembly.graph.neighbors_in(node):
+            assembly.graph.delete_edge((nbr, node))
+
+    node_index = {node: position for position, node in enumerate(assembly.graph.nodes())}
+
+    pairs = set()
+    for node in changed:
+        for nbr in index.query_box(index.boxes[node], tol=tmax):
+            if nbr == node:
+                continue
+            if node_index[node] < node_index[nbr]:
+                pairs.add((node, nbr))
+            else:
+                pairs.add((nbr, node))
+
+    for u, v in sorted(pairs, key=lambda pair: (node_index[pair[0]], node_index[pair[1]])):
+        a = assembly.node_block(u)
+        b = assembly.node_block(v)
+
+        interfaces = mesh_mesh_interfaces(a, b, tmax, amin)
+
+        if interfaces:
+            assembly.add_block_block_interfaces(a, b, interfaces)
+
+    assembly.invalidate_cache()
+
+    return assembly
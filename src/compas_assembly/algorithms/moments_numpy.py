@@ -0,0 +1,125 @@
+from numpy import add
+from numpy import arange
+from numpy import asarray
+from numpy import cumsum
+from numpy import einsum
+from numpy import float64
+from numpy import int64
+from numpy import repeat
+from numpy import zeros
+
+from compas_assembly.datastructures import Assembly
+
+
+def interface_moments_numpy(interfaces, cache=True):
+    """Compute the area, and the first and second moments of a set of interface polygons in one pass.
+
+    Parameters
+    ----------
+    interfaces : list[:class:`compas_assembly.datastructures.Interface`]
+        The interfaces.
+    cache : bool, optional
+        If True, the moments are stored on the interfaces,
+        such that subsequent access to :attr:`Interface.M0`, :attr:`Interface.M1`, and :attr:`Interface.M2`
+        doesn't recompute them.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray, ndarray]
+        The signed areas (M0), with shape (n,).
+        The first moments (M1), with shape (n, 3).
+        The second moments (M2), with shape (n, 3, 3).
+        All moments are expressed in the local frames of the interfaces.
+
+    Notes
+    -----
+    The corner points of all interfaces are stacked in one array,
+    and are transformed to the local frames of their interfaces with a single operation.
+    The contributions of the polygon edges are then summed per interface.
+
+    """
+    counts = asarray([len(interface.points) for interface in interfaces], dtype=int64)
+    offsets = zeros(len(interfaces) + 1, dtype=int64)
+    offsets[1:] = cumsum(counts)
+    frames = [interface.frame for interface in interfaces]
+    origins = asarray([frame.point for frame in frames], dtype=float64).reshape((-1, 3))
+    uvw = asarray([[frame.xaxis, frame.yaxis, frame.zaxis] for frame in frames], dtype=float64).reshape((-1, 3, 3))
+    points = asarray([point for interface in interfaces for point in interface.points], dtype=float64).reshape((-1, 3))
+
+    m0, m1, m2 = _polygon_moments(points, offsets, origins, uvw)
+
+    if cache:
+        _cache_moments(interfaces, m0, m1, m2)
+
+    return m0, m1, m2
+
+
+def assembly_interface_moments_numpy(assembly: Assembly, cache=True):
+    """Compute the area, and the first and second moments of all interfaces of an assembly in one pass.
+
+    Parameters
+    ----------
+    assembly : :class:`compas_assembly.datastructures.Assembly`
+        An assembly with identified interfaces.
+    cache : bool, optional
+        If True, the moments are stored on the interfaces.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray, ndarray]
+        The signed areas (M0), with shape (n,).
+        The first moments (M1), with shape (n, 3).
+        The second moments (M2), with shape (n, 3, 3).
+        The interfaces are in the order of :meth:`compas_assembly.datastructures.Assembly.interfaces`,
+        which is also the order of :meth:`compas_assembly.datastructures.Assembly.interface_arrays`.
+
+    See Also
+    --------
+    :func:`interface_moments_numpy`
+
+    """
+    arrays = assembly.interface_arrays()
+    m0, m1, m2 = _polygon_moments(arrays.points, arrays.point_offsets, arrays.origins, arrays.uvw)
+
+    if cache:
+        _cache_moments(list(assembly.interfaces()), m0, m1, m2)
+
+    return m0, m1, m2
+
+
+def _polygon_moments(points, offsets, origins, uvw):
+    n = len(offsets) - 1
+    m0 = zeros(n, dtype=float64)
+    m1 = zeros((n, 3), dtype=float64)
+    m2 = zeros((n, 3, 3), dtype=float64)
+
+    if not len(points):
+        return m0, m1, m2
+
+    counts = offsets[1:] - offsets[:-1]
+    owner = repeat(arange(n), counts)
+    # the coordinates of the points in the frames of their interfaces
+    a = einsum("pij,pj->pi", uvw[owner], points - origins[owner])
+    # the next point of every point, wrapping around at the end of every polygon
+    following = arange(len(a)) + 1
+    nonempty = counts > 0
+    following[offsets[1:][nonempty] - 1] = offsets[:-1][nonempty]
+    b = a[following]
+
+    m = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+    add.at(m0, owner, m)
+    add.at(m1, owner, (a + b) * m[:, None])
+    aa = a[:, :, None] * a[:, None, :]
+    bb = b[:, :, None] * b[:, None, :]
+    ab = a[:, :, None] * b[:, None, :]
+    add.at(m2, owner, (aa + bb + 0.5 * (ab + ab.transpose((0, 2, 1)))) * m[:, None, None])
+
+    m0 *= 0.5
+    m1 /= 6
+    m2 /= 12.0
+    return m0, m1, m2
+
+
+def _cache_moments(interfaces, m0, m1, m2):
+    for interface, a, b, c in zip(interfaces, m0.tolist(), m1.tolist(), m2.tolist()):
+        interface._moments = (a, b, c)
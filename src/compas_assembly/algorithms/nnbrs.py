@@ -1,10 +1,244 @@
+from numpy import arange
 from numpy import asarray
+from numpy import concatenate
+from numpy import float64
+from numpy import int64
+from numpy import lexsort
+from numpy import repeat
+from numpy import sort
+from numpy import unique
+from numpy import zeros
+from numpy.linalg import norm
 from scipy.spatial import cKDTree
 
+from compas_assembly.algorithms.broadphase import blocks_aabbs_numpy
+from compas_assembly.algorithms.broadphase import broadphase_pairs
+from compas_assembly.datastructures import BlockView
+from compas_assembly.datastructures import SpatialIndex
+
 
 def find_nearest_neighbours(cloud, nmax, dims=3):
-    cloud = asarray(cloud)[:, :dims]
+    """Find the nearest neighbours of all points of a point cloud.
+
+    Parameters
+    ----------
+    cloud : array_like
+        The XYZ coordinates of the points.
+    nmax : int
+        The number of neighbours per point.
+        Every point is included in its own neighbours.
+    dims : int, optional
+        The number of coordinate dimensions taken into account.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray]
+        The distances to the neighbours, with shape (n, nmax),
+        and the indices of the neighbours, with shape (n, nmax),
+        sorted by increasing distance.
+
+    Notes
+    -----
+    In previous versions, this function returned a list with a tuple ``(distances, indices)`` of lists per point.
+    The neighbours of point ``i`` are now ``indices[i]``, and the corresponding distances are ``distances[i]``.
+
+    Examples
+    --------
+    >>> distances, indices = find_nearest_neighbours([[0, 0, 0], [1, 0, 0], [3, 0, 0]], 2)
+    >>> indices.tolist()
+    [[0, 1], [1, 0], [2, 1]]
+    >>> distances.tolist()
+    [[0.0, 1.0], [0.0, 1.0], [0.0, 2.0]]
+
+    """
+    cloud = asarray(cloud, dtype=float64)[:, :dims]
     tree = cKDTree(cloud)
-    nnbrs = [tree.query(root, nmax) for root in cloud]
-    nnbrs = [(d.flatten().tolist(), n.flatten().tolist()) for d, n in nnbrs]
-    return nnbrs
+    distances, indices = tree.query(cloud, nmax, workers=-1)
+    n = len(cloud)
+    return distances.reshape((n, -1)), indices.reshape((n, -1))
+
+
+def find_neighbours_in_radius(cloud, radii, dims=3, tol=0.0):
+    """Find all pairs of points of a point cloud of which the bounding spheres overlap.
+
+    Parameters
+    ----------
+    cloud : array_like
+        The XYZ coordinates of the points.
+    radii : array_like
+        The radius of the bounding sphere around every point.
+    dims : int, optional
+        The number of coordinate dimensions taken into account.
+    tol : float, optional
+        Additional distance allowed between the bounding spheres.
+
+    Returns
+    -------
+    ndarray
+        The index pairs, with shape (n, 2).
+        Every pair is ordered by increasing index, and the pairs are sorted.
+
+    Notes
+    -----
+    Every pair is searched from the point with the largest radius only,
+    such that the search radius of a point never depends on the size of the largest sphere of the entire cloud.
+
+    """
+    cloud = asarray(cloud, dtype=float64)[:, :dims]
+    radii = asarray(radii, dtype=float64)
+    tree = cKDTree(cloud)
+    nbrs = tree.query_ball_point(cloud, 2 * radii + tol, workers=-1, return_sorted=False)
+    if not len(nbrs):
+        return zeros((0, 2), dtype=int64)
+    counts = [len(items) for items in nbrs]
+    i = repeat(arange(len(cloud)), counts)
+    j = concatenate([asarray(items, dtype=int64) for items in nbrs])
+    # keep the pairs found from the point with the largest radius, or the lowest index in case of a tie
+    select = (radii[j] < radii[i]) | ((radii[j] == radii[i]) & (j > i))
+    i = i[select]
+    j = j[select]
+    d = norm(cloud[i] - cloud[j], axis=1)
+    select = d <= radii[i] + radii[j] + tol
+    pairs = sort(concatenate((i[select, None], j[select, None]), axis=1), axis=1)
+    return pairs[lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def neighbour_pairs(indices):
+    """Convert the neighbour indices of a nearest neighbour search to unique index pairs.
+
+    Parameters
+    ----------
+    indices : ndarray
+        The indices of the neighbours of every point, with shape (n, k).
+
+    Returns
+    -------
+    ndarray
+        The index pairs, with shape (m, 2), without self-pairs or duplicates.
+        Every pair is oriented as it is first encountered when looping over the points and their neighbours,
+        and the pairs are in that order as well.
+
+    """
+    n, k = indices.shape
+    i = repeat(arange(n), k)
+    j = indices.ravel()
+    select = i != j
+    pairs = concatenate((i[select, None], j[select, None]), axis=1)
+    _, first = unique(sort(pairs, axis=1), axis=0, return_index=True)
+    first.sort()
+    return pairs[first]
+
+
+def find_block_pairs(blocks, nmax=10, tmax=1e-6, dims=3, mode="knn", cloud=None, obb=False, index=None, keys=None):
+    """Find the pairs of blocks that are candidates for having interfaces.
+
+    Parameters
+    ----------
+    blocks : list[:class:`compas_assembly.datastructures.Block`]
+        The blocks.
+    nmax : int, optional
+        Maximum number of neighbours per block.
+        Only used if ``mode`` is ``"knn"``.
+    tmax : float, optional
+        Maximum distance between the blocks of a pair.
+    dims : int, optional
+        The number of coordinate dimensions used for the neighbour search.
+    mode : Literal["knn", "radius", "index"], optional
+        The neighbour search mode.
+    cloud : list[list[float]], optional
+        The centroids of the blocks.
+        If not provided, the centroids are computed.
+    obb : bool, optional
+        If True, the broad phase uses oriented bounding boxes in addition to axis-aligned bounding boxes.
+    index : :class:`compas_assembly.datastructures.SpatialIndex`, optional
+        A spatial index containing the bounding boxes of the blocks.
+        Only used if ``mode`` is ``"index"``.
+        If not provided, a temporary index is built.
+    keys : list[hashable], optional
+        The keys of the blocks in ``index``, in the order of ``blocks``.
+        If not provided, the keys are the positions of the blocks in the list.
+
+    Returns
+    -------
+    ndarray
+        The index pairs of the candidate blocks, with shape (n, 2).
+
+    Raises
+    ------
+    ValueError
+        If the search mode is not supported.
+
+    Notes
+    -----
+    The pairs found by the neighbour search are filtered by a broad phase
+    that removes all pairs of which the bounding boxes, inflated by ``tmax``, don't overlap.
+    The bounding boxes are the cached bounds of the blocks,
+    or are read from the shared buffer of the blocks of a compact assembly (see :func:`compas_assembly.algorithms.broadphase.blocks_aabbs_numpy`).
+
+    With ``"index"``, the candidates are the pairs of blocks of which the bounding boxes in the spatial index,
+    inflated by ``tmax``, overlap.
+    The value of ``dims`` is then ignored.
+
+    """
+    if cloud is None:
+        cloud = [block.centroid() for block in blocks]
+
+    vertices = None
+    if mode == "radius" or obb:
+        vertices = [block.xyz if isinstance(block, BlockView) else asarray(block.vertices_attributes("xyz"), dtype=float64) for block in blocks]
+
+    if mode == "knn":
+        nmax = min(nmax, len(blocks))
+        _, nnbrs = find_nearest_neighbours(cloud, nmax, dims=dims)
+        pairs = neighbour_pairs(nnbrs)
+
+    elif mode == "radius":
+        radii = [norm(xyz - asarray(centroid, dtype=float64), axis=1).max() for xyz, centroid in zip(vertices, cloud)]
+        pairs = find_neighbours_in_radius(cloud, radii, dims=dims, tol=tmax)
+
+    elif mode == "index":
+        pairs = index_block_pairs(blocks, tmax=tmax, index=index, keys=keys)
+
+    else:
+        raise ValueError("Neighbour search mode not supported: {}".format(mode))
+
+    return broadphase_pairs(vertices, pairs, tol=tmax, oriented=obb, boxes=blocks_aabbs_numpy(blocks))
+
+
+def index_block_pairs(blocks, tmax=1e-6, index=None, keys=None):
+    """Find all pairs of blocks with overlapping bounding boxes using a spatial index.
+
+    Parameters
+    ----------
+    blocks : list[:class:`compas_assembly.datastructures.Block`]
+        The blocks.
+    tmax : float, optional
+        The bounding boxes are inflated by this amount.
+    index : :class:`compas_assembly.datastructures.SpatialIndex`, optional
+        A spatial index containing the bounding boxes of the blocks.
+        If not provided, a temporary index is built.
+    keys : list[hashable], optional
+        The keys of the blocks in ``index``, in the order of ``blocks``.
+        If not provided, the keys are the positions of the blocks in the list.
+
+    Returns
+    -------
+    ndarray
+        The index pairs, with shape (n, 2).
+        Every pair is ordered by increasing index, and the pairs are sorted.
+
+    """
+    if keys is None:
+        keys = list(range(len(blocks)))
+    if index is None:
+        index = SpatialIndex()
+        index.build({key: block.bounds() for key, block in zip(keys, blocks)})
+    position = {key: i for i, key in enumerate(keys)}
+    pairs = []
+    for i, key in enumerate(keys):
+        for nbr in index.query_box(index.boxes[key], tol=tmax):
+            j = position.get(nbr)
+            if j is not None and i < j:
+                pairs.append((i, j))
+    pairs.sort()
+    return asarray(pairs, dtype=int64).reshape((-1, 2))
@@ -0,0 +1,264 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import heapq
+import json
+from contextlib import contextmanager
+from timeit import default_timer as timer
+
+_PROFILERS = []
+
+
+def active_profiler():
+    """Return the profiler that is currently collecting statistics, if any.
+
+    Returns
+    -------
+    :class:`AssemblyProfiler` | None
+        The innermost active profiler, or None if profiling is disabled.
+
+    Notes
+    -----
+    The instrumented algorithms look up the active profiler once per call,
+    and skip all timing and counting if there is none.
+
+    """
+    return _PROFILERS[-1] if _PROFILERS else None
+
+
+@contextmanager
+def assembly_profiler(nslowest=10, callback=None):
+    """Collect timings and statistics of the instrumented algorithms called in the context.
+
+    Parameters
+    ----------
+    nslowest : int, optional
+        The number of slowest block pairs that is recorded.
+    callback : callable, optional
+        A function that is called with the profiler as only argument when the context exits.
+
+    Yields
+    ------
+    :class:`AssemblyProfiler`
+
+    Examples
+    --------
+    >>> from compas_assembly.datastructures import Assembly
+    >>> from compas_assembly.geometry import Arch
+    >>> from compas_assembly.algorithms import assembly_interfaces_numpy
+    >>> assembly = Assembly.from_template(Arch(rise=5, span=10, thickness=0.7, depth=0.5, n=20))
+    >>> with assembly_profiler() as profiler:
+    ...     assembly = assembly_interfaces_numpy(assembly, amin=1e-4)
+    >>> profiler.counts["interfaces"]
+    19
+
+    """
+    profiler = AssemblyProfiler(nslowest=nslowest)
+    _PROFILERS.append(profiler)
+    try:
+        yield profiler
+    finally:
+        _PROFILERS.remove(profiler)
+    if callback:
+        callback(profiler)
+
+
+class AssemblyProfiler(object):
+    """Timings and statistics of the stages of the instrumented algorithms.
+
+    Parameters
+    ----------
+    nslowest : int, optional
+        The number of slowest block pairs that is recorded.
+
+    Attributes
+    ----------
+    timings : dict[str, float]
+        The accumulated time in seconds spent per stage.
+        The stages of the interface identification are
+        ``"neighbours"`` (neighbour search and broad phase),
+        ``"frames"`` (face arrays and frames of the blocks),
+        ``"projection"`` (projection of faces onto the face frames of the neighbours),
+        ``"intersection"`` (polygon clipping),
+        and ``"insertion"`` (adding the interfaces to the assembly graph).
+    calls : dict[str, int]
+        The number of times every stage was entered.
+    counts : dict[str, int]
+        Event counts, for example the number of ``"candidate pairs"``, ``"face pairs"``, and ``"interfaces"``.
+    rejections : dict[str, int]
+        The number of rejected face pairs per reason:
+        ``"bbox"`` (bounding boxes don't overlap),
+        ``"tmax"`` (not coplanar within the tolerance),
+        ``"amin"`` (face or contact area smaller than the minimum),
+        and ``"no intersection"``.
+    slowest : list[tuple[float, hashable, hashable]]
+        The time in seconds and the nodes of the slowest block pairs, slowest first.
+
+    """
+
+    def __init__(self, nslowest=10):
+        self.nslowest = nslowest
+        self.timings = {}
+        self.calls = {}
+        self.counts = {}
+        self.rejections = {}
+        self._slowest = []
+        self._npairs = 0
+
+    def __repr__(self):
+        return "{}(timings={!r}, counts={!r}, rejections={!r})".format(type(self).__name__, self.timings, self.counts, self.rejections)
+
+    @property
+    def slowest(self):
+        return [(seconds, u, v) for seconds, _, u, v in sorted(self._slowest, reverse=True)]
+
+    @contextmanager
+    def stage(self, name):
+        """Time a stage.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stage.
+
+        """
+        t0 = timer()
+        try:
+            yield
+        finally:
+            self.add_time(name, timer() - t0)
+
+    def add_time(self, name, seconds):
+        """Add time to a stage.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stage.
+        seconds : float
+            The elapsed time.
+
+        Returns
+        -------
+        None
+
+        """
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def count(self, name, n=1):
+        """Increment an event counter.
+
+        Parameters
+        ----------
+        name : str
+            The name of the counter.
+        n : int, optional
+            The increment.
+
+        Returns
+        -------
+        None
+
+        """
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def reject(self, reason, n=1):
+        """Increment the number of rejected face pairs for a reason.
+
+        Parameters
+        ----------
+        reason : str
+            The reason of the rejection.
+        n : int, optional
+            The increment.
+
+        Returns
+        -------
+        None
+
+        """
+        if n:
+            self.rejections[reason] = self.rejections.get(reason, 0) + n
+
+    def add_pair(self, u, v, seconds):
+        """Record the time spent on a pair of blocks.
+
+        Parameters
+        ----------
+        u : hashable
+            The node of the first block.
+        v : hashable
+            The node of the second block.
+        seconds : float
+            The elapsed time.
+
+        Returns
+        -------
+        None
+
+        """
+        if not self.nslowest:
+            return
+        # the counter breaks ties without comparing the nodes
+        self._npairs += 1
+        item = (seconds, -self._npairs, u, v)
+        if len(self._slowest) < self.nslowest:
+            heapq.heappush(self._slowest, item)
+        elif seconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, item)
+
+    def to_data(self):
+        """Convert the collected statistics to a dict of plain values.
+
+        Returns
+        -------
+        dict
+
+        """
+        return {
+            "timings": dict(self.timings),
+            "calls": dict(self.calls),
+            "counts": dict(self.counts),
+            "rejections": dict(self.rejections),
+            "slowest": [{"seconds": seconds, "pair": [u, v]} for seconds, u, v in self.slowest],
+        }
+
+    def to_json(self, filepath, pretty=False):
+        """Write the collected statistics to a JSON file.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the file.
+        pretty : bool, optional
+            If True, the file is indented.
+
+        Returns
+        -------
+        None
+
+        """
+        with open(filepath, "w") as f:
+            json.dump(self.to_data(), f, indent=4 if pretty else None, default=repr)
+
+    def summary(self):
+        """Format the collected statistics as a table.
+
+        Returns
+        -------
+        str
+
+        """
+        lines = []
+        total = sum(self.timings.values()) or 1.0
+        for name, seconds in sorted(self.timings.items(), key=lambda item: -item[1]):
+            lines.append("{:<26} {:>10.4f} s {:>6.1%} {:>8} calls".format(name, seconds, seconds / total, self.calls[name]))
+        for name, n in sorted(self.counts.items()):
+            lines.append("{:<26} {:>10}".format(name, n))
+        for reason, n in sorted(self.rejections.items()):
+            lines.append("{:<26} {:>10}".format("rejected: " + reason, n))
+        for seconds, u, v in self.slowest:
+            lines.append("{:<26} {:>10.4f} s".format("pair {!r}-{!r}".format(u, v), seconds))
+        return "\n".join(lines)
@@ -1,7 +1,25 @@
 from __future__ import absolute_import
 
+import compas
+
 from .block import Block
+from .spatialindex import SpatialIndex
 from .interface import Interface
 from .assembly import Assembly
+from .lazy import LazyData
+from .lazy import LazyBlock
+from .lazy import LazyInterface
+from .jsonstream import assembly_json_chunks
+from .jsonstream import assembly_json_dump
+from .jsonstream import assembly_json_load
+
+__all__ = ["Block", "Interface", "Assembly", "SpatialIndex", "LazyData", "LazyBlock", "LazyInterface", "assembly_json_chunks", "assembly_json_dump", "assembly_json_load"]
+
+if not compas.IPY:
+    from .blockbuffer import BlockBuffer
+    from .blockbuffer import BlockView
+    from .interfacearrays import InterfaceArrays
+    from .binary import assembly_to_binary
+    from .binary import assembly_from_binary
 
-__all__ = ["Block", "Interface", "Assembly"]
+    __all__ += ["BlockBuffer", "BlockView", "InterfaceArrays", "assembly_to_binary", "assembly_from_binary"]
@@ -2,11 +2,14 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from copy import deepcopy
+
 from compas.datastructures import Datastructure
 from compas.datastructures import Graph
 from compas.geometry import Line
 from compas.geometry import Point
 from compas_assembly.datastructures import Block
+from compas_assembly.datastructures.spatialindex import SpatialIndex
 
 
 class AssemblyError(Exception):
@@ -51,12 +54,19 @@ class Assembly(Datastructure):
             block = assembly.graph.node_attribute(node, "block")
             if block:
                 assembly._blocks[block.guid] = node
+                if not isinstance(block, Block):
+                    assembly._buffer = block.buffer
         return assembly
 
     def __init__(self, name=None, **kwargs):
         super(Assembly, self).__init__()
 
         self._blocks = {}
+        self._index = None
+        self._buffer = None
+        self._interface_arrays = None
+        self._interface_forces = None
+        self._shared_interfaces = False
         self.attributes = {"name": name or "Assembly"}
         self.attributes.update(kwargs)
         self.graph = Graph()
@@ -79,6 +89,29 @@ class Assembly(Datastructure):
     # properties
     # ==========================================================================
 
+    @property
+    def spatial_index(self):
+        """:class:`compas_assembly.datastructures.SpatialIndex` - The bounding boxes of the blocks, per node.
+
+        The index is built the first time it is accessed,
+        and kept up to date when blocks are added or removed, or when interfaces are updated.
+        """
+        if self._index is None:
+            self._index = SpatialIndex()
+            self._index.build({node: self.node_box(node) for node in self.graph.nodes()})
+        return self._index
+
+    @property
+    def buffer(self):
+        """:class:`compas_assembly.datastructures.BlockBuffer` - The shared array storage of the blocks, if the assembly is compact.
+
+        See Also
+        --------
+        :meth:`Assembly.compact`
+
+        """
+        return self._buffer
+
     # ==========================================================================
     # customization
     # ==========================================================================
@@ -92,19 +125,37 @@ class Assembly(Datastructure):
     # ==========================================================================
 
     @classmethod
-    def from_template(cls, template, identify_interfaces=False, **kwargs):
+    def from_template(cls, template, identify_interfaces=False, compact=False, **kwargs):
         """Construct an assembly from a parameteric template.
 
+        Parameters
+        ----------
+        template : :class:`compas_assembly.geometry.Geometry`
+            The template.
+        identify_interfaces : bool, optional
+            If True, the interfaces between the blocks are identified.
+        compact : bool, optional
+            If True, the vertices of all blocks are computed at once with :meth:`compas_assembly.geometry.Geometry.blocks_numpy`,
+            and stored in a shared buffer, without constructing a mesh per block.
+
         Returns
         -------
         :class:`Assembly`
 
+        See Also
+        --------
+        :meth:`Assembly.compact`
+
         """
-        assembly = cls()
-        for mesh in template.blocks():
-            block = mesh.copy(cls=Block)
-            x, y, z = block.centroid()
-            assembly.add_block(block, x=x, y=y, z=z)
+        if compact:
+            vertices, faces = template.blocks_numpy()
+            attrs = [{"x": x, "y": y, "z": z} for x, y, z in vertices.mean(axis=1).tolist()]
+            assembly = cls.from_arrays(vertices, faces, attrs=attrs)
+        else:
+            assembly = cls()
+            blocks = [Block.from_mesh(mesh, copy=False) for mesh in template.blocks()]
+            attrs = [{"x": x, "y": y, "z": z} for x, y, z in (block.centroid() for block in blocks)]
+            assembly.add_blocks(blocks, attrs=attrs)
 
         if identify_interfaces:
             from compas_assembly.algorithms import assembly_interfaces
@@ -112,6 +163,67 @@ class Assembly(Datastructure):
             assembly_interfaces(assembly)
         return assembly
 
+    @classmethod
+    def from_arrays(cls, vertices, faces, offsets=None, attrs=None, compact=True):
+        """Construct an assembly from the stacked vertices and faces of its blocks.
+
+        Parameters
+        ----------
+        vertices : array_like
+            The vertices of the blocks, with shape (n, v, 3) if all blocks have the same topology,
+            or with shape (V, 3) otherwise.
+        faces : list[list[int]]
+            The face cycles shared by all blocks, if all blocks have the same topology,
+            or the face cycles of all blocks, concatenated, otherwise.
+            The vertex indices of the cycles are local to every block.
+        offsets : tuple[array_like, array_like], optional
+            The index of the first vertex and the index of the first face of every block, each with shape (n + 1,).
+            Required if the blocks don't have the same topology.
+        attrs : list[dict], optional
+            The node attributes of every block.
+        compact : bool, optional
+            If True, the blocks are views on one shared buffer.
+            Otherwise, they are regular blocks.
+
+        Returns
+        -------
+        :class:`Assembly`
+
+        Notes
+        -----
+        No intermediate meshes are constructed,
+        and the blocks are inserted with :meth:`Assembly.add_blocks`.
+
+        See Also
+        --------
+        :meth:`compas_assembly.geometry.Geometry.blocks_numpy`
+
+        """
+        from numpy import asarray
+        from numpy import cumsum
+        from numpy import zeros
+
+        from compas_assembly.datastructures import BlockBuffer
+
+        if offsets is None:
+            buffer = BlockBuffer.from_stacked(vertices, faces)
+        else:
+            vertex_offsets, block_face_offsets = offsets
+            face_offsets = zeros(len(faces) + 1, dtype=int)
+            face_offsets[1:] = cumsum([len(face) for face in faces])
+            buffer = BlockBuffer(vertices, vertex_offsets, [vertex for face in faces for vertex in face], face_offsets, asarray(block_face_offsets))
+
+        if compact:
+            blocks = [buffer.view(index) for index in range(len(buffer))]
+        else:
+            blocks = [buffer.to_block(index) for index in range(len(buffer))]
+
+        assembly = cls()
+        assembly.add_blocks(blocks, attrs=attrs)
+        if compact:
+            assembly._buffer = buffer
+        return assembly
+
     @classmethod
     def from_polysurfaces(cls, guids, identify_interfaces=False, **kwargs):
         """Construct an assembly from Rhino polysurfaces.
@@ -173,6 +285,90 @@ class Assembly(Datastructure):
             assembly_interfaces(assembly)
         return assembly
 
+    @classmethod
+    def from_json(cls, filepath, lazy=False):
+        """Load an assembly from a COMPAS JSON file.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the file.
+        lazy : bool, optional
+            If True, the file is read incrementally,
+            and the blocks and interfaces are only decoded when they are first accessed.
+
+        Returns
+        -------
+        :class:`Assembly`
+
+        Raises
+        ------
+        TypeError
+            If the data in the file is not an assembly.
+
+        See Also
+        --------
+        :func:`compas_assembly.datastructures.assembly_json_load`
+
+        """
+        if not lazy:
+            return super(Assembly, cls).from_json(filepath)
+
+        from compas_assembly.datastructures import assembly_json_load
+
+        assembly = assembly_json_load(filepath, lazy=True)
+        if not isinstance(assembly, cls):
+            raise TypeError("The data in the file is not a {}.".format(cls))
+        return assembly
+
+    @classmethod
+    def from_binary(cls, filepath, lazy=True, mmap_mode="c"):
+        """Load an assembly from a file in the binary container format.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the file.
+        lazy : bool, optional
+            If True, the blocks are views on the memory-mapped block columns of the file.
+        mmap_mode : Literal["r", "c", "r+"] | None, optional
+            The mode for memory-mapping the columns.
+            If None, the columns are read into memory.
+
+        Returns
+        -------
+        :class:`Assembly`
+
+        See Also
+        --------
+        :func:`compas_assembly.datastructures.assembly_from_binary`
+
+        """
+        from compas_assembly.datastructures import assembly_from_binary
+
+        return assembly_from_binary(filepath, lazy=lazy, mmap_mode=mmap_mode)
+
+    def to_binary(self, filepath):
+        """Write the assembly to a file in the binary container format.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the file.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        :func:`compas_assembly.datastructures.assembly_to_binary`
+
+        """
+        from compas_assembly.datastructures import assembly_to_binary
+
+        assembly_to_binary(self, filepath)
+
     # ==========================================================================
     # builders
     # ==========================================================================
@@ -202,9 +398,60 @@ class Assembly(Datastructure):
             raise Exception("Block already exists in this assembly.")
         node = self.graph.add_node(node, block=block, attr_dict=attr_dict, **kwattr)
         self._blocks[block.guid] = node
+        self.invalidate_cache()
+        if self._index is not None:
+            self._index.insert(node, self.node_box(node))
         return node
 
-    def add_block_from_mesh(self, mesh, node=None, attr_dict=None, **kwattr):
+    def add_blocks(self, blocks, attrs=None):
+        """Add a sequence of blocks to the assembly at once.
+
+        Parameters
+        ----------
+        blocks : iterable[:class:`compas_assembly.datastructures.Block`]
+            The blocks to add.
+            The blocks are added as they are, without copying.
+        attrs : iterable[dict], optional
+            The attributes of every block.
+
+        Returns
+        -------
+        list[hashable]
+            The identifiers of the nodes in the graph corresponding to the blocks.
+
+        Raises
+        ------
+        Exception
+            If one of the blocks already exists in the assembly, or occurs more than once.
+            In that case, no blocks are added.
+
+        """
+        blocks = list(blocks)
+        attrs = [None] * len(blocks) if attrs is None else list(attrs)
+        guids = [block.guid for block in blocks]
+        if len(set(guids)) != len(guids) or any(guid in self._blocks for guid in guids):
+            raise Exception("Block already exists in this assembly.")
+
+        graph = self.graph
+        start = graph._max_node + 1
+        nodes = list(range(start, start + len(blocks)))
+        for node, block, attr in zip(nodes, blocks, attrs):
+            attr = dict(attr) if attr else {}
+            attr["block"] = block
+            graph.node[node] = attr
+            graph.edge[node] = {}
+            graph.adjacency[node] = {}
+        if nodes:
+            graph._max_node = nodes[-1]
+
+        self._blocks.update(zip(guids, nodes))
+        self.invalidate_cache()
+        if self._index is not None:
+            for node in nodes:
+                self._index.insert(node, self.node_box(node))
+        return nodes
+
+    def add_block_from_mesh(self, mesh, node=None, attr_dict=None, copy=True, **kwattr):
         """Add a block to the assembly from a normal mesh.
 
         Parameters
@@ -216,6 +463,9 @@ class Assembly(Datastructure):
             If no value is provided, the identifier will be generated automatically by the graph.
         attr_dict : dict, optional
             A dictionary of block attributes.
+        copy : bool, optional
+            If False, the mesh itself is turned into a block, without copying its data.
+            See :meth:`compas_assembly.datastructures.Block.from_mesh`.
         **kwatr : dict, optional
             Additional attributes in the form of named function parameters.
 
@@ -225,7 +475,7 @@ class Assembly(Datastructure):
             The identifier of the node in the graph corresponding to the block.
 
         """
-        block = mesh.copy(cls=Block)
+        block = Block.from_mesh(mesh, copy=copy)
         return self.add_block(block, node=node, attr_dict=attr_dict, **kwattr)
 
     def add_block_block_interfaces(self, a, b, interfaces):
@@ -260,8 +510,173 @@ class Assembly(Datastructure):
         v = self.block_node(b)
 
         edge = self.graph.add_edge(u, v, interfaces=interfaces)
+        self.invalidate_cache()
         return edge
 
+    def remove_block(self, block):
+        """Remove a block and all its interfaces from the assembly.
+
+        Parameters
+        ----------
+        block : :class:`compas_assembly.datastructures.Block`
+            The block to remove.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        AssemblyError
+            If the block is not part of the assembly.
+
+        """
+        if not self.has_block(block):
+            raise AssemblyError("Block is not part of the assembly.")
+        node = self._blocks.pop(block.guid)
+        self.graph.delete_node(node)
+        self.invalidate_cache()
+        if self._index is not None:
+            self._index.remove(node)
+
+    def clear_interfaces(self):
+        """Remove all interfaces from the assembly.
+
+        Returns
+        -------
+        None
+
+        """
+        self.graph.edge = {node: {} for node in self.graph.nodes()}
+        self.graph.adjacency = {node: {} for node in self.graph.nodes()}
+        self.invalidate_cache()
+
+    def update_interfaces(self, nodes, tmax=1e-6, amin=1e-1):
+        """Update the interfaces of the assembly after a number of blocks were added, removed, or moved.
+
+        Parameters
+        ----------
+        nodes : list[hashable]
+            The identifiers of the nodes of which the blocks have changed.
+        tmax : float, optional
+            Maximum deviation from the perfectly flat interface plane.
+        amin : float, optional
+            Minimum area of a "face-face" interface.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        :func:`compas_assembly.algorithms.assembly_update_interfaces`
+
+        """
+        from compas_assembly.algorithms import assembly_update_interfaces
+
+        assembly_update_interfaces(self, nodes, tmax=tmax, amin=amin)
+
+    def invalidate_cache(self):
+        """Remove the cached arrays of the interfaces, and the array of interface forces.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The cache is invalidated automatically when blocks or interfaces are added or removed through the methods of the assembly.
+        Modifications of the interfaces through the graph directly, or of the geometry of individual interfaces,
+        require a call to this method.
+
+        The forces of the interfaces are not lost.
+        They remain available through the individual interfaces.
+
+        """
+        self._interface_arrays = None
+        self._interface_forces = None
+
+    def _unshare_interfaces(self):
+        # replace interfaces that may be shared with a copy of the assembly by copies, before modifying them
+        if not self._shared_interfaces:
+            return
+        for u, nbrs in self.graph.edge.items():
+            for v, attr in nbrs.items():
+                if attr.get("interfaces"):
+                    attr["interfaces"] = [interface.copy(copy_guid=True) for interface in attr["interfaces"]]
+        self._shared_interfaces = False
+
+    # ==========================================================================
+    # storage
+    # ==========================================================================
+
+    def interface_arrays(self):
+        """Collect the geometry and topology of all interfaces in contiguous arrays.
+
+        Returns
+        -------
+        :class:`compas_assembly.datastructures.InterfaceArrays`
+
+        Notes
+        -----
+        The arrays are collected the first time this method is called,
+        and shared by subsequent calls until the interfaces change.
+        They should not be modified.
+
+        See Also
+        --------
+        :meth:`Assembly.invalidate_cache`
+
+        """
+        if self._interface_arrays is None:
+            from compas_assembly.datastructures import InterfaceArrays
+
+            self._interface_arrays = InterfaceArrays.from_assembly(self)
+        return self._interface_arrays
+
+    def compact(self):
+        """Store the geometry of all blocks in one shared array buffer.
+
+        Every block is replaced by a :class:`compas_assembly.datastructures.BlockView`
+        with the same GUID and attributes.
+
+        Returns
+        -------
+        :class:`compas_assembly.datastructures.BlockBuffer`
+
+        Notes
+        -----
+        Only the vertex coordinates and face cycles of the blocks are kept.
+        Custom vertex and face attributes are lost.
+
+        Blocks that are added after compacting remain regular blocks, until the assembly is compacted again.
+
+        """
+        from compas_assembly.datastructures import BlockBuffer
+
+        nodes = list(self.graph.nodes())
+        blocks = [self.node_block(node) for node in nodes]
+        buffer = BlockBuffer.from_blocks(blocks)
+        for index, (node, block) in enumerate(zip(nodes, blocks)):
+            view = buffer.view(index, guid=block.guid, name=block._name, attributes=block.attributes)
+            self.graph.node_attribute(node, "block", view)
+        self._buffer = buffer
+        return buffer
+
+    def expand(self):
+        """Convert all block views of a compact assembly back to regular blocks.
+
+        Returns
+        -------
+        None
+
+        """
+        for node in self.graph.nodes():
+            block = self.node_block(node)
+            if not isinstance(block, Block):
+                self.graph.node_attribute(node, "block", block.to_block())
+        self._buffer = None
+
     # ==========================================================================
     # verification
     # ==========================================================================
@@ -467,6 +882,22 @@ class Assembly(Datastructure):
         block = self.node_block(node)
         return Point(*block.centroid())
 
+    def node_box(self, node):
+        """Compute the axis-aligned bounding box of the block of a node.
+
+        Parameters
+        ----------
+        node : hashable
+            The identifier of the node.
+
+        Returns
+        -------
+        tuple[float, float, float, float, float, float]
+            The box as ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+
+        """
+        return self.node_block(node).bounds()
+
     def edge_line(self, edge):
         """Retrieve the line segment between the nodes of the edge.
 
@@ -485,6 +916,105 @@ class Assembly(Datastructure):
         b = self.node_point(v)
         return Line(a, b)
 
+    # ==========================================================================
+    # spatial queries
+    # ==========================================================================
+
+    def blocks_in_box(self, box, tol=0.0):
+        """Find the blocks of which the bounding box overlaps with a given box.
+
+        Parameters
+        ----------
+        box : tuple[float, float, float, float, float, float]
+            The query box as ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+        tol : float, optional
+            The query box is inflated by this amount.
+
+        Returns
+        -------
+        list[hashable]
+            The nodes of the blocks.
+
+        See Also
+        --------
+        :attr:`Assembly.spatial_index`
+
+        """
+        return self.spatial_index.query_box(box, tol=tol)
+
+    def blocks_near(self, point, radius):
+        """Find the blocks of which the bounding box is within a given distance from a point.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`compas.geometry.Point`
+            The query point.
+        radius : float
+            The maximum distance.
+
+        Returns
+        -------
+        list[hashable]
+            The nodes of the blocks.
+
+        """
+        return self.spatial_index.query_sphere(point, radius)
+
+    def k_nearest(self, point, k=1):
+        """Find the blocks of which the bounding box is closest to a point.
+
+        Parameters
+        ----------
+        point : [float, float, float] | :class:`compas.geometry.Point`
+            The query point.
+        k : int, optional
+            The number of blocks.
+
+        Returns
+        -------
+        list[hashable]
+            The nodes of at most ``k`` blocks, sorted by increasing distance.
+
+        """
+        return [node for _, node in self.spatial_index.nearest(point, k=k)]
+
+    def ray_pick(self, origin, direction):
+        """Find the first block hit by a ray.
+
+        Parameters
+        ----------
+        origin : [float, float, float] | :class:`compas.geometry.Point`
+            The start point of the ray.
+        direction : [float, float, float] | :class:`compas.geometry.Vector`
+            The direction of the ray.
+
+        Returns
+        -------
+        hashable | None
+            The node of the block, or None if no block is hit.
+
+        Notes
+        -----
+        The candidate blocks are found with the spatial index, in the order in which the ray enters their bounding boxes.
+        The faces of the candidates are then intersected with the ray,
+        until no remaining bounding box can contain a closer hit.
+
+        """
+        best = None
+        tbest = None
+        for tbox, node in self.spatial_index.query_ray(origin, direction):
+            if tbest is not None and tbox > tbest:
+                break
+            vertices, faces = self.node_block(node).to_vertices_and_faces()
+            for face in faces:
+                a = vertices[face[0]]
+                for i in range(1, len(face) - 1):
+                    t = _ray_triangle(origin, direction, a, vertices[face[i]], vertices[face[i + 1]])
+                    if t is not None and (tbest is None or t < tbest):
+                        best = node
+                        tbest = t
+        return best
+
     # ==========================================================================
     # boundary conditions
     # ==========================================================================
@@ -531,53 +1061,400 @@ class Assembly(Datastructure):
         for node in nodes:
             self.graph.node_attribute(node, "is_support", True)
 
+    # ==========================================================================
+    # forces
+    # ==========================================================================
+
+    def set_interface_forces(self, forces):
+        """Set the contact forces at the corners of all interfaces at once.
+
+        Parameters
+        ----------
+        forces : array_like
+            The force components at all interface corners, in the order of :meth:`Assembly.interface_arrays`.
+            With shape (P, 4), or a flat vector of size 4P, the components per corner are ``c_np``, ``c_nn``, ``c_u``, ``c_v``.
+            With shape (P, 3), or a flat vector of size 3P, the components per corner are ``n``, ``u``, ``v``,
+            as in the columns of :func:`compas_assembly.algorithms.assembly_equilibrium_matrix`.
+            Positive normal components are stored as ``c_np``, negative ones as ``c_nn``.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the number of values doesn't match the number of interface corners.
+
+        Notes
+        -----
+        The forces are stored in one array on the assembly.
+        The :attr:`Interface.forces` of every interface is a view on the rows of its corners,
+        which is only converted to a list of dicts when it is accessed.
+
+        """
+        from numpy import asarray
+        from numpy import float64
+        from numpy import maximum
+        from numpy import zeros
+
+        arrays = self.interface_arrays()
+        p = len(arrays.points)
+        forces = asarray(forces, dtype=float64)
+
+        if forces.size == 4 * p and forces.shape in ((p, 4), (4 * p,)):
+            forces = forces.reshape((p, 4)).copy()
+        elif forces.size == 3 * p and forces.shape in ((p, 3), (3 * p,)):
+            nuv = forces.reshape((p, 3))
+            forces = zeros((p, 4), dtype=float64)
+            forces[:, 0] = maximum(nuv[:, 0], 0.0)
+            forces[:, 1] = maximum(-nuv[:, 0], 0.0)
+            forces[:, 2:] = nuv[:, 1:]
+        else:
+            raise ValueError("The shape of the forces {} doesn't match the number of interface corners: {}".format(forces.shape, p))
+
+        self._unshare_interfaces()
+        offsets = arrays.point_offsets.tolist()
+        for k, interface in enumerate(self.interfaces()):
+            interface._force_view = (forces, offsets[k], offsets[k + 1])
+        self._interface_forces = forces
+
+    def interface_forces(self):
+        """Collect the contact forces at the corners of all interfaces in one array.
+
+        Returns
+        -------
+        ndarray
+            The components ``c_np``, ``c_nn``, ``c_u``, ``c_v`` at all interface corners, with shape (P, 4),
+            in the order of :meth:`Assembly.interface_arrays`.
+            The corners of interfaces without forces have zero components.
+
+        Notes
+        -----
+        If the forces were set with :meth:`Assembly.set_interface_forces`, and none of the interfaces was modified since,
+        the stored array is returned without copying.
+
+        """
+        from numpy import asarray
+        from numpy import float64
+        from numpy import zeros
+
+        from compas_assembly.datastructures.interface import FORCE_COMPONENTS
+
+        store = self._interface_forces
+        interfaces = list(self.interfaces())
+        if store is not None and all(interface.force_view is not None and interface.force_view[0] is store for interface in interfaces):
+            return store
+
+        arrays = self.interface_arrays()
+        offsets = arrays.point_offsets.tolist()
+        forces = zeros((len(arrays.points), 4), dtype=float64)
+        for k, interface in enumerate(interfaces):
+            if interface.force_view is not None:
+                view, start, end = interface.force_view
+                forces[offsets[k] : offsets[k + 1]] = view[start:end]
+            elif interface.forces:
+                forces[offsets[k] : offsets[k + 1]] = asarray([[force[name] for name in FORCE_COMPONENTS] for force in interface.forces], dtype=float64)
+        return forces
+
     # ==========================================================================
     # methods
     # ==========================================================================
 
+    def copy(self, cls=None, copy_guid=False):
+        """Make an independent copy of the assembly.
+
+        Parameters
+        ----------
+        cls : type[:class:`Assembly`], optional
+            The type of assembly to return.
+            Defaults to the type of the current assembly.
+        copy_guid : bool, optional
+            If True, the copy will have the same guid as the original.
+
+        Returns
+        -------
+        :class:`Assembly`
+
+        Notes
+        -----
+        The copy is made structurally, without a serialization round trip of the blocks and interfaces.
+        The blocks of the copy have the same GUIDs as the original blocks.
+        Regular blocks are copied structurally (see :meth:`Block.copy`),
+        and the blocks of a compact assembly are views on a copy of the buffer that shares the face arrays.
+
+        The interfaces are shared with the original assembly, and copied on write:
+        modifications through the methods of either assembly first replace its interfaces by copies.
+        Interfaces that are modified directly are modified in both assemblies.
+
+        """
+        cls = cls or type(self)
+        assembly = cls()
+        assembly.attributes = deepcopy(self.attributes)
+        if self._name is not None:
+            assembly._name = self._name
+        if copy_guid:
+            assembly._guid = self.guid
+
+        buffer = self._buffer.copy() if self._buffer is not None else None
+        graph = Graph(default_node_attributes=deepcopy(self.graph.default_node_attributes), default_edge_attributes=deepcopy(self.graph.default_edge_attributes))
+        graph.attributes.update(deepcopy(self.graph.attributes))
+        graph._name = self.graph._name
+        for node, attr in self.graph.node.items():
+            attr = {name: value if name == "block" else deepcopy(value) for name, value in attr.items()}
+            block = attr.get("block")
+            if isinstance(block, Block):
+                attr["block"] = block.copy(copy_guid=True, structural=True)
+            elif block is not None and block.buffer is self._buffer:
+                attr["block"] = buffer.view(block.index, guid=block.guid, name=block._name, attributes=block.attributes)
+            elif block is not None:
+                attr["block"] = block.to_block()
+            graph.node[node] = attr
+        for u, nbrs in self.graph.edge.items():
+            graph.edge[u] = {}
+            for v, attr in nbrs.items():
+                attr = {name: list(value) if name == "interfaces" and value else deepcopy(value) for name, value in attr.items()}
+                graph.edge[u][v] = attr
+        graph.adjacency = {node: dict(nbrs) for node, nbrs in self.graph.adjacency.items()}
+        graph._max_node = self.graph._max_node
+
+        assembly.graph = graph
+        assembly._blocks = dict(self._blocks)
+        assembly._buffer = buffer
+        assembly._interface_arrays = self._interface_arrays
+        assembly._interface_forces = self._interface_forces
+        assembly._shared_interfaces = self._shared_interfaces = True
+        return assembly
+
+    def _transform_blocks(self, M):
+        # transform the vertices of all blocks at once, with one matrix, or with one matrix per node
+        from numpy import asarray
+        from numpy import diff
+        from numpy import eye
+        from numpy import float64
+        from numpy import int64
+        from numpy import tile
+
+        from compas.geometry import Transformation
+
+        stacked = M.ndim == 3
+        blocks = [self.node_block(node) for node in self.graph.nodes()]
+        views = [(i, block) for i, block in enumerate(blocks) if not isinstance(block, Block) and block.buffer is self._buffer]
+        others = [(i, block) for i, block in enumerate(blocks) if isinstance(block, Block)]
+
+        if views and not stacked:
+            self._buffer.xyz[:] = _transform_points(self._buffer.xyz, M)
+        elif views:
+            buffer = self._buffer
+            matrices = tile(eye(4), (len(buffer), 1, 1))
+            matrices[[block.index for i, block in views]] = M[[i for i, block in views]]
+            owners = asarray(range(len(buffer)), dtype=int64).repeat(diff(buffer.vertex_offsets))
+            buffer.xyz[:] = _transform_points(buffer.xyz, matrices, owners)
+
+        if others:
+            xyz = [block.vertices_attributes("xyz") for i, block in others]
+            owners = asarray([i for (i, block), points in zip(others, xyz) for point in points], dtype=int64) if stacked else None
+            xyz = asarray([point for points in xyz for point in points], dtype=float64).reshape((-1, 3))
+            points = iter(_transform_points(xyz, M, owners).tolist())
+            for i, block in others:
+                for attr in block.vertex.values():
+                    attr["x"], attr["y"], attr["z"] = next(points)
+
+        for i, block in enumerate(blocks):
+            if isinstance(block, Block) or block.buffer is self._buffer:
+                block.invalidate_cache()
+            else:
+                block.transform(Transformation.from_matrix((M[i] if stacked else M).tolist()))
+        self._index = None
+
+    def _transform_interfaces(self, M):
+        # transform the points and frames of all interfaces at once, with one matrix, or with the matrix of the "from" node of every edge
+        arrays = self.interface_arrays()
+        if not len(arrays):
+            return
+        self._unshare_interfaces()
+
+        owners = arrays.edges[:, 0] if M.ndim == 3 else None
+        points = _transform_points(arrays.points, M, None if owners is None else owners[arrays.owners])
+        origins = _transform_points(arrays.origins, M, owners)
+        uvw = _transform_vectors(arrays.uvw, M, owners)
+        rigid = _is_rigid(M)
+        sizes = None if rigid else _polygon_areas(points, arrays.point_offsets, arrays.owners).tolist()
+
+        coordinates = points.tolist()
+        offsets = arrays.point_offsets.tolist()
+        for k, (interface, origin, axes) in enumerate(zip(self.interfaces(), origins.tolist(), uvw.tolist())):
+            interface._points = [Point(*point) for point in coordinates[offsets[k] : offsets[k + 1]]]
+            interface._frame = None
+            interface._frame_axes = (origin, axes[0], axes[1])
+            interface._mesh = None
+            interface._polygon = None
+            if not rigid:
+                interface.invalidate_cache()
+                if offsets[k + 1] > offsets[k]:
+                    interface.size = sizes[k]
+
+        if rigid:
+            from compas_assembly.datastructures import InterfaceArrays
+
+            self._interface_arrays = InterfaceArrays(arrays.nodes, arrays.edges, points, arrays.point_offsets, origins, uvw, arrays.sizes)
+        else:
+            self._interface_arrays = None
+
     def transform(self, T):
-        """Transform this assembly by the given transformation matrix.
+        """Transform this assembly by the given transformation matrix, or by one transformation matrix per block.
 
         Parameters
         ----------
-        T : Transformation
-            The transformation matrix.
+        T : :class:`compas.geometry.Transformation` | array_like
+            The transformation matrix,
+            or the transformation matrices of all blocks, with shape (n, 4, 4), in the order of :meth:`Assembly.nodes`.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the shape of the matrices doesn't match the number of blocks.
 
         Notes
         -----
         The assembly is transformed in place. No copy is made.
 
+        The vertices of all blocks, and the points and frames of all interfaces, are transformed at once.
+        With one matrix per block, the interfaces of an edge are transformed with the matrix of the "from" block of the edge.
+
+        The cached geometry of the blocks is cleared, and the spatial index is rebuilt when it is accessed.
+        If all transformations are rigid, the local coordinates and moments of the interfaces remain valid,
+        and the cached interface arrays are replaced by the transformed arrays.
+        Otherwise, they are recomputed when they are accessed,
+        and the sizes of the interfaces are replaced by the areas of their transformed polygons.
+        The meshes of the interfaces are regenerated from their transformed polygons,
+        and their frames are only constructed when they are accessed.
+
         Examples
         --------
         >>> assembly = Assembly.from_json("assembly.json")
         >>> R = Rotation.from_axis_and_angle([1.0, 0, 0], -pi / 2)
-        >>> assembly_transform(assembly, R)
+        >>> assembly.transform(R)
 
         """
-        for node in self.graph.nodes():
-            block = self.graph.node_attribute(node, "block")
-            block.transform(T)
+        M = _transformation_matrices(T, self.graph.number_of_nodes())
+        self._transform_blocks(M)
+        self._transform_interfaces(M)
 
     def transformed(self, T):
         """Transform a copy of this assembly by the given transformation matrix.
 
         Parameters
         ----------
-        T : Transformation
-            The transformation matrix.
+        T : :class:`compas.geometry.Transformation` | array_like
+            The transformation matrix,
+            or the transformation matrices of all blocks, with shape (n, 4, 4), in the order of :meth:`Assembly.nodes`.
 
         Returns
         -------
         Assembly
             The transformed copy.
 
+        Notes
+        -----
+        The copy is made with :meth:`Assembly.copy`, and transformed with :meth:`Assembly.transform`.
+        The interface arrays of this assembly are collected first,
+        such that they are shared by all transformed copies.
+
         Examples
         --------
         >>> assembly = Assembly.from_json("assembly.json")
         >>> R = Rotation.from_axis_and_angle([1.0, 0, 0], -pi / 2)
-        >>> transformed = assembly_transformed(assembly, R)
+        >>> transformed = assembly.transformed(R)
 
         """
+        self.interface_arrays()
         assembly = self.copy()
         assembly.transform(T)
         return assembly
+
+
+def _transformation_matrices(T, n):
+    # a single (4, 4) matrix, or a stack of (n, 4, 4) matrices
+    from numpy import asarray
+    from numpy import float64
+
+    from compas.geometry import Transformation
+
+    M = asarray(T.matrix if isinstance(T, Transformation) else T, dtype=float64)
+    if M.shape != (4, 4) and M.shape != (n, 4, 4):
+        raise ValueError("The shape of the transformation matrices {} doesn't match the number of blocks: {}".format(M.shape, n))
+    return M
+
+
+def _transform_points(points, M, owners=None):
+    # homogeneous transformation of points, by one matrix, or by the matrices of their owners
+    from numpy import einsum
+
+    if owners is None:
+        h = points @ M[:, :3].T + M[:, 3]
+    else:
+        h = einsum("pij,pj->pi", M[owners, :, :3], points) + M[owners, :, 3]
+    return h[:, :3] / h[:, 3:]
+
+
+def _transform_vectors(vectors, M, owners=None):
+    # transformation of stacked rows of vectors, with shape (k, r, 3), by the linear part of one matrix, or of the matrices of their owners
+    from numpy import einsum
+
+    if owners is None:
+        return vectors @ M[:3, :3].T
+    return einsum("kij,krj->kri", M[owners, :3, :3], vectors)
+
+
+def _polygon_areas(points, offsets, owners):
+    # the areas of stacked planar polygons, from the lengths of their Newell normals
+    from numpy import add
+    from numpy import arange
+    from numpy import cross
+    from numpy import float64
+    from numpy import zeros
+    from numpy.linalg import norm
+
+    following = arange(len(points)) + 1
+    nonempty = offsets[1:] > offsets[:-1]
+    following[offsets[1:][nonempty] - 1] = offsets[:-1][nonempty]
+    normals = zeros((len(offsets) - 1, 3), dtype=float64)
+    add.at(normals, owners, cross(points, points[following]))
+    return 0.5 * norm(normals, axis=1)
+
+
+def _is_rigid(M, tol=1e-9):
+    # rotations and translations only
+    from numpy import allclose
+    from numpy import eye
+    from numpy.linalg import det
+
+    R = M[..., :3, :3]
+    return allclose(R @ R.swapaxes(-1, -2), eye(3), atol=tol) and allclose(M[..., 3, :], [0.0, 0.0, 0.0, 1.0], atol=tol) and bool((det(R) > 0).all())
+
+
+def _ray_triangle(origin, direction, a, b, c, tol=1e-12):
+    # the parameter of the intersection of a ray with a triangle (Moller-Trumbore), or None
+    e1 = [b[0] - a[0], b[1] - a[1], b[2] - a[2]]
+    e2 = [c[0] - a[0], c[1] - a[1], c[2] - a[2]]
+    p = [direction[1] * e2[2] - direction[2] * e2[1], direction[2] * e2[0] - direction[0] * e2[2], direction[0] * e2[1] - direction[1] * e2[0]]
+    det = e1[0] * p[0] + e1[1] * p[1] + e1[2] * p[2]
+    if abs(det) < tol:
+        return None
+    s = [origin[0] - a[0], origin[1] - a[1], origin[2] - a[2]]
+    u = (s[0] * p[0] + s[1] * p[1] + s[2] * p[2]) / det
+    if u < 0 or u > 1:
+        return None
+    q = [s[1] * e1[2] - s[2] * e1[1], s[2] * e1[0] - s[0] * e1[2], s[0] * e1[1] - s[1] * e1[0]]
+    v = (direction[0] * q[0] + direction[1] * q[1] + direction[2] * q[2]) / det
+    if v < 0 or u + v > 1:
+        return None
+    t = (e2[0] * q[0] + e2[1] * q[1] + e2[2] * q[2]) / det
+    if t < 0:
+        return None
+    return t
@@ -0,0 +1,492 @@
+"""
+A binary container format for assemblies.
+
+Layout
+------
+A file consists of
+
+1. the 8 byte magic string ``b"CASMBIN1"``,
+2. the length of the header as a little-endian unsigned 64 bit integer,
+3. the header, as UTF-8 encoded COMPAS JSON,
+4. the data columns, as raw C-contiguous arrays, every column aligned to 64 bytes.
+
+The header contains the general attributes of the assembly and of its graph,
+all attributes that are not stored in columns,
+and the ``"columns"`` table with the type, shape, and offset of every column relative to the start of the file.
+
+The geometry of the blocks is stored in the layout of :class:`compas_assembly.datastructures.BlockBuffer`,
+such that the blocks of a loaded assembly are views on memory-mapped arrays,
+and are only read from disk when they are accessed.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import struct
+from ast import literal_eval
+from uuid import UUID
+
+import numpy
+from numpy import array
+from numpy import ascontiguousarray
+from numpy import empty
+from numpy import float64
+from numpy import int8
+from numpy import int64
+from numpy import isnan
+from numpy import nan
+from numpy import uint8
+from numpy import zeros
+
+import compas
+from compas_assembly.datastructures.assembly import Assembly
+from compas_assembly.datastructures.block import Block
+from compas_assembly.datastructures.blockbuffer import BlockBuffer
+from compas_assembly.datastructures.blockbuffer import BlockView
+from compas_assembly.datastructures.interface import FORCE_COMPONENTS
+from compas_assembly.datastructures.interface import Interface
+
+MAGIC = b"CASMBIN1"
+VERSION = 1
+ALIGNMENT = 64
+
+
+def assembly_to_binary(assembly, filepath):
+    """Write an assembly to a file in the binary container format.
+
+    Parameters
+    ----------
+    assembly : :class:`compas_assembly.datastructures.Assembly`
+        The assembly.
+    filepath : str
+        The path of the file.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    The vertex coordinates and face cycles of the blocks, the edges, the interface polygons, sizes, and frames,
+    and the contact forces are stored as typed columns.
+    Blocks with custom vertex, face, or edge data, and interfaces with forces that are not defined
+    by the four standard components per corner, are stored in the header instead.
+    The meshes of the interfaces are not stored, but regenerated from the interface polygons.
+
+    """
+    graph = assembly.graph
+    nodes = list(graph.nodes())
+    node_index = {node: index for index, node in enumerate(nodes)}
+
+    header = {
+        "format": "compas_assembly.binary",
+        "version": VERSION,
+        "attributes": assembly.attributes,
+        "graph": {
+            "attributes": graph.attributes,
+            "default_node_attributes": graph.default_node_attributes,
+            "default_edge_attributes": graph.default_edge_attributes,
+            "max_node": graph._max_node,
+        },
+    }
+    columns = {}
+
+    # nodes
+
+    if all(isinstance(node, int) for node in nodes):
+        columns["nodes"] = array(nodes, dtype=int64)
+    else:
+        header["nodes"] = [repr(node) for node in nodes]
+
+    is_support = zeros(len(nodes), dtype=int8) - 1
+    displacement = zeros((len(nodes), 6), dtype=float64)
+    has_displacement = zeros(len(nodes), dtype=uint8)
+    node_attributes = {}
+
+    for index, node in enumerate(nodes):
+        attr = dict(graph.node[node])
+        attr.pop("block", None)
+        value = attr.get("is_support")
+        if isinstance(value, bool):
+            is_support[index] = value
+            del attr["is_support"]
+        value = attr.get("displacement")
+        if isinstance(value, (list, tuple)) and len(value) == 6 and all(isinstance(x, (int, float)) for x in value):
+            displacement[index] = value
+            has_displacement[index] = 1
+            del attr["displacement"]
+        if attr:
+            node_attributes[index] = attr
+
+    columns["node_is_support"] = is_support
+    columns["node_displacement"] = displacement
+    columns["node_has_displacement"] = has_displacement
+    header["node_attributes"] = node_attributes
+
+    # blocks
+
+    blocks = []
+    guids = zeros((len(nodes), 16), dtype=uint8)
+    names = {}
+    block_attributes = {}
+    types = {}
+    meshes = {}
+    missing = []
+
+    for index, node in enumerate(nodes):
+        block = assembly.node_block(node)
+        if block is None:
+            missing.append(index)
+            blocks.append(_EMPTY)
+            continue
+        guids[index] = numpy.frombuffer(block.guid.bytes, dtype=uint8)
+        if block._name:
+            names[index] = block._name
+        if block.attributes != {"node": None}:
+            block_attributes[index] = block.attributes
+        if not isinstance(block, (Block, BlockView)):
+            types[index] = "{}/{}".format(type(block).__module__, type(block).__name__)
+        if isinstance(block, BlockView) or _is_plain(block):
+            blocks.append(block)
+        else:
+            meshes[index] = block.__data__
+            blocks.append(_EMPTY)
+
+    buffer = BlockBuffer.from_blocks(blocks)
+    columns["block_guids"] = guids
+    columns["block_xyz"] = buffer.xyz
+    columns["block_vertex_offsets"] = buffer.vertex_offsets
+    columns["block_faces"] = buffer.faces
+    columns["block_face_offsets"] = buffer.face_offsets
+    columns["block_block_face_offsets"] = buffer.block_face_offsets
+    header["blocks"] = {"names": names, "attributes": block_attributes, "types": types, "meshes": meshes, "missing": missing}
+
+    # edges and interfaces
+
+    edges = list(graph.edges())
+    edge_array = array([[node_index[u], node_index[v]] for u, v in edges], dtype=int64).reshape((-1, 2))
+    interfaces_state = zeros(len(edges), dtype=int8)
+    edge_interface_offsets = [0]
+    edge_attributes = {}
+
+    points = []
+    point_offsets = [0]
+    sizes = []
+    frames = []
+    has_forces = []
+    forces = []
+    interface_forces = {}
+
+    for index, (u, v) in enumerate(edges):
+        attr = dict(graph.edge[u][v])
+        if "interfaces" not in attr:
+            interfaces_state[index] = -1
+            interfaces = []
+        elif attr["interfaces"] is None:
+            interfaces_state[index] = 0
+            interfaces = []
+        else:
+            interfaces_state[index] = 1
+            interfaces = attr["interfaces"]
+        attr.pop("interfaces", None)
+        if attr:
+            edge_attributes[index] = attr
+
+        for interface in interfaces:
+            k = len(sizes)
+            corners = [list(point) for point in interface.points]
+            points.extend(corners)
+            point_offsets.append(len(points))
+            sizes.append(nan if interface.size is None else interface.size)
+            if interface._frame is None and interface._frame_axes is not None:
+                # the frame has not been constructed yet
+                origin, xaxis, yaxis = interface._frame_axes
+            else:
+                frame = interface.frame
+                origin, xaxis, yaxis = frame.point, frame.xaxis, frame.yaxis
+            frames.append(list(origin) + list(xaxis) + list(yaxis))
+            if interface.force_view is not None:
+                view, start, end = interface.force_view
+                has_forces.append(1)
+                forces.extend(view[start:end].tolist())
+            elif interface.forces is None:
+                has_forces.append(0)
+                forces.extend([[0.0] * 4] * len(corners))
+            elif _is_standard_forces(interface.forces, len(corners)):
+                has_forces.append(1)
+                forces.extend([[force[name] for name in FORCE_COMPONENTS] for force in interface.forces])
+            else:
+                has_forces.append(0)
+                forces.extend([[0.0] * 4] * len(corners))
+                interface_forces[k] = interface.forces
+        edge_interface_offsets.append(len(sizes))
+
+    columns["edges"] = edge_array
+    columns["edge_interfaces_state"] = interfaces_state
+    columns["edge_interface_offsets"] = array(edge_interface_offsets, dtype=int64)
+    columns["interface_points"] = array(points, dtype=float64).reshape((-1, 3))
+    columns["interface_point_offsets"] = array(point_offsets, dtype=int64)
+    columns["interface_sizes"] = array(sizes, dtype=float64)
+    columns["interface_frames"] = array(frames, dtype=float64).reshape((-1, 9))
+    columns["interface_has_forces"] = array(has_forces, dtype=uint8)
+    columns["interface_forces"] = array(forces, dtype=float64).reshape((-1, 4))
+    header["edge_attributes"] = edge_attributes
+    header["interface_forces"] = interface_forces
+
+    _write(filepath, header, columns)
+
+
+def assembly_from_binary(filepath, lazy=True, mmap_mode="c"):
+    """Load an assembly from a file in the binary container format.
+
+    Parameters
+    ----------
+    filepath : str
+        The path of the file.
+    lazy : bool, optional
+        If True, the blocks of the assembly are :class:`compas_assembly.datastructures.BlockView` objects
+        on the block columns of the file, and their geometry is only read when it is accessed.
+        The contact forces of the interfaces are only converted to dictionaries when they are accessed.
+        If False, the blocks are converted to regular blocks, and the forces to dictionaries.
+    mmap_mode : Literal["r", "c", "r+"] | None, optional
+        The mode for memory-mapping the columns.
+        With the default ``"c"`` (copy-on-write), blocks can be transformed without modifying the file.
+        If None, the columns are read into memory.
+
+    Returns
+    -------
+    :class:`compas_assembly.datastructures.Assembly`
+
+    Raises
+    ------
+    ValueError
+        If the file is not in the binary container format, or if its version is not supported.
+
+    Notes
+    -----
+    The frames of the interfaces are only constructed when they are accessed.
+
+    """
+    header, columns = _read(filepath, mmap_mode)
+
+    assembly = Assembly()
+    assembly.attributes.update(header["attributes"] or {})
+
+    graph = assembly.graph
+    graph.attributes.update(header["graph"]["attributes"] or {})
+    graph.default_node_attributes.update(header["graph"]["default_node_attributes"] or {})
+    graph.default_edge_attributes.update(header["graph"]["default_edge_attributes"] or {})
+
+    if "nodes" in columns:
+        nodes = columns["nodes"].tolist()
+    else:
+        nodes = [literal_eval(node) for node in header["nodes"]]
+
+    # blocks
+
+    buffer = BlockBuffer(
+        columns["block_xyz"],
+        columns["block_vertex_offsets"],
+        columns["block_faces"],
+        columns["block_face_offsets"],
+        columns["block_block_face_offsets"],
+    )
+    blocks = header["blocks"]
+    names = _int_keys(blocks["names"])
+    block_attributes = _int_keys(blocks["attributes"])
+    meshes = _int_keys(blocks["meshes"])
+    types = _int_keys(blocks["types"])
+    missing = set(blocks["missing"])
+    guids = columns["block_guids"]
+
+    node_attributes = _int_keys(header["node_attributes"])
+    is_support = columns["node_is_support"].tolist()
+    displacement = columns["node_displacement"].tolist()
+    has_displacement = columns["node_has_displacement"].tolist()
+
+    for index, node in enumerate(nodes):
+        attr = {}
+        if index not in missing:
+            guid = UUID(bytes=guids[index].tobytes())
+            cls = _block_type(types.get(index))
+            if index in meshes:
+                block = cls.__from_data__(meshes[index])
+                block._guid = guid
+                block.name = names.get(index)
+            else:
+                block = buffer.view(index, guid=guid, name=names.get(index), attributes=block_attributes.get(index))
+                if not lazy:
+                    block = block.to_block(cls=cls)
+            attr["block"] = block
+            assembly._blocks[guid] = node
+        if is_support[index] >= 0:
+            attr["is_support"] = bool(is_support[index])
+        if has_displacement[index]:
+            attr["displacement"] = displacement[index]
+        attr.update(node_attributes.get(index, {}))
+        graph.add_node(key=node, attr_dict=attr)
+
+    if lazy:
+        assembly._buffer = buffer
+
+    # edges and interfaces
+
+    edges = columns["edges"].tolist()
+    interfaces_state = columns["edge_interfaces_state"].tolist()
+    edge_interface_offsets = columns["edge_interface_offsets"].tolist()
+    edge_attributes = _int_keys(header["edge_attributes"])
+    interface_forces = _int_keys(header["interface_forces"])
+
+    points = columns["interface_points"].tolist()
+    point_offsets = columns["interface_point_offsets"].tolist()
+    sizes = columns["interface_sizes"]
+    sizes = [None if isnan(size) else size for size in sizes.tolist()]
+    frames = columns["interface_frames"].tolist()
+    has_forces = columns["interface_has_forces"].tolist()
+    forces = columns["interface_forces"]
+
+    for index, (i, j) in enumerate(edges):
+        attr = {}
+        state = interfaces_state[index]
+        if state == 0:
+            attr["interfaces"] = None
+        elif state == 1:
+            interfaces = []
+            for k in range(edge_interface_offsets[index], edge_interface_offsets[index + 1]):
+                p0 = point_offsets[k]
+                p1 = point_offsets[k + 1]
+                frame = frames[k]
+                interface = Interface(
+                    size=sizes[k],
+                    points=points[p0:p1],
+                    forces=interface_forces.get(k),
+                )
+                # the frame is only constructed when it is accessed
+                interface._frame_axes = (frame[0:3], frame[3:6], frame[6:9])
+                if has_forces[k]:
+                    if lazy:
+                        interface._force_view = (forces, p0, p1)
+                    else:
+                        interface.forces = [dict(zip(FORCE_COMPONENTS, force)) for force in forces[p0:p1].tolist()]
+                interfaces.append(interface)
+            attr["interfaces"] = interfaces
+        attr.update(edge_attributes.get(index, {}))
+        graph.add_edge(nodes[i], nodes[j], attr_dict=attr)
+
+    graph._max_node = header["graph"]["max_node"]
+    return assembly
+
+
+# ==============================================================================
+# helpers
+# ==============================================================================
+
+
+class _Empty(object):
+    """Stand-in for blocks that are not stored in the block columns."""
+
+    def vertex_index(self):
+        return {}
+
+    def vertices_attributes(self, names):
+        return []
+
+    def faces(self):
+        return []
+
+
+_EMPTY = _Empty()
+
+
+def _is_plain(block):
+    # blocks of which the data is fully described by the block columns
+    data = block.__data__
+    vertices = list(block.vertex)
+    faces = list(block.face)
+    if vertices != list(range(len(vertices))) or faces != list(range(len(faces))):
+        return False
+    if data["max_vertex"] != len(vertices) - 1 or data["max_face"] != len(faces) - 1:
+        return False
+    if any(data["facedata"].values()) or data["edgedata"]:
+        return False
+    if any(set(attr) != {"x", "y", "z"} for attr in block.vertex.values()):
+        return False
+    return data["default_vertex_attributes"] == Block().default_vertex_attributes and data["default_face_attributes"] == {} and data["default_edge_attributes"] == {}
+
+
+def _is_standard_forces(forces, n):
+    if len(forces) != n:
+        return False
+    for force in forces:
+        if not isinstance(force, dict) or set(force) != set(FORCE_COMPONENTS):
+            return False
+        if not all(isinstance(force[name], (int, float)) and not isinstance(force[name], bool) for name in FORCE_COMPONENTS):
+            return False
+    return True
+
+
+def _block_type(name):
+    if not name:
+        return Block
+    from importlib import import_module
+
+    module, cls = name.split("/")
+    return getattr(import_module(module), cls)
+
+
+def _int_keys(items):
+    return {int(key): value for key, value in (items or {}).items()}
+
+
+def _write(filepath, header, columns):
+    # the offsets depend on the length of the header, which depends on the offsets
+    # the table is therefore filled in twice, with room for offsets that grow in length
+    table = {name: {"type": column.dtype.str, "shape": list(column.shape), "offset": 0} for name, column in columns.items()}
+    header["columns"] = table
+    size = len(compas.json_dumps(header).encode("utf-8")) + 32 * len(table)
+    offset = _aligned(len(MAGIC) + 8 + size)
+    for name, column in columns.items():
+        table[name]["offset"] = offset
+        offset = _aligned(offset + column.nbytes)
+    data = compas.json_dumps(header).encode("utf-8")
+    data += b" " * (size - len(data))
+
+    with open(filepath, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", size))
+        f.write(data)
+        for name, column in columns.items():
+            f.write(b"\0" * (table[name]["offset"] - f.tell()))
+            f.write(ascontiguousarray(column).tobytes())
+
+
+def _read(filepath, mmap_mode):
+    with open(filepath, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError("Not an assembly binary container: {}".format(filepath))
+        (size,) = struct.unpack("<Q", f.read(8))
+        header = compas.json_loads(f.read(size).decode("utf-8"))
+
+    if header.get("version") != VERSION:
+        raise ValueError("Binary container version not supported: {}".format(header.get("version")))
+
+    columns = {}
+    for name, info in header["columns"].items():
+        shape = tuple(info["shape"])
+        dtype = numpy.dtype(info["type"])
+        if not all(shape) or mmap_mode is None:
+            column = empty(shape, dtype=dtype)
+            if all(shape):
+                with open(filepath, "rb") as f:
+                    f.seek(info["offset"])
+                    column = numpy.fromfile(f, dtype=dtype, count=column.size).reshape(shape)
+        else:
+            column = numpy.memmap(filepath, dtype=dtype, mode=mmap_mode, offset=info["offset"], shape=shape)
+        columns[name] = column
+    return header, columns
+
+
+def _aligned(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
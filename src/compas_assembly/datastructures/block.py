@@ -3,8 +3,11 @@ from __future__ import division
 from __future__ import print_function
 
 from compas.datastructures import Mesh
+from compas.geometry import Box
 from compas.geometry import Frame
 from compas.geometry import Point
+from compas.geometry import Vector
+from compas.geometry import bounding_box
 from compas.geometry import centroid_points
 from compas.geometry import centroid_polyhedron
 from compas.geometry import cross_vectors
@@ -13,9 +16,30 @@ from compas.geometry import volume_polyhedron
 
 
 class Block(Mesh):
-    """A data structure for the individual blocks of a discrete element assembly."""
+    """A data structure for the individual blocks of a discrete element assembly.
+
+    Notes
+    -----
+    The results of the geometric queries of a block (centroid, center of mass, volume,
+    face frames, face normals, top face, and bounding box) are cached.
+    The cache is invalidated automatically when the block is transformed,
+    when vertex attributes are modified through the attribute accessors,
+    when vertices or faces are added or removed,
+    and by the methods of :class:`compas.datastructures.Mesh` that modify the vertices or faces in place,
+    such as :meth:`unify_cycles`, :meth:`remove_duplicate_vertices`, :meth:`collapse_edge`, and :meth:`split_face`.
+    Modifications that bypass these methods, for example writing directly into ``block.vertex``,
+    require a call to :meth:`Block.invalidate_cache`.
+
+    The cache stores plain coordinates.
+    Queries returning points, vectors, frames, or boxes construct new objects on every call,
+    which can therefore be modified without affecting the cache.
+
+    """
 
     def __init__(self, node=None, **kwargs):
+        self._cache = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
         super(Block, self).__init__(**kwargs)
         self.attributes["node"] = None
         self.node = node
@@ -28,10 +52,74 @@ class Block(Mesh):
     def node(self, node):
         self.attributes["node"] = node
 
+    # ==========================================================================
+    # cache
+    # ==========================================================================
+
+    def _cached(self, key, compute):
+        try:
+            value = self._cache[key]
+        except KeyError:
+            self._cache_misses += 1
+            value = self._cache[key] = compute()
+            return value
+        self._cache_hits += 1
+        return value
+
+    def invalidate_cache(self):
+        """Remove all cached geometric properties of the block.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._cache:
+            self._cache.clear()
+
+    def cache_info(self):
+        """Report the usage of the geometry cache of the block.
+
+        Returns
+        -------
+        dict
+            The number of ``"hits"`` and ``"misses"``, and the current ``"size"`` of the cache.
+
+        """
+        return {"hits": self._cache_hits, "misses": self._cache_misses, "size": len(self._cache)}
+
     # ==========================================================================
     # constructors
     # ==========================================================================
 
+    @classmethod
+    def from_mesh(cls, mesh, copy=True):
+        """Construct a block from a mesh.
+
+        Parameters
+        ----------
+        mesh : :class:`compas.datastructures.Mesh`
+            The mesh.
+        copy : bool, optional
+            If False, the mesh itself is turned into a block, without copying its data.
+            The caller hands over ownership of the mesh, which should not be used as a regular mesh afterwards.
+
+        Returns
+        -------
+        :class:`Block`
+
+        """
+        if copy:
+            return mesh.copy(cls=cls)
+        if isinstance(mesh, cls):
+            return mesh
+        mesh.__class__ = cls
+        mesh._cache = {}
+        mesh._cache_hits = 0
+        mesh._cache_misses = 0
+        mesh.attributes.setdefault("node", None)
+        return mesh
+
     @classmethod
     def from_polysurface(cls, guid):
         """Class method for constructing a block from a Rhino poly-surface.
@@ -87,8 +175,10 @@ class Block(Mesh):
         :class:`compas.geometry.Point`
 
         """
-        x, y, z = centroid_points([self.vertex_coordinates(key) for key in self.vertices()])
-        return Point(x, y, z)
+        return Point(*self._cached("centroid", self._compute_centroid))
+
+    def _compute_centroid(self):
+        return tuple(centroid_points([self.vertex_coordinates(key) for key in self.vertices()]))
 
     def frames(self):
         """Compute the local frame of each face of the block.
@@ -99,7 +189,7 @@ class Block(Mesh):
             A dictionary mapping face identifiers to face frames.
 
         """
-        return {face: self.frame(face) for face in self.faces()}
+        return {face: Frame(*axes) for face, axes in self._frame_axes().items()}
 
     def frame(self, face):
         """Compute the frame of a specific face.
@@ -114,12 +204,19 @@ class Block(Mesh):
         :class:`compas.geometry.Frame`
 
         """
+        return Frame(*self._frame_axes()[face])
+
+    def _frame_axes(self):
+        return self._cached("frames", lambda: {face: self._compute_frame_axes(face) for face in self.faces()})
+
+    def _compute_frame_axes(self, face):
+        # the origin and the (not normalized) x and y axis of the frame of a face
         xyz = self.face_coordinates(face)
         o = self.face_center(face)
         w = self.face_normal(face)
         u = [xyz[1][i] - xyz[0][i] for i in range(3)]  # align with longest edge instead?
         v = cross_vectors(w, u)
-        return Frame(o, u, v)
+        return tuple(o), tuple(u), tuple(v)
 
     def top(self):
         """Identify the *top* face of the block.
@@ -130,10 +227,52 @@ class Block(Mesh):
             The identifier of the face.
 
         """
+        return self._cached("top", self._compute_top)
+
+    def _compute_top(self):
         z = [0, 0, 1]
-        faces = list(self.faces())
-        normals = [self.face_normal(face) for face in faces]
-        return sorted(zip(faces, normals), key=lambda x: dot_vectors(x[1], z))[-1][0]
+        normals = self._normals()
+        return sorted(normals.items(), key=lambda x: dot_vectors(x[1], z))[-1][0]
+
+    def normals(self):
+        """Compute the normal of each face of the block.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping face identifiers to face normals.
+
+        """
+        return {face: Vector(*normal) for face, normal in self._normals().items()}
+
+    def _normals(self):
+        return self._cached("normals", lambda: {face: tuple(self.face_normal(face)) for face in self.faces()})
+
+    def bounds(self):
+        """Compute the axis-aligned bounds of the block.
+
+        Returns
+        -------
+        tuple[float, float, float, float, float, float]
+            The bounds as ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+
+        """
+        return self._cached("bounds", self._compute_bounds)
+
+    def _compute_bounds(self):
+        xs, ys, zs = zip(*self.vertices_attributes("xyz"))
+        return min(xs), min(ys), min(zs), max(xs), max(ys), max(zs)
+
+    def aabb(self):
+        """Compute the axis-aligned bounding box of the block.
+
+        Returns
+        -------
+        :class:`compas.geometry.Box`
+
+        """
+        xmin, ymin, zmin, xmax, ymax, zmax = self.bounds()
+        return Box.from_bounding_box(bounding_box([[xmin, ymin, zmin], [xmax, ymax, zmax]]))
 
     def center(self):
         """Compute the center of mass of the block.
@@ -143,11 +282,13 @@ class Block(Mesh):
         :class:`compas.geometry.Point`
 
         """
+        return Point(*self._cached("center", self._compute_center))
+
+    def _compute_center(self):
         vertex_index = {vertex: index for index, vertex in enumerate(self.vertices())}
         vertices = [self.vertex_coordinates(vertex) for vertex in self.vertices()]
         faces = [[vertex_index[vertex] for vertex in self.face_vertices(face)] for face in self.faces()]
-        x, y, z = centroid_polyhedron((vertices, faces))
-        return Point(x, y, z)
+        return tuple(centroid_polyhedron((vertices, faces)))
 
     def volume(self):
         """Compute the volume of the block.
@@ -158,8 +299,174 @@ class Block(Mesh):
             The volume of the block.
 
         """
+        return self._cached("volume", self._compute_volume)
+
+    def _compute_volume(self):
         vertex_index = {vertex: index for index, vertex in enumerate(self.vertices())}
         vertices = [self.vertex_coordinates(vertex) for vertex in self.vertices()]
         faces = [[vertex_index[vertex] for vertex in self.face_vertices(face)] for face in self.faces()]
         v = volume_polyhedron((vertices, faces))
         return v
+
+    # ==========================================================================
+    # copy
+    # ==========================================================================
+
+    def copy(self, cls=None, copy_guid=False, structural=False):
+        """Make an independent copy of the block.
+
+        Parameters
+        ----------
+        cls : type[:class:`Block`], optional
+            The type of block to return.
+            Defaults to the type of the current block.
+        copy_guid : bool, optional
+            If True, the copy will have the same guid as the original.
+        structural : bool, optional
+            If True, the vertex, face, halfedge, and attribute dictionaries are copied directly,
+            instead of going through a serialization round trip.
+
+        Returns
+        -------
+        :class:`Block`
+
+        """
+        if not structural:
+            return super(Block, self).copy(cls=cls, copy_guid=copy_guid)
+        cls = cls or type(self)
+        block = cls.__new__(cls)
+        block.__dict__.update(self.__dict__)
+        block.vertex = {key: attr.copy() for key, attr in self.vertex.items()}
+        block.face = {key: vertices[:] for key, vertices in self.face.items()}
+        block.halfedge = {key: nbrs.copy() for key, nbrs in self.halfedge.items()}
+        block.facedata = {key: attr.copy() for key, attr in self.facedata.items()}
+        block.edgedata = {key: attr.copy() for key, attr in self.edgedata.items()}
+        block.attributes = self.attributes.copy()
+        block.default_vertex_attributes = self.default_vertex_attributes.copy()
+        block.default_edge_attributes = self.default_edge_attributes.copy()
+        block.default_face_attributes = self.default_face_attributes.copy()
+        block._cache = self._cache.copy()
+        block._cache_hits = 0
+        block._cache_misses = 0
+        block._aabb = None
+        block._obb = None
+        block._guid = self._guid if copy_guid else None
+        return block
+
+    # ==========================================================================
+    # invalidation
+    # ==========================================================================
+
+    def transform(self, T):
+        super(Block, self).transform(T)
+        self.invalidate_cache()
+
+    def transform_numpy(self, T):
+        super(Block, self).transform_numpy(T)
+        self.invalidate_cache()
+
+    def vertex_attribute(self, key, name, value=None):
+        if value is not None:
+            self.invalidate_cache()
+        return super(Block, self).vertex_attribute(key, name, value=value)
+
+    def vertex_attributes(self, key, names=None, values=None):
+        if values is not None:
+            self.invalidate_cache()
+        return super(Block, self).vertex_attributes(key, names=names, values=values)
+
+    def vertices_attribute(self, name, value=None, keys=None):
+        if value is not None:
+            self.invalidate_cache()
+        return super(Block, self).vertices_attribute(name, value=value, keys=keys)
+
+    def vertices_attributes(self, names=None, values=None, keys=None):
+        if values is not None:
+            self.invalidate_cache()
+        return super(Block, self).vertices_attributes(names=names, values=values, keys=keys)
+
+    def unset_vertex_attribute(self, key, name):
+        self.invalidate_cache()
+        return super(Block, self).unset_vertex_attribute(key, name)
+
+    def add_vertex(self, key=None, attr_dict=None, **kwattr):
+        self.invalidate_cache()
+        return super(Block, self).add_vertex(key=key, attr_dict=attr_dict, **kwattr)
+
+    def add_face(self, vertices, fkey=None, attr_dict=None, **kwattr):
+        self.invalidate_cache()
+        return super(Block, self).add_face(vertices, fkey=fkey, attr_dict=attr_dict, **kwattr)
+
+    def delete_vertex(self, key):
+        self.invalidate_cache()
+        return super(Block, self).delete_vertex(key)
+
+    def delete_face(self, fkey):
+        self.invalidate_cache()
+        return super(Block, self).delete_face(fkey)
+
+    def flip_cycles(self):
+        self.invalidate_cache()
+        return super(Block, self).flip_cycles()
+
+    def clear(self):
+        self.invalidate_cache()
+        return super(Block, self).clear()
+
+    # the following methods modify the vertices or faces in place, without using the methods above for every change
+    # the cache is invalidated afterwards, since they may query the geometry of the block while they run
+
+    def unify_cycles(self, root=None, nmax=None, max_distance=None):
+        result = super(Block, self).unify_cycles(root=root, nmax=nmax, max_distance=max_distance)
+        self.invalidate_cache()
+        return result
+
+    def remove_duplicate_vertices(self, precision=None):
+        result = super(Block, self).remove_duplicate_vertices(precision=precision)
+        self.invalidate_cache()
+        return result
+
+    def collapse_edge(self, edge, t=0.5, allow_boundary=False, fixed=None):
+        result = super(Block, self).collapse_edge(edge, t=t, allow_boundary=allow_boundary, fixed=fixed)
+        self.invalidate_cache()
+        return result
+
+    def merge_faces(self, faces):
+        result = super(Block, self).merge_faces(faces)
+        self.invalidate_cache()
+        return result
+
+    def split_edge(self, edge, t=0.5, allow_boundary=False):
+        result = super(Block, self).split_edge(edge, t=t, allow_boundary=allow_boundary)
+        self.invalidate_cache()
+        return result
+
+    def split_face(self, fkey, u, v):
+        result = super(Block, self).split_face(fkey, u, v)
+        self.invalidate_cache()
+        return result
+
+    def split_strip(self, edge):
+        result = super(Block, self).split_strip(edge)
+        self.invalidate_cache()
+        return result
+
+    def unweld_edges(self, edges):
+        result = super(Block, self).unweld_edges(edges)
+        self.invalidate_cache()
+        return result
+
+    def unweld_vertices(self, fkey, where=None):
+        result = super(Block, self).unweld_vertices(fkey, where=where)
+        self.invalidate_cache()
+        return result
+
+    def smooth_area(self, fixed=None, kmax=100, damping=0.5, callback=None, callback_args=None):
+        result = super(Block, self).smooth_area(fixed=fixed, kmax=kmax, damping=damping, callback=callback, callback_args=callback_args)
+        self.invalidate_cache()
+        return result
+
+    def smooth_centroid(self, fixed=None, kmax=100, damping=0.5, callback=None, callback_args=None):
+        result = super(Block, self).smooth_centroid(fixed=fixed, kmax=kmax, damping=damping, callback=callback, callback_args=callback_args)
+        self.invalidate_cache()
+        return result
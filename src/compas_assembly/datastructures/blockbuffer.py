@@ -0,0 +1,773 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from numpy import arange
+from numpy import asarray
+from numpy import concatenate
+from numpy import cumsum
+from numpy import diff
+from numpy import float64
+from numpy import int32
+from numpy import int64
+from numpy import minimum
+from numpy import tile
+from numpy import zeros
+
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas.geometry import area_polygon
+from compas.geometry import bounding_box
+from compas.geometry import centroid_points
+from compas.geometry import centroid_polygon
+from compas.geometry import centroid_polyhedron
+from compas.geometry import cross_vectors
+from compas.geometry import dot_vectors
+from compas.geometry import normal_polygon
+from compas.geometry import transform_points_numpy
+from compas.geometry import volume_polyhedron
+from compas_assembly.datastructures.block import Block
+
+
+class BlockBuffer(object):
+    """Contiguous array storage for the vertices and faces of a collection of blocks.
+
+    Parameters
+    ----------
+    xyz : array_like
+        The vertex coordinates of all blocks, with shape (V, 3).
+    vertex_offsets : array_like
+        The index of the first vertex of every block in ``xyz``, with shape (n + 1,).
+    faces : array_like
+        The vertex indices of all faces of all blocks, concatenated, with shape (I,).
+        The indices are local to the block of the face.
+    face_offsets : array_like
+        The position of the first vertex index of every face in ``faces``, with shape (F + 1,).
+    block_face_offsets : array_like
+        The index of the first face of every block in ``face_offsets``, with shape (n + 1,).
+
+    Attributes
+    ----------
+    xyz : ndarray
+        The vertex coordinates, as a contiguous float64 array.
+    vertex_offsets : ndarray
+        The vertex offsets of the blocks.
+    faces : ndarray
+        The face vertex indices, as an int32 array.
+    face_offsets : ndarray
+        The face offsets, as an int32 array.
+    block_face_offsets : ndarray
+        The face offsets of the blocks.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box
+    >>> blocks = [Block.from_shape(Box(1, 1, 1)), Block.from_shape(Box(2, 1, 1))]
+    >>> buffer = BlockBuffer.from_blocks(blocks)
+    >>> len(buffer)
+    2
+    >>> buffer.xyz.shape
+    (16, 3)
+
+    """
+
+    def __init__(self, xyz, vertex_offsets, faces, face_offsets, block_face_offsets):
+        self.xyz = asarray(xyz, dtype=float64).reshape((-1, 3))
+        self.vertex_offsets = asarray(vertex_offsets, dtype=int64)
+        self.faces = asarray(faces, dtype=int32)
+        self.face_offsets = asarray(face_offsets, dtype=int32)
+        self.block_face_offsets = asarray(block_face_offsets, dtype=int64)
+
+    def __len__(self):
+        return len(self.vertex_offsets) - 1
+
+    # ==========================================================================
+    # properties
+    # ==========================================================================
+
+    @property
+    def nbytes(self):
+        """int - The total size of the arrays of the buffer, in bytes."""
+        return self.xyz.nbytes + self.vertex_offsets.nbytes + self.faces.nbytes + self.face_offsets.nbytes + self.block_face_offsets.nbytes
+
+    # ==========================================================================
+    # constructors
+    # ==========================================================================
+
+    @classmethod
+    def from_blocks(cls, blocks):
+        """Construct a buffer from a sequence of blocks or meshes.
+
+        Parameters
+        ----------
+        blocks : list[:class:`compas.datastructures.Mesh`]
+            The blocks.
+
+        Returns
+        -------
+        :class:`BlockBuffer`
+
+        Notes
+        -----
+        Only the vertex coordinates and the face cycles are stored.
+        The vertices and faces of every block are renumbered in the order of iteration.
+
+        """
+        xyz = []
+        faces = []
+        vertex_offsets = [0]
+        face_offsets = [0]
+        block_face_offsets = [0]
+        for block in blocks:
+            vertex_index = block.vertex_index()
+            xyz.extend(block.vertices_attributes("xyz"))
+            for face in block.faces():
+                vertices = [vertex_index[vertex] for vertex in block.face_vertices(face)]
+                faces.extend(vertices)
+                face_offsets.append(face_offsets[-1] + len(vertices))
+            vertex_offsets.append(len(xyz))
+            block_face_offsets.append(len(face_offsets) - 1)
+        return cls(xyz, vertex_offsets, faces, face_offsets, block_face_offsets)
+
+    @classmethod
+    def from_stacked(cls, vertices, faces):
+        """Construct a buffer from the stacked vertices of blocks with the same topology.
+
+        Parameters
+        ----------
+        vertices : array_like
+            The vertices of the blocks, with shape (n, v, 3).
+        faces : list[list[int]]
+            The face cycles shared by all blocks, referring to the ``v`` vertices of every block.
+
+        Returns
+        -------
+        :class:`BlockBuffer`
+
+        Notes
+        -----
+        No meshes are constructed.
+        This is the counterpart of :meth:`compas_assembly.geometry.Geometry.blocks_numpy`.
+
+        """
+        vertices = asarray(vertices, dtype=float64)
+        n, v = vertices.shape[:2]
+        f = len(faces)
+        cycle = asarray([vertex for face in faces for vertex in face], dtype=int32)
+        degrees = asarray([len(face) for face in faces], dtype=int32)
+        face_offsets = zeros(n * f + 1, dtype=int32)
+        face_offsets[1:] = cumsum(tile(degrees, n))
+        return cls(vertices.reshape((-1, 3)), arange(n + 1) * v, tile(cycle, n), face_offsets, arange(n + 1) * f)
+
+    def copy(self):
+        """Make a copy of the buffer with its own vertex coordinates.
+
+        Returns
+        -------
+        :class:`BlockBuffer`
+
+        Notes
+        -----
+        The face and offset arrays describe the topology of the blocks, which is not modified in place,
+        and are shared with the original buffer.
+
+        """
+        return BlockBuffer(self.xyz.copy(), self.vertex_offsets, self.faces, self.face_offsets, self.block_face_offsets)
+
+    # ==========================================================================
+    # accessors
+    # ==========================================================================
+
+    def block_xyz(self, index):
+        """Retrieve the vertex coordinates of a block.
+
+        Parameters
+        ----------
+        index : int
+            The index of the block.
+
+        Returns
+        -------
+        ndarray
+            A view on the coordinates of the vertices of the block, with shape (V, 3).
+
+        """
+        return self.xyz[self.vertex_offsets[index] : self.vertex_offsets[index + 1]]
+
+    def block_faces(self, index):
+        """Retrieve the faces of a block.
+
+        Parameters
+        ----------
+        index : int
+            The index of the block.
+
+        Returns
+        -------
+        list[list[int]]
+            The local vertex indices of every face of the block.
+
+        """
+        f0 = self.block_face_offsets[index]
+        f1 = self.block_face_offsets[index + 1]
+        offsets = self.face_offsets[f0 : f1 + 1].tolist()
+        indices = self.faces[offsets[0] : offsets[-1]].tolist()
+        start = offsets[0]
+        return [indices[i - start : j - start] for i, j in zip(offsets[:-1], offsets[1:])]
+
+    def block_face_arrays(self, index):
+        """Retrieve the vertex and face arrays of a block in the format used for interface detection.
+
+        Parameters
+        ----------
+        index : int
+            The index of the block.
+
+        Returns
+        -------
+        tuple[ndarray, ndarray, ndarray]
+            The vertex coordinates, with shape (V, 3).
+            The vertex indices of the faces, with shape (F, D), with D the maximum face degree.
+            Faces with fewer vertices are padded by repeating their last vertex.
+            The number of vertices of every face, with shape (F,).
+
+        See Also
+        --------
+        :func:`compas_assembly.algorithms.interfaces_numpy.mesh_face_arrays`
+
+        """
+        f0 = self.block_face_offsets[index]
+        f1 = self.block_face_offsets[index + 1]
+        offsets = self.face_offsets[f0 : f1 + 1].astype(int64)
+        degrees = diff(offsets)
+        if not len(degrees):
+            return self.block_xyz(index), zeros((0, 0), dtype=int64), degrees
+        d = degrees.max()
+        # the position of every face entry, clipped to the last vertex of the face
+        positions = offsets[:-1, None] + minimum(arange(d)[None, :], degrees[:, None] - 1)
+        return self.block_xyz(index), self.faces[positions].astype(int64), degrees
+
+    def to_block(self, index, cls=None):
+        """Convert a block of the buffer to a regular mesh.
+
+        Parameters
+        ----------
+        index : int
+            The index of the block.
+        cls : type[:class:`compas.datastructures.Mesh`], optional
+            The type of mesh.
+            Defaults to :class:`compas_assembly.datastructures.Block`.
+
+        Returns
+        -------
+        :class:`compas.datastructures.Mesh`
+
+        """
+        cls = cls or Block
+        return cls.from_vertices_and_faces(self.block_xyz(index).tolist(), self.block_faces(index))
+
+    def view(self, index, guid=None, name=None, attributes=None):
+        """Construct a lightweight block view on a block of the buffer.
+
+        Parameters
+        ----------
+        index : int
+            The index of the block.
+        guid : :class:`uuid.UUID`, optional
+            The GUID of the view.
+        name : str, optional
+            The name of the view.
+        attributes : dict, optional
+            The general attributes of the view.
+
+        Returns
+        -------
+        :class:`BlockView`
+
+        """
+        return BlockView(self, index, guid=guid, name=name, attributes=attributes)
+
+    # ==========================================================================
+    # methods
+    # ==========================================================================
+
+    def transform_block(self, index, T):
+        """Transform the vertices of a block in place.
+
+        Parameters
+        ----------
+        index : int
+            The index of the block.
+        T : :class:`compas.geometry.Transformation`
+            The transformation.
+
+        Returns
+        -------
+        None
+
+        """
+        v0 = self.vertex_offsets[index]
+        v1 = self.vertex_offsets[index + 1]
+        self.xyz[v0:v1] = transform_points_numpy(self.xyz[v0:v1], T)
+
+    def transform(self, T):
+        """Transform the vertices of all blocks in place, with one matrix multiplication.
+
+        Parameters
+        ----------
+        T : :class:`compas.geometry.Transformation`
+            The transformation.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The caches of the views on the buffer are not invalidated.
+
+        """
+        self.xyz[:] = transform_points_numpy(self.xyz, T)
+
+    def append(self, block):
+        """Append a block or mesh to the buffer.
+
+        Parameters
+        ----------
+        block : :class:`compas.datastructures.Mesh`
+            The block.
+
+        Returns
+        -------
+        int
+            The index of the block in the buffer.
+
+        Notes
+        -----
+        Appending copies all arrays of the buffer.
+        To store many blocks at once, use :meth:`BlockBuffer.from_blocks`.
+
+        """
+        other = BlockBuffer.from_blocks([block])
+        index = len(self)
+        self.xyz = concatenate((self.xyz, other.xyz))
+        self.vertex_offsets = concatenate((self.vertex_offsets, other.vertex_offsets[1:] + self.vertex_offsets[-1]))
+        self.faces = concatenate((self.faces, other.faces))
+        self.face_offsets = concatenate((self.face_offsets, other.face_offsets[1:] + self.face_offsets[-1]))
+        self.block_face_offsets = concatenate((self.block_face_offsets, other.block_face_offsets[1:] + self.block_face_offsets[-1]))
+        return index
+
+
+class BlockView(object):
+    """A lightweight, array-backed stand-in for a block stored in a :class:`BlockBuffer`.
+
+    Parameters
+    ----------
+    buffer : :class:`BlockBuffer`
+        The buffer containing the geometry of the block.
+    index : int
+        The index of the block in the buffer.
+    guid : :class:`uuid.UUID`, optional
+        The GUID of the block.
+        If no value is provided, a new GUID is generated.
+    name : str, optional
+        The name of the block.
+    attributes : dict, optional
+        The general attributes of the block.
+
+    Notes
+    -----
+    A view is not a :class:`compas_assembly.datastructures.Block`, and supports only the following subset of its API.
+
+    * Identification: :attr:`guid`, :attr:`name`, :attr:`attributes`, :attr:`node`.
+    * Vertices and faces: :meth:`vertices`, :meth:`faces`, :meth:`number_of_vertices`, :meth:`number_of_faces`,
+      :meth:`vertex_index`, :meth:`vertex_coordinates`, :meth:`vertex_attribute`, :meth:`vertex_attributes`,
+      :meth:`vertices_attributes`, :meth:`face_vertices`, :meth:`face_coordinates`, :meth:`face_normal`,
+      :meth:`face_center`, :meth:`face_centroid`, :meth:`face_area`, :meth:`to_vertices_and_faces`.
+    * Geometric queries: :meth:`centroid`, :meth:`center`, :meth:`volume`, :meth:`frames`, :meth:`frame`,
+      :meth:`normals`, :meth:`top`, :meth:`bounds`, :meth:`aabb`, :meth:`invalidate_cache`.
+    * Modifications: :meth:`transform`, :meth:`transform_numpy`,
+      and setting the coordinates of vertices with :meth:`vertex_attribute` and :meth:`vertex_attributes`.
+      These are applied to the shared buffer directly.
+    * Conversion and serialization: :meth:`to_block`, :meth:`copy`, :attr:`__data__`, and the COMPAS JSON serializer.
+
+    The identifiers of the vertices and faces are their indices in the block.
+    Vertices have no attributes other than their coordinates, and faces have no attributes at all.
+    Accessing any other attribute of the API of a block raises an :class:`AttributeError`
+    that explains that the view has to be converted to a regular block with :meth:`BlockView.to_block` first.
+
+    Views are serialized as regular blocks.
+
+    """
+
+    __slots__ = ("buffer", "index", "attributes", "_guid", "_name", "_cache")
+
+    def __init__(self, buffer, index, guid=None, name=None, attributes=None):
+        self.buffer = buffer
+        self.index = index
+        self.attributes = {"node": None}
+        self.attributes.update(attributes or {})
+        self._guid = guid
+        self._name = name
+        self._cache = None
+
+    def __str__(self):
+        return "<BlockView {} with {} vertices and {} faces>".format(self.index, self.number_of_vertices(), self.number_of_faces())
+
+    def __getattr__(self, name):
+        # only called for attributes that are not defined on the view
+        if not name.startswith("__") and hasattr(Block, name):
+            raise AttributeError("BlockView does not support {!r} of Block. Convert the view to a regular block with BlockView.to_block first.".format(name))
+        raise AttributeError("{!r} object has no attribute {!r}".format(type(self).__name__, name))
+
+    def __jsondump__(self, minimal=False):
+        return self.to_block().__jsondump__(minimal=minimal)
+
+    @property
+    def __dtype__(self):
+        return "{}/{}".format(".".join(Block.__module__.split(".")[:2]), Block.__name__)
+
+    @property
+    def __data__(self):
+        return self.to_block().__data__
+
+    @property
+    def guid(self):
+        if not self._guid:
+            from uuid import uuid4
+
+            self._guid = uuid4()
+        return self._guid
+
+    @property
+    def name(self):
+        return self._name or "Block"
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def node(self):
+        return self.attributes["node"]
+
+    @node.setter
+    def node(self, node):
+        self.attributes["node"] = node
+
+    @property
+    def xyz(self):
+        """ndarray - A view on the coordinates of the vertices of the block in the buffer."""
+        return self.buffer.block_xyz(self.index)
+
+    # ==========================================================================
+    # cache
+    # ==========================================================================
+
+    def _cached(self, key, compute):
+        if self._cache is None:
+            self._cache = {}
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = compute()
+            return value
+
+    def invalidate_cache(self):
+        """Remove all cached geometric properties of the block.
+
+        Returns
+        -------
+        None
+
+        """
+        self._cache = None
+
+    def _faces(self):
+        return self._cached("faces", lambda: self.buffer.block_faces(self.index))
+
+    # ==========================================================================
+    # conversions
+    # ==========================================================================
+
+    def to_block(self, cls=None):
+        """Convert the view to a regular block.
+
+        Parameters
+        ----------
+        cls : type[:class:`compas_assembly.datastructures.Block`], optional
+            The type of block.
+
+        Returns
+        -------
+        :class:`compas_assembly.datastructures.Block`
+            A block with the same GUID and attributes.
+
+        """
+        block = self.copy(cls=cls)
+        block._guid = self.guid
+        return block
+
+    def copy(self, cls=None):
+        """Make an independent copy of the block, as a regular block.
+
+        Parameters
+        ----------
+        cls : type[:class:`compas_assembly.datastructures.Block`], optional
+            The type of block.
+
+        Returns
+        -------
+        :class:`compas_assembly.datastructures.Block`
+
+        """
+        block = self.buffer.to_block(self.index, cls=cls)
+        block.attributes.update(self.attributes)
+        if self._name:
+            block.name = self._name
+        return block
+
+    def to_vertices_and_faces(self):
+        """Return the vertices and faces of the block.
+
+        Returns
+        -------
+        tuple[list[list[float]], list[list[int]]]
+
+        """
+        return self.xyz.tolist(), [face[:] for face in self._faces()]
+
+    def face_arrays(self):
+        """Return the vertex and face arrays of the block in the format used for interface detection.
+
+        Returns
+        -------
+        tuple[ndarray, ndarray, ndarray]
+
+        See Also
+        --------
+        :meth:`BlockBuffer.block_face_arrays`
+
+        """
+        return self.buffer.block_face_arrays(self.index)
+
+    # ==========================================================================
+    # mesh accessors
+    # ==========================================================================
+
+    def number_of_vertices(self):
+        return len(self.xyz)
+
+    def number_of_faces(self):
+        return int(self.buffer.block_face_offsets[self.index + 1] - self.buffer.block_face_offsets[self.index])
+
+    def vertices(self, data=False):
+        for vertex, xyz in enumerate(self.xyz.tolist()):
+            if data:
+                yield vertex, dict(zip("xyz", xyz))
+            else:
+                yield vertex
+
+    def faces(self, data=False):
+        for face in range(self.number_of_faces()):
+            if data:
+                yield face, {}
+            else:
+                yield face
+
+    def vertex_index(self):
+        return {vertex: vertex for vertex in range(self.number_of_vertices())}
+
+    def vertex_coordinates(self, vertex, axes="xyz"):
+        xyz = self.xyz[vertex].tolist()
+        return [xyz["xyz".index(axis)] for axis in axes]
+
+    def vertex_attribute(self, vertex, name, value=None):
+        if value is None:
+            return self.xyz[vertex, "xyz".index(name)].item() if name in ("x", "y", "z") else None
+        self.vertex_attributes(vertex, [name], [value])
+
+    def vertex_attributes(self, vertex, names=None, values=None):
+        if values is not None:
+            names = names or "xyz"
+            if any(name not in ("x", "y", "z") for name in names):
+                raise ValueError("Block views only store the vertex coordinates x, y, and z: {}".format(list(names)))
+            self.xyz[vertex, ["xyz".index(name) for name in names]] = list(values)
+            self.invalidate_cache()
+            return
+        xyz = self.xyz[vertex].tolist()
+        if names is None:
+            return dict(zip("xyz", xyz))
+        return [xyz["xyz".index(name)] for name in names]
+
+    def vertices_attributes(self, names=None, keys=None):
+        xyz = self.xyz.tolist() if keys is None else self.xyz[list(keys)].tolist()
+        if names is None:
+            return [dict(zip("xyz", point)) for point in xyz]
+        if names == "xyz":
+            return xyz
+        indices = ["xyz".index(name) for name in names]
+        return [[point[i] for i in indices] for point in xyz]
+
+    def face_vertices(self, face):
+        return self._faces()[face][:]
+
+    def face_coordinates(self, face):
+        xyz = self.xyz
+        return xyz[self._faces()[face]].tolist()
+
+    def face_normal(self, face, unitized=True):
+        return Vector(*normal_polygon(self.face_coordinates(face), unitized=unitized))
+
+    def face_center(self, face):
+        return Point(*centroid_polygon(self.face_coordinates(face)))
+
+    def face_centroid(self, face):
+        return Point(*centroid_points(self.face_coordinates(face)))
+
+    def face_area(self, face):
+        return area_polygon(self.face_coordinates(face))
+
+    # ==========================================================================
+    # block queries
+    # ==========================================================================
+
+    def centroid(self):
+        """Compute the centroid of the block.
+
+        Returns
+        -------
+        :class:`compas.geometry.Point`
+
+        """
+        return Point(*self._cached("centroid", lambda: tuple(centroid_points(self.xyz.tolist()))))
+
+    def center(self):
+        """Compute the center of mass of the block.
+
+        Returns
+        -------
+        :class:`compas.geometry.Point`
+
+        """
+        return Point(*self._cached("center", lambda: tuple(centroid_polyhedron(self.to_vertices_and_faces()))))
+
+    def volume(self):
+        """Compute the volume of the block.
+
+        Returns
+        -------
+        float
+
+        """
+        return self._cached("volume", lambda: volume_polyhedron(self.to_vertices_and_faces()))
+
+    def frames(self):
+        """Compute the local frame of each face of the block.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping face identifiers to face frames.
+
+        """
+        return {face: Frame(*axes) for face, axes in self._frame_axes().items()}
+
+    def frame(self, face):
+        """Compute the frame of a specific face.
+
+        Parameters
+        ----------
+        face : int
+            The identifier of the face.
+
+        Returns
+        -------
+        :class:`compas.geometry.Frame`
+
+        """
+        return Frame(*self._frame_axes()[face])
+
+    def _frame_axes(self):
+        return self._cached("frames", lambda: {face: self._compute_frame_axes(face) for face in self.faces()})
+
+    def _compute_frame_axes(self, face):
+        xyz = self.face_coordinates(face)
+        o = centroid_polygon(xyz)
+        w = normal_polygon(xyz)
+        u = [xyz[1][i] - xyz[0][i] for i in range(3)]
+        v = cross_vectors(w, u)
+        return tuple(o), tuple(u), tuple(v)
+
+    def normals(self):
+        """Compute the normal of each face of the block.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping face identifiers to face normals.
+
+        """
+        return {face: Vector(*normal) for face, normal in self._normals().items()}
+
+    def _normals(self):
+        return self._cached("normals", lambda: {face: tuple(normal_polygon(self.face_coordinates(face))) for face in self.faces()})
+
+    def top(self):
+        """Identify the *top* face of the block.
+
+        Returns
+        -------
+        int
+            The identifier of the face.
+
+        """
+        z = [0, 0, 1]
+        return self._cached("top", lambda: sorted(self._normals().items(), key=lambda x: dot_vectors(x[1], z))[-1][0])
+
+    def bounds(self):
+        """Compute the axis-aligned bounds of the block.
+
+        Returns
+        -------
+        tuple[float, float, float, float, float, float]
+            The bounds as ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+
+        """
+        return self._cached("bounds", lambda: tuple(self.xyz.min(axis=0).tolist() + self.xyz.max(axis=0).tolist()))
+
+    def aabb(self):
+        """Compute the axis-aligned bounding box of the block.
+
+        Returns
+        -------
+        :class:`compas.geometry.Box`
+
+        """
+        xmin, ymin, zmin, xmax, ymax, zmax = self.bounds()
+        return Box.from_bounding_box(bounding_box([[xmin, ymin, zmin], [xmax, ymax, zmax]]))
+
+    # ==========================================================================
+    # methods
+    # ==========================================================================
+
+    def transform(self, T):
+        """Transform the block in place, in the shared buffer.
+
+        Parameters
+        ----------
+        T : :class:`compas.geometry.Transformation`
+            The transformation.
+
+        Returns
+        -------
+        None
+
+        """
+        self.buffer.transform_block(self.index, T)
+        self.invalidate_cache()
+
+    def transform_numpy(self, T):
+        self.transform(T)
@@ -2,6 +2,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import compas
 from compas.data import Data
 from compas.datastructures import Mesh
 from compas.geometry import Frame
@@ -14,28 +15,7 @@ from compas.geometry import dot_vectors
 from compas.geometry import transform_points
 from compas.itertools import pairwise
 
-
-def outer_product(u, v):
-    return [[ui * vi for vi in v] for ui in u]
-
-
-def scale_matrix(M, scale):
-    r = len(M)
-    c = len(M[0])
-    for i in range(r):
-        for j in range(c):
-            M[i][j] *= scale
-    return M
-
-
-def sum_matrices(A, B):
-    r = len(A)
-    c = len(A[0])
-    M = [[None for j in range(c)] for i in range(r)]
-    for i in range(r):
-        for j in range(c):
-            M[i][j] = A[i][j] + B[i][j]
-    return M
+FORCE_COMPONENTS = ("c_np", "c_nn", "c_u", "c_v")
 
 
 class Interface(Data):
@@ -68,6 +48,8 @@ class Interface(Data):
     forces : list[dict]
         A dictionary of force components per interface point.
         Each dictionary contains the following items: ``{"c_np": ..., "c_nn": ...,  "c_u": ..., "c_v": ...}``.
+        Forces that are set in bulk with :meth:`compas_assembly.datastructures.Assembly.set_interface_forces`
+        are only converted to dictionaries when this attribute is accessed.
     stressdistribution : ???
         ???
     normalforces : list[:class:`Line`]
@@ -129,12 +111,16 @@ class Interface(Data):
     ):
         super(Interface, self).__init__()
         self._frame = None
+        self._frame_axes = None
         self._mesh = None
         self._size = None
         self._points = None
         self._polygon = None
         self._points2 = None
         self._polygon2 = None
+        self._moments = None
+        self._forces = None
+        self._force_view = None
 
         self.points = points
         self.mesh = mesh
@@ -152,6 +138,29 @@ class Interface(Data):
         self._points = []
         for item in items:
             self._points.append(Point(*item))
+        self.invalidate_cache()
+
+    @property
+    def forces(self):
+        if self._force_view is not None:
+            array, start, end = self._force_view
+            self._forces = [dict(zip(FORCE_COMPONENTS, force)) for force in array[start:end].tolist()]
+            self._force_view = None
+        return self._forces
+
+    @forces.setter
+    def forces(self, forces):
+        self._forces = forces
+        self._force_view = None
+
+    @property
+    def force_view(self):
+        """tuple[array, int, int] | None - The array and the range of rows holding the forces of the interface, if they were set in bulk.
+
+        The rows of the array contain the components ``c_np``, ``c_nn``, ``c_u``, ``c_v``, per corner point.
+        The view is removed when :attr:`forces` is accessed or set.
+        """
+        return self._force_view
 
     @property
     def polygon(self):
@@ -161,7 +170,10 @@ class Interface(Data):
 
     @property
     def frame(self):
-        if self._frame is None:
+        if self._frame is None and self._frame_axes is not None:
+            self._frame = Frame(*self._frame_axes)
+            self._frame_axes = None
+        elif self._frame is None:
             from compas.geometry import bestfit_frame_numpy
 
             self._frame = Frame(*bestfit_frame_numpy(self.points))
@@ -192,43 +204,107 @@ class Interface(Data):
         return self._polygon2
 
     @property
-    def M0(self):
-        m0 = 0
+    def moments(self):
+        """tuple[float, list[float], list[list[float]]] - The area, and the first and second moments of the polygon in its local frame.
+
+        The moments are computed once, and cached until the points of the interface change.
+        They are computed with :func:`compas_assembly.algorithms.interface_moments_numpy`,
+        which can also compute them for many interfaces at once.
+        Inside Rhino, where Numpy is not available, they are computed edge by edge.
+        """
+        if self._moments is None:
+            if compas.IPY:
+                self._moments = self._compute_moments()
+            else:
+                from compas_assembly.algorithms.moments_numpy import interface_moments_numpy
+
+                interface_moments_numpy([self])
+        return self._moments
+
+    def _compute_moments(self):
+        m0 = 0.0
+        m1 = [0.0, 0.0, 0.0]
+        m2 = [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
         for a, b in pairwise(self.points2 + self.points2[:1]):
             d = b - a
             n = [d[1], -d[0], 0]
-            m0 += dot_vectors(a, n)
-        return 0.5 * m0
+            m = dot_vectors(a, n)
+            m0 += m
+            for i in range(3):
+                m1[i] += (a[i] + b[i]) * m
+                for j in range(3):
+                    m2[i][j] += (a[i] * a[j] + b[i] * b[j] + 0.5 * (a[i] * b[j] + b[i] * a[j])) * m
+        return (
+            0.5 * m0,
+            [x / 6 for x in m1],
+            [[x / 12.0 for x in row] for row in m2],
+        )
+
+    @property
+    def M0(self):
+        return self.moments[0]
 
     @property
     def M1(self):
-        m1 = Point(0, 0, 0)
-        for a, b in pairwise(self.points2 + self.points2[:1]):
-            d = b - a
-            n = [d[1], -d[0], 0]
-            m0 = dot_vectors(a, n)
-            m1 += (a + b) * m0
-        return m1 / 6
+        return Point(*self.moments[1])
 
     @property
     def M2(self):
-        m2 = outer_product([0, 0, 0], [0, 0, 0])
-        for a, b in pairwise(self.points2 + self.points2[:1]):
-            d = b - a
-            n = [d[1], -d[0], 0]
-            m0 = dot_vectors(a, n)
-            aa = outer_product(a, a)
-            ab = outer_product(a, b)
-            ba = outer_product(b, a)
-            bb = outer_product(b, b)
-            m2 = sum_matrices(
-                m2,
-                scale_matrix(
-                    sum_matrices(sum_matrices(aa, bb), scale_matrix(sum_matrices(ab, ba), 0.5)),
-                    m0,
-                ),
-            )
-        return scale_matrix(m2, 1 / 12.0)
+        return [row[:] for row in self.moments[2]]
+
+    def copy(self, cls=None, copy_guid=False):
+        """Make an independent copy of the interface.
+
+        Parameters
+        ----------
+        cls : type[:class:`Interface`], optional
+            The type of interface to return.
+            Defaults to the type of the current interface.
+        copy_guid : bool, optional
+            If True, the copy will have the same guid as the original.
+
+        Returns
+        -------
+        :class:`Interface`
+
+        Notes
+        -----
+        The points, frame, and forces are copied directly, without a serialization round trip.
+        The frame of the copy is only constructed when it is accessed.
+        The mesh is only copied if it was set or computed before.
+        Cached moments are shared, and forces set in bulk keep referring to the same array.
+
+        """
+        cls = cls or type(self)
+        interface = cls(size=self.size, points=self._points)
+        if self._frame:
+            interface._frame_axes = (list(self._frame.point), list(self._frame.xaxis), list(self._frame.yaxis))
+        else:
+            interface._frame_axes = self._frame_axes
+        if self._mesh:
+            interface._mesh = self._mesh.copy()
+        if self._forces is not None:
+            interface._forces = [dict(force) for force in self._forces]
+        interface._force_view = self._force_view
+        interface._moments = self._moments
+        if self._name is not None:
+            interface._name = self._name
+        if copy_guid:
+            interface._guid = self.guid
+        return interface
+
+    def invalidate_cache(self):
+        """Clear the cached geometry derived from the points of the interface.
+
+        Returns
+        -------
+        None
+
+        """
+        self._polygon = None
+        self._points2 = None
+        self._polygon2 = None
+        self._moments = None
 
     @property
     def kern(self):
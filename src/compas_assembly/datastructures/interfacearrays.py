@@ -0,0 +1,203 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from numpy import arange
+from numpy import argsort
+from numpy import asarray
+from numpy import bincount
+from numpy import concatenate
+from numpy import cumsum
+from numpy import float64
+from numpy import int8
+from numpy import int64
+from numpy import nan
+from numpy import ones
+from numpy import zeros
+
+
+class InterfaceArrays(object):
+    """Contiguous arrays of the geometry and topology of all interfaces of an assembly.
+
+    Parameters
+    ----------
+    nodes : list[hashable]
+        The nodes of the assembly, in the order used for indexing.
+    edges : array_like
+        The node indices of the edge of every interface, with shape (K, 2).
+    points : array_like
+        The corner points of all interfaces, concatenated, with shape (P, 3).
+    point_offsets : array_like
+        The index of the first corner point of every interface in ``points``, with shape (K + 1,).
+    origins : array_like
+        The origins of the interface frames, with shape (K, 3).
+    uvw : array_like
+        The axes of the interface frames, with shape (K, 3, 3),
+        such that ``uvw[i, 0]``, ``uvw[i, 1]``, ``uvw[i, 2]`` are the x, y, and z axis of the frame of interface ``i``.
+    sizes : array_like
+        The areas of the interfaces, with shape (K,).
+        Interfaces without size have the value NaN.
+
+    Attributes
+    ----------
+    nodes : list[hashable]
+        The nodes of the assembly.
+    edges : ndarray
+        The node indices of the edges of the interfaces.
+    points : ndarray
+        The corner points of the interfaces.
+    point_offsets : ndarray
+        The offsets of the corner points of the interfaces.
+    origins : ndarray
+        The origins of the interface frames.
+    uvw : ndarray
+        The axes of the interface frames.
+    sizes : ndarray
+        The areas of the interfaces.
+    block_offsets : ndarray
+        The index of the first entry of every block in ``block_interfaces``, with shape (n + 1,).
+    block_interfaces : ndarray
+        The indices of the interfaces of all blocks, concatenated, with shape (2K,).
+        Together with ``block_offsets``, this is the block-interface incidence in compressed sparse row format.
+    block_signs : ndarray
+        The orientation of every entry of ``block_interfaces``, with shape (2K,).
+        The value is 1 if the block is the "from" block of the interface edge, and -1 if it is the "to" block.
+
+    Examples
+    --------
+    >>> from compas_assembly.geometry import Arch
+    >>> from compas_assembly.algorithms import assembly_interfaces_numpy
+    >>> assembly = Assembly.from_template(Arch(rise=5, span=10, thickness=0.7, depth=0.5, n=20))
+    >>> assembly = assembly_interfaces_numpy(assembly, amin=1e-4)
+    >>> arrays = assembly.interface_arrays()
+    >>> len(arrays)
+    19
+    >>> arrays.block_offsets.shape
+    (21,)
+
+    """
+
+    def __init__(self, nodes, edges, points, point_offsets, origins, uvw, sizes):
+        self.nodes = list(nodes)
+        self.edges = asarray(edges, dtype=int64).reshape((-1, 2))
+        self.points = asarray(points, dtype=float64).reshape((-1, 3))
+        self.point_offsets = asarray(point_offsets, dtype=int64)
+        self.origins = asarray(origins, dtype=float64).reshape((-1, 3))
+        self.uvw = asarray(uvw, dtype=float64).reshape((-1, 3, 3))
+        self.sizes = asarray(sizes, dtype=float64)
+        self._incidence()
+
+    def __len__(self):
+        return len(self.edges)
+
+    def _incidence(self):
+        k = len(self.edges)
+        rows = concatenate((self.edges[:, 0], self.edges[:, 1]))
+        interfaces = concatenate((arange(k), arange(k)))
+        signs = concatenate((ones(k, dtype=int8), -ones(k, dtype=int8)))
+        order = argsort(rows, kind="stable")
+        self.block_interfaces = interfaces[order]
+        self.block_signs = signs[order]
+        self.block_offsets = zeros(len(self.nodes) + 1, dtype=int64)
+        self.block_offsets[1:] = cumsum(bincount(rows, minlength=len(self.nodes)))
+
+    # ==========================================================================
+    # properties
+    # ==========================================================================
+
+    @property
+    def counts(self):
+        """ndarray - The number of corner points of every interface."""
+        return self.point_offsets[1:] - self.point_offsets[:-1]
+
+    @property
+    def owners(self):
+        """ndarray - The index of the interface of every corner point."""
+        return arange(len(self)).repeat(self.counts)
+
+    @property
+    def nbytes(self):
+        """int - The total size of the arrays, in bytes."""
+        arrays = (self.edges, self.points, self.point_offsets, self.origins, self.uvw, self.sizes, self.block_offsets, self.block_interfaces, self.block_signs)
+        return sum(array.nbytes for array in arrays)
+
+    # ==========================================================================
+    # constructors
+    # ==========================================================================
+
+    @classmethod
+    def from_assembly(cls, assembly):
+        """Collect the arrays of all interfaces of an assembly.
+
+        Parameters
+        ----------
+        assembly : :class:`compas_assembly.datastructures.Assembly`
+            An assembly with identified interfaces.
+
+        Returns
+        -------
+        :class:`InterfaceArrays`
+
+        Notes
+        -----
+        The interfaces are in the order of :meth:`compas_assembly.datastructures.Assembly.interfaces`.
+
+        """
+        nodes = list(assembly.graph.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        edges = []
+        points = []
+        counts = []
+        origins = []
+        uvw = []
+        sizes = []
+        for u, v in assembly.graph.edges():
+            interfaces = assembly.graph.edge_attribute((u, v), "interfaces") or []
+            for interface in interfaces:
+                frame = interface.frame
+                edges.append((index[u], index[v]))
+                points += interface.points
+                counts.append(len(interface.points))
+                origins.append(frame.point)
+                uvw.append([frame.xaxis, frame.yaxis, frame.zaxis])
+                sizes.append(nan if interface.size is None else interface.size)
+        offsets = zeros(len(counts) + 1, dtype=int64)
+        offsets[1:] = cumsum(counts)
+        return cls(nodes, edges, points, offsets, origins, uvw, sizes)
+
+    # ==========================================================================
+    # accessors
+    # ==========================================================================
+
+    def interface_points(self, i):
+        """The corner points of an interface.
+
+        Parameters
+        ----------
+        i : int
+            The index of the interface.
+
+        Returns
+        -------
+        ndarray
+            A view of the corner points of the interface, with shape (p, 3).
+
+        """
+        return self.points[self.point_offsets[i] : self.point_offsets[i + 1]]
+
+    def block_incidence(self, i):
+        """The interfaces of a block.
+
+        Parameters
+        ----------
+        i : int
+            The index of the block.
+
+        Returns
+        -------
+        tuple[ndarray, ndarray]
+            Views of the indices of the interfaces of the block, and of their orientation with respect to the block.
+
+        """
+        start, end = self.block_offsets[i], self.block_offsets[i + 1]
+        return self.block_interfaces[start:end], self.block_signs[start:end]
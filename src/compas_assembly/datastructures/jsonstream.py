@@ -0,0 +1,363 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+from ast import literal_eval
+from uuid import UUID
+
+from compas.data import DataDecoder
+from compas.data import DataEncoder
+from compas.data.encoders import cls_from_dtype
+from compas.datastructures import Graph
+from compas_assembly.datastructures.lazy import LazyBlock
+from compas_assembly.datastructures.lazy import LazyInterface
+
+
+def assembly_json_chunks(assembly, minimal=False):
+    """Encode an assembly as COMPAS JSON, one block and one set of interfaces at a time.
+
+    Parameters
+    ----------
+    assembly : :class:`compas_assembly.datastructures.Assembly`
+        The assembly.
+    minimal : bool, optional
+        If True, the GUIDs of the objects are not included.
+
+    Yields
+    ------
+    str
+        Consecutive pieces of the JSON document.
+        Every node of the graph, with its block, and every node's set of outgoing edges, with their interfaces,
+        are encoded in a separate piece.
+
+    Notes
+    -----
+    The document is identical to the one produced by ``compas.json_dumps(assembly)``.
+
+    """
+    DataEncoder.minimal = minimal
+
+    def dumps(value):
+        return json.dumps(value, cls=DataEncoder)
+
+    state = assembly.__jsondump__(minimal=minimal)
+    yield "{"
+    for i, (key, value) in enumerate(state.items()):
+        yield "{}{}: ".format(", " if i else "", dumps(key))
+        if key != "data":
+            yield dumps(value)
+            continue
+        yield "{"
+        for j, (name, item) in enumerate(value.items()):
+            yield "{}{}: ".format(", " if j else "", dumps(name))
+            if name == "graph":
+                for chunk in _graph_json_chunks(item, minimal, dumps):
+                    yield chunk
+            else:
+                yield dumps(item)
+        yield "}"
+    yield "}"
+
+
+def assembly_json_dump(assembly, filepath, minimal=False):
+    """Write an assembly to a COMPAS JSON file, one block and one set of interfaces at a time.
+
+    Parameters
+    ----------
+    assembly : :class:`compas_assembly.datastructures.Assembly`
+        The assembly.
+    filepath : str
+        The path of the file.
+    minimal : bool, optional
+        If True, the GUIDs of the objects are not included.
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    :func:`assembly_json_chunks`
+
+    """
+    with open(filepath, "w") as f:
+        for chunk in assembly_json_chunks(assembly, minimal=minimal):
+            f.write(chunk)
+
+
+def assembly_json_load(filepath, chunksize=1 << 16, lazy=False):
+    """Load an assembly from a COMPAS JSON file, one block and one set of interfaces at a time.
+
+    Parameters
+    ----------
+    filepath : str
+        The path of the file.
+        The file can be written by :func:`assembly_json_dump` or by ``compas.json_dump``.
+    chunksize : int, optional
+        The number of characters read from the file at once.
+    lazy : bool, optional
+        If True, the blocks and interfaces are only decoded when they are first accessed.
+
+    Returns
+    -------
+    :class:`compas_assembly.datastructures.Assembly`
+
+    Raises
+    ------
+    ValueError
+        If the file is not a valid COMPAS JSON document of an assembly.
+
+    Notes
+    -----
+    The document is parsed incrementally.
+    Only the values of the nodes and edges of the graph are decoded as a whole, one node or one set of outgoing edges at a time,
+    such that the memory required for parsing does not depend on the size of the assembly.
+    In files with sorted keys, for example written with ``compas.json_dump(assembly, filepath, pretty=True)``,
+    the edges precede the nodes, and are kept in memory until the nodes are read.
+
+    In lazy mode, the blocks and interfaces are stored as :class:`compas_assembly.datastructures.LazyBlock`
+    and :class:`compas_assembly.datastructures.LazyInterface` objects that keep the text of their payload,
+    and only read their GUID from it.
+    The topology of the assembly, the boundary conditions, and the mapping between blocks and nodes
+    are available without constructing any mesh.
+
+    """
+    with open(filepath, "r") as f:
+        stream = _JSONStream(f, chunksize=chunksize)
+        state = {}
+        for key in stream.items():
+            if key == "data":
+                data = state["data"] = {}
+                for name in stream.items():
+                    if name == "graph":
+                        data["graph"] = _graph_from_stream(stream, lazy=lazy)
+                    else:
+                        data[name] = stream.value()
+            else:
+                state[key] = stream.value()
+
+    if "dtype" not in state or "data" not in state:
+        raise ValueError("Not a COMPAS JSON document: {}".format(filepath))
+
+    cls = cls_from_dtype(state["dtype"], state.get("inheritance"))
+    return cls.__jsonload__(state["data"], guid=state.get("guid"), name=state.get("name"))
+
+
+# ==============================================================================
+# helpers
+# ==============================================================================
+
+
+def _graph_json_chunks(graph, minimal, dumps):
+    state = graph.__jsondump__(minimal=minimal)
+    yield "{"
+    for i, (key, value) in enumerate(state.items()):
+        yield "{}{}: ".format(", " if i else "", dumps(key))
+        if key != "data":
+            yield dumps(value)
+            continue
+        yield "{"
+        for j, (name, item) in enumerate(value.items()):
+            yield "{}{}: ".format(", " if j else "", dumps(name))
+            if name in ("node", "edge"):
+                yield "{"
+                for k, (node, attr) in enumerate(item.items()):
+                    yield "{}{}: {}".format(", " if k else "", dumps(node), dumps(attr))
+                yield "}"
+            else:
+                yield dumps(item)
+        yield "}"
+    yield "}"
+
+
+def _graph_from_stream(stream, lazy=False):
+    state = {}
+    data = {}
+    graph = None
+    # with sorted keys, the edges come before the nodes, and have to be kept until the nodes are added
+    edges = None
+    for key in stream.items():
+        if key != "data":
+            state[key] = stream.value()
+            continue
+        for name in stream.items():
+            if name not in ("node", "edge"):
+                data[name] = stream.value()
+                continue
+            if graph is None:
+                # with sorted keys, the type of the graph is only known at the end
+                cls = cls_from_dtype(state["dtype"], state.get("inheritance")) if "dtype" in state else Graph
+                graph = cls(
+                    default_node_attributes=data.get("default_node_attributes"),
+                    default_edge_attributes=data.get("default_edge_attributes"),
+                )
+            if name == "node":
+                for node in stream.items():
+                    graph.add_node(key=literal_eval(node), attr_dict=_attributes_from_stream(stream, "block", LazyBlock) if lazy else stream.value())
+                for u, nbrs in edges or []:
+                    _add_edges(graph, u, nbrs)
+                edges = False
+            elif edges is False:
+                for u in stream.items():
+                    _add_edges(graph, u, _nbrs_from_stream(stream, lazy))
+            else:
+                edges = [(u, _nbrs_from_stream(stream, lazy)) for u in stream.items()]
+
+    cls = cls_from_dtype(state["dtype"], state.get("inheritance"))
+    if graph is None:
+        graph = cls.__from_data__(dict(data, node={}, edge={}))
+    else:
+        for u, nbrs in edges or []:
+            _add_edges(graph, u, nbrs)
+        graph.default_node_attributes.update(data.get("default_node_attributes") or {})
+        graph.default_edge_attributes.update(data.get("default_edge_attributes") or {})
+        graph.attributes.update(data.get("attributes") or {})
+        graph._max_node = data.get("max_node", graph._max_node)
+        if type(graph) is not cls:
+            graph = cls.__from_data__(graph.__data__)
+    if state.get("guid"):
+        graph._guid = UUID(state["guid"])
+    if state.get("name"):
+        graph.name = state["name"]
+    return graph
+
+
+def _nbrs_from_stream(stream, lazy):
+    if not lazy:
+        return stream.value()
+    return {v: _attributes_from_stream(stream, "interfaces", LazyInterface) for v in stream.items()}
+
+
+def _attributes_from_stream(stream, name, cls):
+    # the payload of the attribute with the given name is kept as text
+    # and is only decoded when the object is accessed
+    attr = {}
+    for key in stream.items():
+        if key != name:
+            attr[key] = stream.value()
+        elif stream.peek() == "{":
+            attr[key] = _lazy_from_stream(stream, cls)
+        elif stream.peek() == "[":
+            attr[key] = [_lazy_from_stream(stream, cls) for _ in stream.elements()]
+        else:
+            attr[key] = stream.value()
+    return attr
+
+
+def _lazy_from_stream(stream, cls):
+    text, payload = stream.raw()
+    return cls(text, guid=payload.get("guid"))
+
+
+def _add_edges(graph, u, nbrs):
+    u = literal_eval(u)
+    for v, attr in nbrs.items():
+        graph.add_edge(u, literal_eval(v), attr_dict=attr)
+
+
+class _JSONStream(object):
+    """Incremental reader of the values of the objects of a JSON document."""
+
+    def __init__(self, f, chunksize=1 << 16):
+        self.f = f
+        self.chunksize = chunksize
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = DataDecoder()
+        self.plain = json.JSONDecoder()
+
+    def _fill(self, size):
+        data = self.f.read(max(size, self.chunksize))
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + data
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\n\r":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill(0):
+                raise ValueError("Unexpected end of JSON document.")
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError("Expected {!r} at position {} of the JSON buffer.".format(char, self.pos))
+        self.pos += 1
+
+    def value(self):
+        """Decode the next value."""
+        value, _, end = self._decode(self.decoder)
+        self.pos = end
+        return value
+
+    def raw(self):
+        """Read the next value without decoding its COMPAS objects.
+
+        Returns
+        -------
+        tuple[str, Any]
+            The text of the value, and the value as plain JSON data.
+
+        """
+        value, start, end = self._decode(self.plain)
+        self.pos = end
+        return self.buffer[start:end], value
+
+    def _decode(self, decoder):
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                if not self._fill(len(self.buffer)):
+                    raise
+                continue
+            # a number at the end of the buffer might continue in the next chunk
+            if end == len(self.buffer) and not self.eof and self._fill(0):
+                continue
+            return value, self.pos, end
+
+    def elements(self):
+        """Iterate over the elements of the next array.
+
+        Every element has to be consumed before the iteration continues.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield
+            char = self.peek()
+            self.pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError("Expected ',' or ']' at position {} of the JSON buffer.".format(self.pos - 1))
+
+    def items(self):
+        """Iterate over the keys of the next object.
+
+        The value of every key has to be consumed before the iteration continues.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise ValueError("Expected ',' or '}}' at position {} of the JSON buffer.".format(self.pos - 1))
@@ -0,0 +1,109 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+from uuid import UUID
+
+import compas
+from compas_assembly.datastructures.block import Block
+from compas_assembly.datastructures.interface import Interface
+
+
+class LazyData(object):
+    """Mixin for data objects that are decoded from their serialized payload on first access.
+
+    Parameters
+    ----------
+    text : str
+        The COMPAS JSON document of the object.
+    guid : str, optional
+        The GUID of the object, as stored in the document.
+        If no value is provided, a new GUID is generated when it is first accessed.
+
+    Notes
+    -----
+    Until it is loaded, the object only stores the text of its payload and its GUID.
+    Accessing any other attribute, or setting an attribute, decodes the payload,
+    after which the object becomes a regular instance of the class of the payload,
+    with the same identity and GUID.
+
+    Unloaded objects are serialized from their payload directly.
+
+    """
+
+    def __init__(self, text, guid=None):
+        self.__dict__["_text"] = text
+        self.__dict__["_guid"] = UUID(guid) if guid else None
+
+    def __getattr__(self, name):
+        if name.startswith("__") or "_text" not in self.__dict__:
+            raise AttributeError(name)
+        self.load()
+        return getattr(self, name)
+
+    def __setattr__(self, name, value):
+        if name != "_guid":
+            self.load()
+        object.__setattr__(self, name, value)
+
+    def __jsondump__(self, minimal=False):
+        if minimal:
+            return json.loads(self._text, object_hook=_minimal)
+        state = json.loads(self._text)
+        state["guid"] = str(self.guid)
+        return state
+
+    def __getstate__(self):
+        return {"__dict__": dict(self.__dict__)}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state["__dict__"])
+
+    def load(self):
+        """Decode the payload and turn the object into a regular instance of the class of the payload.
+
+        Returns
+        -------
+        :class:`compas.data.Data`
+            The object itself.
+
+        """
+        if "_text" not in self.__dict__:
+            return self
+        obj = compas.json_loads(self.__dict__["_text"])
+        guid = self.__dict__["_guid"]
+        self.__dict__.clear()
+        self.__dict__.update(obj.__dict__)
+        if guid:
+            self.__dict__["_guid"] = guid
+        self.__class__ = type(obj)
+        return self
+
+
+class LazyBlock(LazyData, Block):
+    """A block that is decoded from its serialized payload on first access.
+
+    See Also
+    --------
+    :class:`LazyData`, :func:`compas_assembly.datastructures.assembly_json_load`
+
+    """
+
+
+class LazyInterface(LazyData, Interface):
+    """An interface that is decoded from its serialized payload on first access.
+
+    See Also
+    --------
+    :class:`LazyData`, :func:`compas_assembly.datastructures.assembly_json_load`
+
+    """
+
+
+def _minimal(obj):
+    # the minimal form of nested data objects has no name and no GUID
+    if "dtype" in obj and "data" in obj:
+        obj.pop("name", None)
+        obj.pop("guid", None)
+    return obj
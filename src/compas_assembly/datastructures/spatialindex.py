@@ -0,0 +1,489 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from math import floor
+from math import sqrt
+
+
+class SpatialIndex(object):
+    """A uniform grid of axis-aligned bounding boxes that can be updated incrementally.
+
+    Parameters
+    ----------
+    cellsize : float, optional
+        The size of the cells of the grid.
+        If no value is provided, the size is derived from the boxes the first time the index is filled
+        with :meth:`SpatialIndex.build`, or from the first box that is inserted.
+
+    Attributes
+    ----------
+    cellsize : float
+        The size of the cells of the grid.
+    boxes : dict[hashable, tuple[float, float, float, float, float, float]]
+        The boxes in the index, as ``(xmin, ymin, zmin, xmax, ymax, zmax)``, per key.
+
+    Examples
+    --------
+    >>> index = SpatialIndex()
+    >>> index.build({0: (0, 0, 0, 1, 1, 1), 1: (1, 0, 0, 2, 1, 1), 2: (5, 5, 5, 6, 6, 6)})
+    >>> sorted(index.query_box((0.5, 0.5, 0.5, 1.5, 1.5, 1.5)))
+    [0, 1]
+    >>> index.query_ray((-1, 0.5, 0.5), (1, 0, 0))
+    [(1.0, 0), (2.0, 1)]
+    >>> index.nearest((4, 4, 4), k=1)
+    [(1.7320508075688772, 2)]
+
+    """
+
+    def __init__(self, cellsize=None):
+        self.cellsize = cellsize
+        self.boxes = {}
+        self._cells = {}
+        self._extent = None
+
+    def __len__(self):
+        return len(self.boxes)
+
+    def __contains__(self, key):
+        return key in self.boxes
+
+    # ==========================================================================
+    # builders
+    # ==========================================================================
+
+    def build(self, boxes):
+        """Fill the index with a collection of boxes, replacing its current contents.
+
+        Parameters
+        ----------
+        boxes : dict[hashable, tuple[float, float, float, float, float, float]]
+            The boxes per key.
+
+        Returns
+        -------
+        None
+
+        """
+        self.boxes = {}
+        self._cells = {}
+        self._extent = None
+        if not self.cellsize and boxes:
+            sizes = sorted(max(box[3] - box[0], box[4] - box[1], box[5] - box[2]) for box in boxes.values())
+            self.cellsize = sizes[len(sizes) // 2] or 1.0
+        for key, box in boxes.items():
+            self.insert(key, box)
+
+    def insert(self, key, box):
+        """Insert a box.
+
+        Parameters
+        ----------
+        key : hashable
+            The identifier of the box.
+        box : tuple[float, float, float, float, float, float]
+            The box as ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+
+        Returns
+        -------
+        None
+
+        """
+        if key in self.boxes:
+            self.remove(key)
+        if not self.cellsize:
+            self.cellsize = max(box[3] - box[0], box[4] - box[1], box[5] - box[2]) or 1.0
+        self.boxes[key] = tuple(box)
+        extent = self._box_range(box)
+        if self._extent is None:
+            self._extent = extent
+        else:
+            self._extent = [min(a, b) for a, b in zip(self._extent[:3], extent[:3])] + [max(a, b) for a, b in zip(self._extent[3:], extent[3:])]
+        for cell in self._box_cells(box):
+            self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key):
+        """Remove a box.
+
+        Parameters
+        ----------
+        key : hashable
+            The identifier of the box.
+
+        Returns
+        -------
+        None
+
+        """
+        box = self.boxes.pop(key, None)
+        if box is None:
+            return
+        emptied = False
+        for cell in self._box_cells(box):
+            keys = self._cells.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._cells[cell]
+                    emptied = True
+        if not self._cells:
+            self._extent = None
+        elif emptied:
+            # the extent only shrinks if the box touched its boundary
+            extent = self._box_range(box)
+            if any(a <= b for a, b in zip(extent[:3], self._extent[:3])) or any(a >= b for a, b in zip(extent[3:], self._extent[3:])):
+                cells = list(self._cells)
+                self._extent = [min(cell[axis] for cell in cells) for axis in range(3)] + [max(cell[axis] for cell in cells) for axis in range(3)]
+
+    def update(self, key, box):
+        """Update the box of a key.
+
+        Parameters
+        ----------
+        key : hashable
+            The identifier of the box.
+        box : tuple[float, float, float, float, float, float]
+            The new box.
+
+        Returns
+        -------
+        None
+
+        """
+        self.insert(key, box)
+
+    # ==========================================================================
+    # queries
+    # ==========================================================================
+
+    def query_box(self, box, tol=0.0):
+        """Find the keys of all boxes that overlap with a given box.
+
+        Parameters
+        ----------
+        box : tuple[float, float, float, float, float, float]
+            The query box.
+        tol : float, optional
+            The query box is inflated by this amount.
+
+        Returns
+        -------
+        list[hashable]
+
+        Notes
+        -----
+        Only the cells of the grid within the extent of the boxes in the index are searched,
+        such that the cost of the query doesn't grow with the size of the query box beyond the number of occupied cells.
+
+        """
+        xmin, ymin, zmin, xmax, ymax, zmax = box
+        box = xmin - tol, ymin - tol, zmin - tol, xmax + tol, ymax + tol, zmax + tol
+        found = set()
+        for keys in self._occupied_cells(box):
+            found.update(keys)
+        return [key for key in found if boxes_overlap(box, self.boxes[key])]
+
+    def query_sphere(self, point, radius):
+        """Find the keys of all boxes within a given distance from a point.
+
+        Parameters
+        ----------
+        point : [float, float, float]
+            The XYZ coordinates of the point.
+        radius : float
+            The maximum distance between the point and the boxes.
+
+        Returns
+        -------
+        list[hashable]
+
+        """
+        x, y, z = point[0], point[1], point[2]
+        found = self.query_box((x - radius, y - radius, z - radius, x + radius, y + radius, z + radius))
+        return [key for key in found if box_point_distance(self.boxes[key], point) <= radius]
+
+    def query_ray(self, origin, direction, tmax=None):
+        """Find the keys of all boxes hit by a ray.
+
+        Parameters
+        ----------
+        origin : [float, float, float]
+            The start point of the ray.
+        direction : [float, float, float]
+            The direction of the ray.
+        tmax : float, optional
+            The maximum value of the ray parameter.
+            If no value is provided, the ray is infinite.
+
+        Returns
+        -------
+        list[tuple[float, hashable]]
+            The ray parameter at which the ray enters the box, and the key of the box,
+            sorted by increasing parameter.
+            The parameter is zero for boxes that contain the start point of the ray.
+
+        Notes
+        -----
+        The ray parameter is expressed in units of the length of the direction vector.
+        Only the cells of the grid visited by the ray are searched.
+
+        """
+        if not self.boxes:
+            return []
+
+        s = self.cellsize
+        extent = self._extent
+        bounds = [extent[0] * s, extent[1] * s, extent[2] * s, (extent[3] + 1) * s, (extent[4] + 1) * s, (extent[5] + 1) * s]
+        clip = ray_box_intersection(origin, direction, bounds)
+        if clip is None:
+            return []
+        t0 = max(clip[0], 0.0)
+        t1 = clip[1] if tmax is None else min(clip[1], tmax)
+        if t0 > t1:
+            return []
+
+        cell = []
+        step = []
+        tnext = []
+        tdelta = []
+        for axis in range(3):
+            o = origin[axis]
+            d = direction[axis]
+            c = int(floor((o + t0 * d) / s))
+            c = min(max(c, extent[axis]), extent[axis + 3])
+            cell.append(c)
+            if d > 0:
+                step.append(1)
+                tnext.append(((c + 1) * s - o) / d)
+                tdelta.append(s / d)
+            elif d < 0:
+                step.append(-1)
+                tnext.append((c * s - o) / d)
+                tdelta.append(-s / d)
+            else:
+                step.append(0)
+                tnext.append(float("inf"))
+                tdelta.append(float("inf"))
+
+        hits = []
+        seen = set()
+        while True:
+            keys = self._cells.get(tuple(cell))
+            if keys:
+                for key in keys:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    hit = ray_box_intersection(origin, direction, self.boxes[key])
+                    if hit is None or hit[1] < 0:
+                        continue
+                    t = max(hit[0], 0.0)
+                    if tmax is None or t <= tmax:
+                        hits.append((t, key))
+            axis = tnext.index(min(tnext))
+            if tnext[axis] > t1:
+                break
+            cell[axis] += step[axis]
+            if cell[axis] < extent[axis] or cell[axis] > extent[axis + 3]:
+                break
+            tnext[axis] += tdelta[axis]
+
+        hits.sort(key=lambda hit: hit[0])
+        return hits
+
+    def nearest(self, point, k=1):
+        """Find the boxes closest to a point.
+
+        Parameters
+        ----------
+        point : [float, float, float]
+            The XYZ coordinates of the point.
+        k : int, optional
+            The number of boxes.
+
+        Returns
+        -------
+        list[tuple[float, hashable]]
+            The distance between the point and the box, and the key of the box,
+            for at most ``k`` boxes, sorted by increasing distance.
+            The distance is zero for boxes that contain the point.
+
+        Notes
+        -----
+        The search visits the cells of the grid in rings of increasing size around the cell containing the point,
+        and stops as soon as the ``k`` closest boxes are known.
+        If the number of visited cells exceeds the number of occupied cells,
+        the remaining boxes are checked directly.
+
+        """
+        if not self.boxes or k < 1:
+            return []
+
+        s = self.cellsize
+        extent = self._extent
+        center = [int(floor(point[axis] / s)) for axis in range(3)]
+        candidates = {}
+        visited = 0
+        # the rings that don't intersect the extent of the grid are empty
+        r = max(0, max(max(extent[axis] - center[axis], center[axis] - extent[axis + 3]) for axis in range(3)))
+        while True:
+            for cell in self._ring_cells(center, r):
+                visited += 1
+                keys = self._cells.get(cell)
+                if keys:
+                    for key in keys:
+                        if key not in candidates:
+                            candidates[key] = box_point_distance(self.boxes[key], point)
+            done = all(center[axis] - r <= extent[axis] and center[axis] + r >= extent[axis + 3] for axis in range(3))
+            if done or visited > len(self._cells):
+                break
+            if sum(1 for distance in candidates.values() if distance <= r * s) >= k:
+                break
+            r += 1
+
+        if not done and visited > len(self._cells):
+            for key, box in self.boxes.items():
+                if key not in candidates:
+                    candidates[key] = box_point_distance(box, point)
+
+        return sorted(((distance, key) for key, distance in candidates.items()), key=lambda item: item[0])[:k]
+
+    # ==========================================================================
+    # helpers
+    # ==========================================================================
+
+    def _box_range(self, box):
+        s = self.cellsize
+        return [int(floor(box[0] / s)), int(floor(box[1] / s)), int(floor(box[2] / s)), int(floor(box[3] / s)), int(floor(box[4] / s)), int(floor(box[5] / s))]
+
+    def _ring_cells(self, center, r):
+        # the cells at a Chebyshev distance of exactly r from the center cell, clipped to the extent of the grid
+        e = self._extent
+        ci, cj, ck = center
+        i0, i1 = max(ci - r, e[0]), min(ci + r, e[3])
+        j0, j1 = max(cj - r, e[1]), min(cj + r, e[4])
+        k0, k1 = max(ck - r, e[2]), min(ck + r, e[5])
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                if abs(i - ci) == r or abs(j - cj) == r:
+                    for k in range(k0, k1 + 1):
+                        yield i, j, k
+                else:
+                    for k in (ck - r, ck + r):
+                        if k0 <= k <= k1:
+                            yield i, j, k
+
+    def _occupied_cells(self, box):
+        # the sets of keys of the occupied cells overlapping with a box
+        # the range of cells is clipped to the extent of the grid,
+        # and the occupied cells are checked directly if the clipped range contains more cells than are occupied
+        if self._extent is None:
+            return
+        e = self._extent
+        i0, j0, k0, i1, j1, k1 = self._box_range(box)
+        i0, j0, k0 = max(i0, e[0]), max(j0, e[1]), max(k0, e[2])
+        i1, j1, k1 = min(i1, e[3]), min(j1, e[4]), min(k1, e[5])
+        if i0 > i1 or j0 > j1 or k0 > k1:
+            return
+        if (i1 - i0 + 1) * (j1 - j0 + 1) * (k1 - k0 + 1) > len(self._cells):
+            for (i, j, k), keys in self._cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1 and k0 <= k <= k1:
+                    yield keys
+            return
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                for k in range(k0, k1 + 1):
+                    keys = self._cells.get((i, j, k))
+                    if keys:
+                        yield keys
+
+    def _box_cells(self, box):
+        i0, j0, k0, i1, j1, k1 = self._box_range(box)
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                for k in range(k0, k1 + 1):
+                    yield i, j, k
+
+
+def boxes_overlap(a, b, tol=0.0):
+    """Verify that two axis-aligned boxes overlap.
+
+    Parameters
+    ----------
+    a : tuple[float, float, float, float, float, float]
+        The first box as ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+    b : tuple[float, float, float, float, float, float]
+        The second box.
+    tol : float, optional
+        The boxes are considered overlapping if they are separated by no more than this distance.
+
+    Returns
+    -------
+    bool
+
+    """
+    return a[0] <= b[3] + tol and b[0] <= a[3] + tol and a[1] <= b[4] + tol and b[1] <= a[4] + tol and a[2] <= b[5] + tol and b[2] <= a[5] + tol
+
+
+def box_point_distance(box, point):
+    """Compute the distance between an axis-aligned box and a point.
+
+    Parameters
+    ----------
+    box : tuple[float, float, float, float, float, float]
+        The box as ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+    point : [float, float, float]
+        The XYZ coordinates of the point.
+
+    Returns
+    -------
+    float
+        The distance, which is zero if the point is inside the box.
+
+    """
+    dx = max(box[0] - point[0], 0.0, point[0] - box[3])
+    dy = max(box[1] - point[1], 0.0, point[1] - box[4])
+    dz = max(box[2] - point[2], 0.0, point[2] - box[5])
+    return sqrt(dx * dx + dy * dy + dz * dz)
+
+
+def ray_box_intersection(origin, direction, box):
+    """Compute the intersection of a ray with an axis-aligned box.
+
+    Parameters
+    ----------
+    origin : [float, float, float]
+        The start point of the ray.
+    direction : [float, float, float]
+        The direction of the ray.
+    box : tuple[float, float, float, float, float, float]
+        The box as ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+
+    Returns
+    -------
+    tuple[float, float] | None
+        The parameters at which the line of the ray enters and leaves the box,
+        or None if the line doesn't intersect the box.
+        The parameters can be negative.
+
+    """
+    tnear = float("-inf")
+    tfar = float("inf")
+    for axis in range(3):
+        o = origin[axis]
+        d = direction[axis]
+        lo = box[axis]
+        hi = box[axis + 3]
+        if d == 0:
+            if o < lo or o > hi:
+                return None
+            continue
+        a = (lo - o) / d
+        b = (hi - o) / d
+        if a > b:
+            a, b = b, a
+        tnear = max(tnear, a)
+        tfar = min(tfar, b)
+        if tnear > tfar:
+            return None
+    return tnear, tfar
@@ -10,6 +10,18 @@ class Geometry(object):
     def blocks(self):
         raise NotImplementedError
 
+    def blocks_numpy(self):
+        """Compute the vertices of all blocks in one array.
+
+        Returns
+        -------
+        tuple[ndarray, list[list[int]]]
+            The vertices of the blocks, with shape (n, v, 3),
+            and the face cycles shared by all blocks, referring to the vertices of every block.
+
+        """
+        raise NotImplementedError
+
     def interfaces(self):
         raise NotImplementedError
 
@@ -92,3 +92,55 @@ class Arch(Geometry):
             bottom = top
 
         return blocks
+
+    def blocks_numpy(self):
+        """Compute the vertices of all blocks in one array.
+
+        Returns
+        -------
+        tuple[ndarray, list[list[int]]]
+            The vertices of the blocks, with shape (n, 8, 3),
+            in the same order as the blocks of :meth:`Arch.blocks`,
+            and the face cycles shared by all blocks.
+
+        Warnings
+        --------
+        This method requires Numpy and cannot be used directly inside Rhino.
+
+        """
+        from numpy import arange
+        from numpy import array
+        from numpy import concatenate
+        from numpy import cos
+        from numpy import sin
+        from numpy import tile
+
+        if self.rise > self.span / 2:
+            raise Exception("Not a semicircular arch.")
+
+        radius = self.rise / 2 + self.span**2 / (8 * self.rise)
+        left = [-self.span / 2, 0.0, 0.0]
+        center = [0.0, 0.0, self.rise - radius]
+        springing = angle_vectors(subtract_vectors(left, center), [-1.0, 0.0, 0.0])
+        sector = radians(180) - 2 * springing
+        angle = sector / self.n
+
+        # the joints between the voussoirs, as rotations of the section at the top about the center
+        section = array([[0.0, 0.0, self.rise], [0.0, self.depth, self.rise], [0.0, self.depth, self.rise + self.thickness], [0.0, 0.0, self.rise + self.thickness]])
+        alpha = 0.5 * sector - arange(self.n + 1) * angle
+        x = section[:, 0] - center[0]
+        z = section[:, 2] - center[2]
+        c = cos(alpha)[:, None]
+        s = sin(alpha)[:, None]
+        joints = array([center[0] + c * x + s * z, tile(section[:, 1], (self.n + 1, 1)), center[2] - s * x + c * z]).transpose((1, 2, 0))
+
+        vertices = concatenate((joints[:-1], joints[1:]), axis=1)
+        faces = [
+            [0, 1, 2, 3],
+            [7, 6, 5, 4],
+            [3, 7, 4, 0],
+            [6, 2, 1, 5],
+            [7, 3, 2, 6],
+            [5, 1, 0, 4],
+        ]
+        return vertices, faces
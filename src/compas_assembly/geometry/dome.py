@@ -115,3 +115,56 @@ class Dome(Geometry):
                 blocks.append(block)
 
         return blocks
+
+    def blocks_numpy(self):
+        """Compute the vertices of all blocks in one array.
+
+        Returns
+        -------
+        tuple[ndarray, list[list[int]]]
+            The vertices of the blocks, with shape (meridians * hoops, 8, 3),
+            in the same order as the blocks of :meth:`Dome.blocks`,
+            and the face cycles shared by all blocks.
+
+        Warnings
+        --------
+        This method requires Numpy and cannot be used directly inside Rhino.
+
+        """
+        from numpy import arange
+        from numpy import array
+        from numpy import cos
+        from numpy import sin
+        from numpy import where
+
+        phi_delta = 2 * pi / self.meridians
+        theta_delta = (self.spring - self.oculus) / self.hoops
+
+        phi = arange(self.meridians + 1) * phi_delta
+        theta = self.oculus + arange(self.hoops + 1) * theta_delta
+        r = self.r_i + (self.r_f - self.r_i) / (self.spring - self.oculus) * theta
+        R = self.R_i + (self.R_f - self.R_i) / (self.spring - self.oculus) * theta
+
+        # the hoop and meridian of every block, with the hoops varying fastest
+        i = arange(self.meridians * self.hoops) % self.hoops
+        j = arange(self.meridians * self.hoops) // self.hoops
+        # the offsets of the hoop and meridian, and the side, of the eight vertices of a block
+        di = array([0, 0, 0, 0, 1, 1, 1, 1])
+        dj = array([0, 0, 1, 1, 0, 0, 1, 1])
+        outer = array([False, True, True, False, False, True, True, False])
+
+        step = where(i % 2 == 0, 0.0, 0.5 * phi_delta)
+        t = theta[i[:, None] + di]
+        p = phi[j[:, None] + dj] + step[:, None]
+        rho = where(outer, R[i[:, None] + di], r[i[:, None] + di])
+
+        vertices = array([rho * sin(t) * cos(p), rho * sin(t) * sin(p), rho * cos(t)]).transpose((1, 2, 0))
+        faces = [
+            [0, 4, 5, 1],
+            [1, 5, 6, 2],
+            [0, 1, 2, 3],
+            [0, 3, 7, 4],
+            [5, 4, 7, 6],
+            [6, 7, 3, 2],
+        ]
+        return vertices, faces
@@ -103,6 +103,7 @@ class DEMViewer(App):
             enable_sidebar=True,
             **kwargs,
         )
+        self.assembly = None
         self.blocks = []
         self.interfaces = []
         self._compression = []
@@ -127,6 +128,8 @@ class DEMViewer(App):
         color_support=Color.red(),
         color_block=Color.grey(),
     ):
+        self.assembly = assembly
+
         node_point = {}
         nodes = []
         properties = []
@@ -246,6 +249,30 @@ class DEMViewer(App):
             linecolor=Color.green(),
         )
 
+    def pick(self, origin, direction):
+        """Find the block of the assembly hit by a picking ray.
+
+        Parameters
+        ----------
+        origin : [float, float, float]
+            The start point of the ray, for example the position of the camera.
+        direction : [float, float, float]
+            The direction of the ray.
+
+        Returns
+        -------
+        hashable | None
+            The node of the block, or None if no block is hit.
+
+        See Also
+        --------
+        :meth:`compas_assembly.datastructures.Assembly.ray_pick`
+
+        """
+        if self.assembly is None:
+            return None
+        return self.assembly.ray_pick(origin, direction)
+
     def _add_sidebar_items(self, items, *args, **kwargs):
         for item in items:
             if item["type"] == "radio":
@@ -0,0 +1,124 @@
+import json
+
+import pytest
+
+import compas
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Translation
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+from compas_assembly.datastructures import BlockView
+from compas_assembly.geometry import Dome
+
+
+def brick(x, y, z):
+    return Block.from_shape(Box(1.0, 0.5, 0.3, Frame([x, y, z], [1, 0, 0], [0, 1, 0])))
+
+
+def wall(columns=4, courses=3):
+    assembly = Assembly(name="wall", author="test")
+    for k in range(courses):
+        offset = 0.5 if k % 2 else 0.0
+        for i in range(columns):
+            assembly.add_block(brick(i + offset, 0, 0.15 + k * 0.3))
+    assembly_interfaces_numpy(assembly, tmax=1e-6, amin=1e-2, nnbrs_mode="radius")
+    return assembly
+
+
+def state(assembly):
+    return json.loads(compas.json_dumps(assembly, minimal=True))
+
+
+def reference(assembly):
+    return state(compas.json_loads(compas.json_dumps(assembly)))
+
+
+@pytest.fixture
+def assembly():
+    assembly = wall()
+    assembly.set_boundary_conditions([0, 1, 2, 3])
+    assembly.graph.node_attribute(5, "displacement", [0.1, 0, 0, 0, 0, 0.2])
+    assembly.graph.node_attribute(6, "section", {"name": "custom"})
+    assembly.node_block(7).name = "keystone"
+    assembly.node_block(8).attributes["material"] = "stone"
+    assembly.node_block(9).update_default_face_attributes(is_support=False)
+    assembly.node_block(9).face_attribute(0, "is_support", True)
+
+    edges = list(assembly.edges())
+    for interface in assembly.edge_interfaces(edges[0]):
+        interface.forces = [{"c_np": 1.0 * i, "c_nn": 0.0, "c_u": 0.5, "c_v": -0.5} for i in range(len(interface.points))]
+    for interface in assembly.edge_interfaces(edges[1]):
+        interface.forces = [{"c_np": 1.0}]
+    assembly.graph.edge_attribute(edges[2], "weight", 2.0)
+    return assembly
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+@pytest.mark.parametrize("mmap_mode", ["c", "r", None])
+def test_roundtrip(assembly, tmp_path, lazy, mmap_mode):
+    filepath = str(tmp_path / "assembly.bin")
+    assembly.to_binary(filepath)
+    loaded = Assembly.from_binary(filepath, lazy=lazy, mmap_mode=mmap_mode)
+
+    assert state(loaded) == reference(assembly)
+    assert [block.guid for block in loaded.blocks()] == [block.guid for block in assembly.blocks()]
+    assert all(loaded.has_block(block) for block in loaded.blocks())
+    assert isinstance(loaded.node_block(0), BlockView if lazy else Block)
+    assert isinstance(loaded.node_block(9), Block)
+
+
+def test_lazy_frames(assembly, tmp_path):
+    filepath = str(tmp_path / "assembly.bin")
+    assembly.to_binary(filepath)
+    loaded = Assembly.from_binary(filepath)
+
+    interfaces = list(loaded.interfaces())
+    assert all(interface._frame is None for interface in interfaces)
+
+    # writing the loaded assembly doesn't construct the frames either
+    loaded.to_binary(str(tmp_path / "copy.bin"))
+    assert all(interface._frame is None for interface in interfaces)
+
+    for interface, original in zip(interfaces, assembly.interfaces()):
+        assert list(interface.frame.point) == pytest.approx(list(original.frame.point))
+        assert list(interface.frame.zaxis) == pytest.approx(list(original.frame.zaxis))
+
+    assert state(Assembly.from_binary(str(tmp_path / "copy.bin"))) == reference(assembly)
+
+
+def test_roundtrip_compact(assembly, tmp_path):
+    filepath = str(tmp_path / "assembly.bin")
+    assembly.compact()
+    assembly.to_binary(filepath)
+    loaded = Assembly.from_binary(filepath)
+
+    assert state(loaded) == reference(assembly)
+    assert loaded.buffer is not None
+
+
+def test_roundtrip_dome(tmp_path):
+    filepath = str(tmp_path / "dome.bin")
+    assembly = Assembly.from_template(Dome(meridians=12, hoops=6))
+    assembly_interfaces_numpy(assembly, nmax=20, tmax=1e-1, amin=1e-3)
+    assembly.to_binary(filepath)
+    loaded = Assembly.from_binary(filepath)
+
+    assert state(loaded) == reference(assembly)
+
+
+def test_transform_copy_on_write(assembly, tmp_path):
+    filepath = str(tmp_path / "assembly.bin")
+    assembly.to_binary(filepath)
+    loaded = Assembly.from_binary(filepath)
+    loaded.transform(Translation.from_vector([1.0, 0.0, 0.0]))
+
+    assert state(Assembly.from_binary(filepath)) == reference(assembly)
+
+
+def test_not_a_container(tmp_path):
+    filepath = str(tmp_path / "assembly.json")
+    compas.json_dump(wall(), filepath)
+    with pytest.raises(ValueError):
+        Assembly.from_binary(filepath)
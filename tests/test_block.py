@@ -0,0 +1,106 @@
+import pytest
+
+from compas.geometry import Box
+from compas.geometry import Translation
+from compas_assembly.datastructures import Block
+
+
+def block():
+    return Block.from_shape(Box(2.0, 1.0, 0.5))
+
+
+def test_cache_info():
+    b = block()
+    assert b.cache_info() == {"hits": 0, "misses": 0, "size": 0}
+
+    b.centroid()
+    b.centroid()
+    b.volume()
+    assert b.cache_info() == {"hits": 1, "misses": 2, "size": 2}
+
+    b.invalidate_cache()
+    assert b.cache_info()["size"] == 0
+
+    b.centroid()
+    assert b.cache_info() == {"hits": 1, "misses": 3, "size": 1}
+
+
+def test_cached_objects_are_copies():
+    b = block()
+
+    centroid = b.centroid()
+    centroid.x += 10
+    assert b.centroid().x == pytest.approx(0.0)
+
+    frame = b.frame(0)
+    frame.point.z += 10
+    assert b.frame(0).point.z == pytest.approx(frame.point.z - 10)
+
+    frames = b.frames()
+    frames[0].point.x += 10
+    assert b.frames()[0].point.x == pytest.approx(frames[0].point.x - 10)
+
+    normals = b.normals()
+    normals[0].scale(2)
+    assert b.normals()[0].length == pytest.approx(1.0)
+
+    box = b.aabb()
+    box.xsize = 100
+    assert b.aabb().xsize == pytest.approx(2.0)
+
+
+def test_invalidated_by_transform_and_attributes():
+    b = block()
+    assert b.centroid().x == pytest.approx(0.0)
+
+    b.transform(Translation.from_vector([1, 0, 0]))
+    assert b.centroid().x == pytest.approx(1.0)
+
+    for vertex in b.vertices():
+        x = b.vertex_attribute(vertex, "x")
+        b.vertex_attribute(vertex, "x", x + 1)
+    assert b.centroid().x == pytest.approx(2.0)
+    assert b.bounds()[0] == pytest.approx(1.0)
+
+
+def test_invalidated_by_unify_cycles():
+    b = block()
+    top = b.top()
+    normal = b.normals()[top]
+
+    # reverse the top face, such that the cycles are no longer consistent
+    vertices = b.face_vertices(top)
+    b.delete_face(top)
+    top = b.add_face(vertices[::-1])
+    assert b.normals()[top].dot(normal) == pytest.approx(-1.0)
+
+    b.unify_cycles()
+    assert b.normals()[top].dot(normal) == pytest.approx(1.0)
+    assert b.top() == top
+    assert b.volume() == pytest.approx(1.0)
+
+
+def test_invalidated_by_remove_duplicate_vertices():
+    b = block()
+    key = b.add_vertex(attr_dict=b.vertex_attributes(0))
+    face = b.face_vertices(0)
+    b.delete_face(0)
+    b.add_face([key if vertex == 0 else vertex for vertex in face])
+    assert b.number_of_vertices() == 9
+
+    b.centroid()
+    b.remove_duplicate_vertices()
+    assert b.number_of_vertices() == 8
+    assert b.centroid().x == pytest.approx(0.0)
+    assert b.cache_info()["size"] == 1
+
+
+def test_invalidated_by_split_face():
+    b = block()
+    assert len(b.frames()) == 6
+
+    face = next(b.faces())
+    a, _, c, _ = b.face_vertices(face)
+    b.split_face(face, a, c)
+    assert len(b.frames()) == 7
+    assert len(b.normals()) == 7
@@ -0,0 +1,133 @@
+import json
+
+import pytest
+
+import compas
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Translation
+from compas_assembly.algorithms.interfaces_numpy import mesh_face_arrays
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+from compas_assembly.datastructures import BlockBuffer
+from compas_assembly.datastructures import BlockView
+
+
+def brick(x, y, z):
+    return Block.from_shape(Box(1.0, 0.5, 0.3, Frame([x, y, z], [1, 0, 0], [0, 1, 0])))
+
+
+def wall(columns=3, courses=2):
+    assembly = Assembly()
+    for k in range(courses):
+        for i in range(columns):
+            assembly.add_block(brick(i + 0.5 * (k % 2), 0, 0.15 + k * 0.3))
+    return assembly
+
+
+@pytest.fixture
+def blocks():
+    return [brick(0, 0, 0), brick(1, 0, 0), brick(0.5, 0, 0.3)]
+
+
+def test_queries_match_block(blocks):
+    buffer = BlockBuffer.from_blocks(blocks)
+    for index, block in enumerate(blocks):
+        view = buffer.view(index)
+        assert view.number_of_vertices() == block.number_of_vertices()
+        assert view.number_of_faces() == block.number_of_faces()
+        assert list(view.centroid()) == pytest.approx(list(block.centroid()))
+        assert list(view.center()) == pytest.approx(list(block.center()))
+        assert view.volume() == pytest.approx(block.volume())
+        assert view.bounds() == pytest.approx(block.bounds())
+        assert view.top() == block.top()
+        for face, frame in view.frames().items():
+            assert list(frame.point) == pytest.approx(list(block.frame(face).point))
+            assert list(frame.zaxis) == pytest.approx(list(block.frame(face).zaxis))
+
+        xyz, faces, degrees = view.face_arrays()
+        expected = mesh_face_arrays(block)
+        assert xyz.tolist() == expected[0].tolist()
+        assert faces.tolist() == expected[1].tolist()
+        assert degrees.tolist() == expected[2].tolist()
+
+
+def test_transform_writes_through(blocks):
+    buffer = BlockBuffer.from_blocks(blocks)
+    first = buffer.view(0)
+    second = buffer.view(0)
+    other = buffer.view(1)
+    x = other.centroid().x
+
+    assert first.centroid().x == pytest.approx(0.0)
+    first.transform(Translation.from_vector([2, 0, 0]))
+
+    assert first.centroid().x == pytest.approx(2.0)
+    assert second.xyz[:, 0].mean() == pytest.approx(2.0)
+    assert buffer.block_xyz(0)[:, 0].mean() == pytest.approx(2.0)
+    assert other.centroid().x == pytest.approx(x)
+
+
+def test_vertex_coordinates_write_through(blocks):
+    buffer = BlockBuffer.from_blocks(blocks)
+    view = buffer.view(2)
+    top = view.bounds()[5]
+
+    for vertex in view.vertices():
+        z = view.vertex_attribute(vertex, "z")
+        view.vertex_attribute(vertex, "z", z + 1.0)
+
+    assert view.bounds()[5] == pytest.approx(top + 1.0)
+    assert buffer.block_xyz(2)[:, 2].max() == pytest.approx(top + 1.0)
+
+    view.vertex_attributes(0, "xy", [5.0, 6.0])
+    assert view.vertex_coordinates(0) == pytest.approx([5.0, 6.0, view.vertex_attribute(0, "z")])
+    assert view.vertex_attribute(0, "is_support") is None
+
+    with pytest.raises(ValueError):
+        view.vertex_attribute(0, "is_support", True)
+
+
+def test_unsupported_api(blocks):
+    view = BlockBuffer.from_blocks(blocks).view(0)
+
+    with pytest.raises(AttributeError, match="to_block"):
+        view.add_face([0, 1, 2])
+
+    with pytest.raises(AttributeError, match="to_block"):
+        view.face_attribute(0, "is_support")
+
+    with pytest.raises(AttributeError, match="has no attribute"):
+        view.not_an_attribute
+
+    assert not hasattr(view, "delete_face")
+
+
+def test_serialization(blocks):
+    view = BlockBuffer.from_blocks(blocks).view(1, name="keystone", attributes={"material": "stone"})
+
+    assert view.__dtype__ == "compas_assembly.datastructures/Block"
+    assert view.__data__ == view.to_block().__data__
+
+    data = json.loads(compas.json_dumps(view))
+    assert data["dtype"] == "compas_assembly.datastructures/Block"
+    assert data["guid"] == str(view.guid)
+
+    block = compas.json_loads(compas.json_dumps(view))
+    assert type(block) is Block
+    assert block.name == "keystone"
+    assert block.attributes["material"] == "stone"
+    assert block.vertices_attributes("xyz") == view.vertices_attributes("xyz")
+
+
+def test_compact_assembly_serialization():
+    assembly = wall()
+    expected = json.loads(compas.json_dumps(assembly))
+    assembly.compact()
+    assert all(isinstance(block, BlockView) for block in assembly.blocks())
+
+    data = json.loads(compas.json_dumps(assembly))
+    assert data == expected
+
+    loaded = compas.json_loads(compas.json_dumps(assembly))
+    assert all(type(block) is Block for block in loaded.blocks())
@@ -0,0 +1,104 @@
+from math import radians
+
+import pytest
+from numpy import array
+
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Rotation
+from compas_assembly.algorithms.broadphase import aabbs_numpy
+from compas_assembly.algorithms.broadphase import aabbs_overlap
+from compas_assembly.algorithms.broadphase import blocks_aabbs_numpy
+from compas_assembly.algorithms.broadphase import broadphase_pairs
+from compas_assembly.algorithms.broadphase import obbs_numpy
+from compas_assembly.algorithms.broadphase import obbs_overlap
+from compas_assembly.datastructures import Block
+from compas_assembly.datastructures import BlockBuffer
+
+PAIR = array([[0, 1]])
+
+
+def box(x, y=0.0, z=0.0, xsize=1.0, ysize=0.6, zsize=0.3, angle=0.0):
+    frame = Frame([x, y, z], [1, 0, 0], [0, 1, 0])
+    if angle:
+        frame.transform(Rotation.from_axis_and_angle([0, 0, 1], radians(angle), point=[x, y, z]))
+    return Box(xsize, ysize, zsize, frame).to_vertices_and_faces()[0]
+
+
+def test_obbs_of_box():
+    centers, axes, extents = obbs_numpy([box(1.0, xsize=4.0, ysize=2.0, zsize=1.0, angle=30)])
+
+    assert centers[0].tolist() == pytest.approx([1.0, 0.0, 0.0])
+    assert sorted(extents[0].tolist()) == pytest.approx([0.5, 1.0, 2.0])
+    assert abs(axes[0].dot(axes[0].T) - array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])).max() < 1e-12
+
+
+@pytest.mark.parametrize(
+    "gap, tol, expected",
+    [
+        (-0.5, 0.0, True),
+        (0.5, 0.0, False),
+        (0.0, 0.0, True),
+        (1e-7, 1e-6, True),
+        (1e-5, 1e-6, False),
+    ],
+)
+def test_overlap(gap, tol, expected):
+    clouds = [box(0.0), box(1.0 + gap, y=0.3, z=-0.2)]
+
+    assert aabbs_overlap(aabbs_numpy(clouds), PAIR, tol=tol).tolist() == [expected]
+    assert obbs_overlap(obbs_numpy(clouds), PAIR, tol=tol).tolist() == [expected]
+    assert len(broadphase_pairs(clouds, PAIR, tol=tol, oriented=True)) == int(expected)
+
+
+def test_touching_rotated_within_tol():
+    # two rotated boxes with parallel faces, at a distance smaller than the tolerance
+    c = 0.5**0.5
+    d = 1.0 + 1e-7
+    clouds = [box(0.0, angle=45), box(c * d, y=c * d, angle=45)]
+
+    assert obbs_overlap(obbs_numpy(clouds), PAIR, tol=1e-6).tolist() == [True]
+    assert obbs_overlap(obbs_numpy(clouds), PAIR, tol=0.0).tolist() == [False]
+
+
+def test_rotated_only_obb_rejects():
+    # two long slender boxes along the diagonal, side by side
+    # their axis-aligned bounding boxes overlap almost entirely, but they are separated by a gap of 0.3
+    offset = 0.5 * 0.5**0.5
+    clouds = [
+        box(0.0, xsize=4.0, ysize=0.2, angle=45),
+        box(-offset, y=offset, xsize=4.0, ysize=0.2, angle=45),
+    ]
+
+    assert aabbs_overlap(aabbs_numpy(clouds), PAIR).tolist() == [True]
+    assert obbs_overlap(obbs_numpy(clouds), PAIR).tolist() == [False]
+    assert len(broadphase_pairs(clouds, PAIR)) == 1
+    assert len(broadphase_pairs(clouds, PAIR, oriented=True)) == 0
+
+
+def test_rotated_overlap():
+    clouds = [box(0.0, xsize=4.0, ysize=0.2, angle=45), box(0.0, xsize=4.0, ysize=0.2, angle=-45)]
+
+    assert obbs_overlap(obbs_numpy(clouds), PAIR).tolist() == [True]
+    assert len(broadphase_pairs(clouds, PAIR, oriented=True)) == 1
+
+
+def test_no_pairs():
+    pairs = array([], dtype=int).reshape((0, 2))
+    assert len(broadphase_pairs([box(0.0), box(5.0)], pairs, oriented=True)) == 0
+
+
+def test_blocks_aabbs():
+    blocks = [Block.from_vertices_and_faces(*Box(1.0, 0.6, 0.3, Frame([x, 0, 0], [1, 0, 0], [0, 1, 0])).to_vertices_and_faces()) for x in range(3)]
+    blocks[1].transform(Rotation.from_axis_and_angle([0, 0, 1], radians(30), point=[1, 0, 0]))
+    expected = aabbs_numpy([block.vertices_attributes("xyz") for block in blocks])
+
+    # the bounds are computed once and then read from the cache of the blocks
+    assert blocks_aabbs_numpy(blocks).tolist() == expected.tolist()
+    assert blocks_aabbs_numpy(blocks).tolist() == expected.tolist()
+    assert all(block.cache_info()["hits"] == 1 for block in blocks)
+
+    # the boxes of views on a buffer are computed from the buffer, also for a subset of the blocks in a different order
+    buffer = BlockBuffer.from_blocks(blocks)
+    views = [buffer.view(2), buffer.view(0)]
+    assert blocks_aabbs_numpy(views).tolist() == expected[[2, 0]].tolist()
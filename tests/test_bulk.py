@@ -0,0 +1,79 @@
+import pytest
+
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+from compas_assembly.datastructures import BlockView
+from compas_assembly.geometry import Arch
+
+
+def brick(x):
+    return Block.from_shape(Box(1.0, 1.0, 1.0, Frame([x, 0, 0], [1, 0, 0], [0, 1, 0])))
+
+
+def test_add_blocks():
+    assembly = Assembly()
+    first = assembly.add_block(brick(0))
+    assembly.spatial_index
+
+    blocks = [brick(x) for x in range(1, 4)]
+    nodes = assembly.add_blocks(blocks, attrs=[{"is_support": x == 1} for x in range(1, 4)])
+
+    assert nodes == [first + 1, first + 2, first + 3]
+    assert [assembly.node_block(node) for node in nodes] == blocks
+    assert all(assembly.block_node(block) == node for block, node in zip(blocks, nodes))
+    assert assembly.graph.node_attribute(nodes[0], "is_support")
+    assert not assembly.graph.node_attribute(nodes[1], "is_support")
+    assert sorted(assembly.blocks_in_box((2.4, -0.1, -0.1, 2.6, 0.1, 0.1))) == [nodes[1], nodes[2]]
+
+    with pytest.raises(Exception):
+        assembly.add_blocks([brick(5), blocks[0]])
+    with pytest.raises(Exception):
+        block = brick(5)
+        assembly.add_blocks([block, block])
+    assert assembly.number_of_nodes() == 4
+    assert assembly.add_block(brick(6)) == nodes[-1] + 1
+
+
+def test_from_mesh_ownership():
+    mesh = Mesh.from_shape(Box(1.0))
+    block = Block.from_mesh(mesh, copy=False)
+
+    assert block is mesh
+    assert isinstance(block, Block)
+    assert block.volume() == pytest.approx(1.0)
+    assert block.node is None
+
+    copy = Block.from_mesh(Mesh.from_shape(Box(1.0)))
+    assert copy.volume() == pytest.approx(1.0)
+
+
+def test_from_arrays_stacked():
+    template = Arch(rise=5, span=10, thickness=0.7, depth=0.5, n=20)
+    vertices, faces = template.blocks_numpy()
+    reference = Assembly.from_template(template)
+
+    for compact in (True, False):
+        assembly = Assembly.from_arrays(vertices, faces, compact=compact)
+        assert (assembly.buffer is not None) == compact
+        assert all(isinstance(block, BlockView if compact else Block) for block in assembly.blocks())
+        for a, b in zip(assembly.blocks(), reference.blocks()):
+            assert a.volume() == pytest.approx(b.volume())
+
+
+def test_from_arrays_offsets():
+    box = Mesh.from_shape(Box(1.0))
+    pyramid = Mesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0.5, 0.5, 1]], [[3, 2, 1, 0], [0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]])
+    meshes = [box, pyramid, box]
+
+    vertices = [point for mesh in meshes for point in mesh.vertices_attributes("xyz")]
+    faces = [mesh.face_vertices(face) for mesh in meshes for face in mesh.faces()]
+    vertex_offsets = [0, 8, 13, 21]
+    face_offsets = [0, 6, 11, 17]
+
+    for compact in (True, False):
+        assembly = Assembly.from_arrays(vertices, faces, offsets=(vertex_offsets, face_offsets), attrs=[{"name": i} for i in range(3)], compact=compact)
+        assert [block.volume() for block in assembly.blocks()] == pytest.approx([1.0, 1.0 / 3, 1.0])
+        assert [assembly.graph.node_attribute(node, "name") for node in assembly.nodes()] == [0, 1, 2]
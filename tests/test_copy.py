@@ -0,0 +1,88 @@
+import pytest
+
+import compas
+from compas.geometry import Rotation
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.geometry import Arch
+
+
+@pytest.fixture
+def assembly():
+    assembly = Assembly.from_template(Arch(rise=5, span=10, thickness=0.7, depth=0.5, n=10))
+    assembly_interfaces_numpy(assembly, nmax=20, tmax=1e-1, amin=1e-3)
+    return assembly
+
+
+def test_copy(assembly):
+    copy = assembly.copy()
+
+    assert compas.json_dumps(copy.graph.__data__) == compas.json_dumps(assembly.graph.__data__)
+    for node in assembly.nodes():
+        a = assembly.node_block(node)
+        b = copy.node_block(node)
+        assert a is not b
+        assert a.guid == b.guid
+        assert copy.block_node(b) == node
+        assert b.face == a.face
+        assert b.face is not a.face
+
+    block = copy.node_block(0)
+    block.vertex_attribute(0, "x", 100.0)
+    assert assembly.node_block(0).vertex_attribute(0, "x") != 100.0
+
+    block.delete_face(0)
+    assert assembly.node_block(0).number_of_faces() == 6
+    assert assembly.node_block(0).is_valid()
+
+
+def test_copy_topology_in_place(assembly):
+    original = assembly.node_block(0)
+    face = {key: vertices[:] for key, vertices in original.face.items()}
+    halfedge = {u: dict(nbrs) for u, nbrs in original.halfedge.items()}
+
+    # methods of the mesh that modify the face cycles and halfedges in place
+    block = assembly.copy().node_block(0)
+    block.unify_cycles(root=next(block.faces()))
+    block.flip_cycles()
+    for key in block.faces():
+        block.face[key].reverse()
+    a, b, c = block.face_vertices(0)[:3]
+    block.split_face(0, a, c)
+
+    assert original.face == face
+    assert original.halfedge == halfedge
+    assert original.is_valid()
+
+
+def test_interfaces_copy_on_write(assembly):
+    copy = assembly.copy()
+    assert all(a is b for a, b in zip(assembly.interfaces(), copy.interfaces()))
+
+    p = len(copy.interface_arrays().points)
+    copy.set_interface_forces([[1.0, 0.0, 0.0, 0.0]] * p)
+
+    assert all(a is not b for a, b in zip(assembly.interfaces(), copy.interfaces()))
+    assert all(interface.forces is None for interface in assembly.interfaces())
+    assert all(interface.forces[0]["c_np"] == 1.0 for interface in copy.interfaces())
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_transformed(assembly, compact):
+    if compact:
+        assembly.compact()
+    R = Rotation.from_axis_and_angle([1.0, 0, 0], 0.3, point=[1.0, 2.0, 3.0])
+    points = {node: assembly.node_block(node).vertices_attributes("xyz") for node in assembly.nodes()}
+
+    transformed = assembly.transformed(R)
+
+    if compact:
+        assert transformed.buffer.faces is assembly.buffer.faces
+        assert transformed.buffer.xyz is not assembly.buffer.xyz
+    for node in assembly.nodes():
+        assert assembly.node_block(node).vertices_attributes("xyz") == points[node]
+        block = assembly.node_block(node).copy()
+        block.transform(R)
+        result = transformed.node_block(node)
+        assert [x for point in result.vertices_attributes("xyz") for x in point] == pytest.approx([x for point in block.vertices_attributes("xyz") for x in point])
+        assert list(result.centroid()) == pytest.approx(list(block.centroid()))
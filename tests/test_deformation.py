@@ -0,0 +1,64 @@
+import pytest
+
+from compas.geometry import Rotation
+from compas.geometry import Translation
+from compas_assembly.algorithms import assembly_deformation_frames
+from compas_assembly.algorithms import assembly_deformed
+from compas_assembly.algorithms import assembly_displacement_matrices
+from compas_assembly.datastructures import Assembly
+from compas_assembly.geometry import Arch
+
+
+@pytest.fixture
+def assembly():
+    assembly = Assembly.from_template(Arch(rise=5, span=10, thickness=0.7, depth=0.5, n=10))
+    for node in assembly.nodes():
+        assembly.graph.node_attribute(node, "displacement", [0.01 * node, 0.0, -0.02, 0.0, 0.003 * node, 0.001])
+    assembly.graph.node_attribute(0, "displacement", [0, 0, 0, 0, 0, 0])
+    return assembly
+
+
+def reference(assembly, scale):
+    points = []
+    for node in assembly.nodes():
+        block = assembly.node_block(node).copy()
+        u = assembly.graph.node_attribute(node, "displacement")
+        r = [scale * x for x in u[3:]]
+        angle = sum(x**2 for x in r) ** 0.5
+        if angle:
+            block.transform(Rotation.from_axis_and_angle(r, angle, point=block.centroid()))
+        block.transform(Translation.from_vector([scale * x for x in u[:3]]))
+        points += block.vertices_attributes("xyz")
+    return [x for point in points for x in point]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_deformed(assembly, compact):
+    if compact:
+        assembly.compact()
+    original = [x for node in assembly.nodes() for point in assembly.node_block(node).vertices_attributes("xyz") for x in point]
+
+    points, offsets = assembly_deformed(assembly, scale=10.0)
+
+    assert points.ravel().tolist() == pytest.approx(reference(assembly, 10.0))
+    assert offsets.tolist() == [8 * i for i in range(assembly.number_of_nodes() + 1)]
+    assert [x for node in assembly.nodes() for point in assembly.node_block(node).vertices_attributes("xyz") for x in point] == original
+
+
+def test_matrices(assembly):
+    points, offsets = assembly_deformed(assembly, scale=5.0)
+    M = assembly_displacement_matrices(assembly, scale=5.0)
+
+    assert M.shape == (assembly.number_of_nodes(), 4, 4)
+    assembly.transform(M)
+    assert [x for node in assembly.nodes() for point in assembly.node_block(node).vertices_attributes("xyz") for x in point] == pytest.approx(points.ravel().tolist())
+
+
+def test_frames(assembly):
+    original, offsets = assembly_deformed(assembly, scale=0.0)
+    frames = list(assembly_deformation_frames(assembly, [0.0, 2.0, 10.0]))
+
+    assert len(frames) == 3
+    assert frames[0].ravel().tolist() == pytest.approx(original.ravel().tolist())
+    assert frames[1].ravel().tolist() == pytest.approx(reference(assembly, 2.0))
+    assert frames[2].ravel().tolist() == pytest.approx(assembly_deformed(assembly, scale=10.0)[0].ravel().tolist())
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import cross_vectors
+from compas.geometry import subtract_vectors
+from compas_assembly.algorithms import assembly_equilibrium_matrix
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+from compas_assembly.geometry import Dome
+
+
+def reference_matrix(assembly):
+    nodes = list(assembly.nodes())
+    free = [node for node in nodes if not assembly.graph.node_attribute(node, "is_support")]
+    row = {node: index for index, node in enumerate(free)}
+    columns = []
+    for u, v in assembly.edges():
+        for interface in assembly.edge_interfaces((u, v)):
+            frame = interface.frame
+            for point in interface.points:
+                column = np.zeros((6 * len(free), 3))
+                for node, sign in ((v, 1.0), (u, -1.0)):
+                    if node not in row:
+                        continue
+                    centroid = assembly.node_block(node).centroid()
+                    for j, axis in enumerate([frame.zaxis, frame.xaxis, frame.yaxis]):
+                        i = 6 * row[node]
+                        column[i : i + 3, j] += sign * np.array(axis)
+                        column[i + 3 : i + 6, j] += sign * np.array(cross_vectors(subtract_vectors(point, centroid), axis))
+                columns.append(column)
+    return np.hstack(columns)
+
+
+def test_equilibrium_matrix():
+    assembly = Assembly.from_template(Dome(meridians=12, hoops=4))
+    assembly_interfaces_numpy(assembly, nmax=20, tmax=1e-1, amin=1e-3)
+    assembly.set_boundary_conditions(list(assembly.nodes())[:12])
+
+    A, F, free = assembly_equilibrium_matrix(assembly, mu=0.5)
+
+    assert A.format == "csr"
+    assert free.tolist() == list(range(12, assembly.number_of_blocks()))
+    assert np.allclose(A.toarray(), reference_matrix(assembly))
+    assert F.shape == (4 * A.shape[1] // 3, A.shape[1])
+    assert F[:4, :3].toarray().tolist() == [[-0.5, 1.0, 0.0], [-0.5, -1.0, 0.0], [-0.5, 0.0, 1.0], [-0.5, 0.0, -1.0]]
+
+
+def test_equilibrium_stack():
+    # a block resting on a support can carry its own weight with compression only
+    assembly = Assembly()
+    a = assembly.add_block(Block.from_shape(Box(1.0, 1.0, 1.0, Frame([0, 0, 0.5], [1, 0, 0], [0, 1, 0]))))
+    assembly.add_block(Block.from_shape(Box(1.0, 1.0, 1.0, Frame([0, 0, 1.5], [1, 0, 0], [0, 1, 0]))))
+    assembly_interfaces_numpy(assembly, tmax=1e-6, amin=1e-2, nnbrs_mode="radius")
+    assembly.set_boundary_condition(a)
+
+    A, _, free = assembly_equilibrium_matrix(assembly, fmt="coo")
+    x, *_ = np.linalg.lstsq(A.toarray(), np.array([0, 0, 1.0, 0, 0, 0]), rcond=None)
+
+    assert A.format == "coo"
+    assert A.shape == (6, 12)
+    assert np.allclose(A @ x, [0, 0, 1.0, 0, 0, 0])
+    assert np.allclose(x[0::3], 0.25)
+
+
+def test_equilibrium_format():
+    with pytest.raises(ValueError):
+        assembly_equilibrium_matrix(Assembly(), fmt="dense")
@@ -0,0 +1,107 @@
+import json
+
+import numpy as np
+import pytest
+
+import compas
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas_assembly.algorithms import assembly_force_lines_numpy
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.algorithms import assembly_resultants_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+
+
+def brick(x, y, z):
+    return Block.from_shape(Box(1.0, 0.5, 0.3, Frame([x, y, z], [1, 0, 0], [0, 1, 0])))
+
+
+@pytest.fixture
+def assembly():
+    assembly = Assembly()
+    for k in range(3):
+        offset = 0.5 if k % 2 else 0.0
+        for i in range(4):
+            assembly.add_block(brick(i + offset, 0, 0.15 + k * 0.3))
+    assembly_interfaces_numpy(assembly, tmax=1e-6, amin=1e-2, nnbrs_mode="radius")
+    return assembly
+
+
+@pytest.fixture
+def forces(assembly):
+    p = len(assembly.interface_arrays().points)
+    forces = np.random.default_rng(0).uniform(-1.0, 1.0, (p, 4))
+    forces[:, :2] = np.abs(forces[:, :2])
+    return forces
+
+
+def lines(items):
+    return [[list(line.start), list(line.end)] for line in items]
+
+
+def test_set_interface_forces(assembly, forces):
+    assembly.set_interface_forces(forces)
+
+    assert assembly.interface_forces() is assembly._interface_forces
+    assert np.allclose(assembly.interface_forces(), forces)
+
+    interface = next(assembly.interfaces())
+    assert interface.force_view is not None
+    assert interface.forces[0] == dict(zip(["c_np", "c_nn", "c_u", "c_v"], forces[0].tolist()))
+    assert interface.force_view is None
+
+    interface.forces[0]["c_u"] = 10.0
+    result = assembly.interface_forces()
+    assert result is not assembly._interface_forces
+    assert result[0, 2] == 10.0
+    assert np.allclose(result[1:], forces[1:])
+
+    data = json.loads(compas.json_dumps(assembly))
+    assert compas.json_loads(json.dumps(data)).interface_forces()[0, 2] == 10.0
+
+
+def test_set_interface_forces_nuv(assembly):
+    p = len(assembly.interface_arrays().points)
+    nuv = np.zeros((p, 3))
+    nuv[:, 0] = np.linspace(-1.0, 1.0, p)
+    nuv[:, 1] = 0.5
+    assembly.set_interface_forces(nuv.ravel())
+    forces = assembly.interface_forces()
+
+    assert np.allclose(forces[:, 0] - forces[:, 1], nuv[:, 0])
+    assert (forces[:, :2] >= 0).all()
+    assert np.allclose(forces[:, 2], 0.5)
+
+    with pytest.raises(ValueError):
+        assembly.set_interface_forces(np.zeros((p, 5)))
+
+
+@pytest.mark.parametrize("kind", ["normal", "compression", "tension", "friction", "resultant"])
+def test_force_lines(assembly, forces, kind):
+    assembly.set_interface_forces(forces)
+    result, index = assembly_force_lines_numpy(assembly, kind=kind)
+
+    expected = []
+    expected_index = []
+    for k, interface in enumerate(assembly.interfaces()):
+        items = lines(getattr(interface, kind + "forces" if kind != "resultant" else "resultantforce"))
+        expected += items
+        expected_index += [k] * len(items)
+
+    assert np.allclose(result, expected)
+    assert index.tolist() == expected_index
+
+
+def test_resultants(assembly, forces):
+    assembly.set_interface_forces(forces)
+    points, vectors = assembly_resultants_numpy(assembly)
+
+    for interface, point in zip(assembly.interfaces(), points):
+        assert np.allclose(point, list(interface.resultantpoint))
+
+
+def test_force_lines_without_forces(assembly):
+    result, index = assembly_force_lines_numpy(assembly)
+    assert result.shape == (0, 2, 3)
+    assert index.shape == (0,)
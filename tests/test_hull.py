@@ -0,0 +1,66 @@
+import pytest
+
+from scipy.spatial import ConvexHull
+
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import convex_hull_numpy
+from compas_assembly.algorithms import assembly_hull_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+from compas_assembly.geometry import Dome
+
+
+def stack(nx=4, ny=3, nz=3):
+    assembly = Assembly()
+    for i in range(nx):
+        for j in range(ny):
+            for k in range(nz):
+                assembly.add_block(Block.from_shape(Box(1.0, 1.0, 1.0, Frame([i, j, k], [1, 0, 0], [0, 1, 0]))))
+    return assembly
+
+
+def test_hull_dome():
+    assembly = Assembly.from_template(Dome(meridians=12, hoops=6))
+    vertices, faces = assembly_hull_numpy(assembly)
+    points = [point for block in assembly.blocks() for point in block.vertices_attributes("xyz")]
+    indices, _ = convex_hull_numpy(points)
+
+    mesh = Mesh.from_vertices_and_faces(vertices, faces)
+    assert mesh.is_closed()
+    assert mesh.volume() > 0
+    # coinciding corners of neighbouring blocks can be swapped
+    assert len(vertices) == len(indices)
+    assert all(any(point == pytest.approx(vertex, abs=1e-9) for vertex in vertices) for point in (points[index] for index in indices))
+
+
+def test_hull_subset():
+    assembly = Assembly.from_template(Dome(meridians=12, hoops=6))
+    keys = list(assembly.nodes())[:4]
+    vertices, faces = assembly_hull_numpy(assembly, keys=keys)
+    points = [point for key in keys for point in assembly.node_block(key).vertices_attributes("xyz")]
+
+    assert Mesh.from_vertices_and_faces(vertices, faces).volume() == pytest.approx(ConvexHull(points).volume)
+
+
+def test_hull_stack():
+    assembly = stack()
+    vertices, faces = assembly_hull_numpy(assembly)
+    mesh = Mesh.from_vertices_and_faces(vertices, faces)
+
+    # the interior corners are discarded, and the faces point outwards
+    assert len(vertices) == 8
+    assert mesh.volume() == pytest.approx(4 * 3 * 3)
+
+
+def test_hull_keys_compact():
+    assembly = stack()
+    keys = [node for node in assembly.nodes() if assembly.node_block(node).centroid()[2] < 0.5]
+    expected = assembly_hull_numpy(assembly, keys=keys)
+
+    assembly.compact()
+    vertices, faces = assembly_hull_numpy(assembly, keys=keys)
+
+    assert sorted(vertices) == sorted(expected[0])
+    assert Mesh.from_vertices_and_faces(vertices, faces).volume() == pytest.approx(4 * 3 * 1)
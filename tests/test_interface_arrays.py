@@ -0,0 +1,66 @@
+import pytest
+
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.algorithms import merge_coplanar_interfaces
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+
+
+def brick(x, y, z):
+    return Block.from_shape(Box(1.0, 0.5, 0.3, Frame([x, y, z], [1, 0, 0], [0, 1, 0])))
+
+
+@pytest.fixture
+def assembly():
+    assembly = Assembly()
+    for k in range(3):
+        offset = 0.5 if k % 2 else 0.0
+        for i in range(4):
+            assembly.add_block(brick(i + offset, 0, 0.15 + k * 0.3))
+    assembly_interfaces_numpy(assembly, tmax=1e-6, amin=1e-2, nnbrs_mode="radius")
+    return assembly
+
+
+def test_interface_arrays(assembly):
+    arrays = assembly.interface_arrays()
+    nodes = list(assembly.nodes())
+    interfaces = list(assembly.interfaces())
+
+    assert len(arrays) == len(interfaces)
+    assert arrays.nodes == nodes
+    assert arrays.point_offsets[-1] == len(arrays.points)
+
+    k = 0
+    for u, v in assembly.edges():
+        for interface in assembly.edge_interfaces((u, v)):
+            assert nodes[arrays.edges[k, 0]] == u
+            assert nodes[arrays.edges[k, 1]] == v
+            assert arrays.interface_points(k).tolist() == [list(point) for point in interface.points]
+            assert arrays.origins[k].tolist() == list(interface.frame.point)
+            assert arrays.uvw[k, 2].tolist() == list(interface.frame.zaxis)
+            assert arrays.sizes[k] == interface.size
+            k += 1
+
+    for i, node in enumerate(nodes):
+        incident, signs = arrays.block_incidence(i)
+        expected = [(k, 1) for k in range(len(arrays)) if arrays.edges[k, 0] == i]
+        expected += [(k, -1) for k in range(len(arrays)) if arrays.edges[k, 1] == i]
+        assert sorted(zip(incident.tolist(), signs.tolist())) == sorted(expected)
+
+
+def test_interface_arrays_cache(assembly):
+    arrays = assembly.interface_arrays()
+    assert assembly.interface_arrays() is arrays
+
+    merge_coplanar_interfaces(assembly)
+    assert assembly.interface_arrays() is not arrays
+
+    arrays = assembly.interface_arrays()
+    assembly.add_block(brick(0, 0, 1.5))
+    assert assembly.interface_arrays() is not arrays
+    assert len(assembly.interface_arrays().block_offsets) == assembly.number_of_blocks() + 1
+
+    assembly.clear_interfaces()
+    assert len(assembly.interface_arrays()) == 0
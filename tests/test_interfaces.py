@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+import compas
+from compas_assembly.algorithms import assembly_interfaces
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.algorithms import assembly_interfaces_parallel
+from compas_assembly.algorithms import mesh_mesh_interfaces
+from compas_assembly.algorithms.interfaces_numpy import mesh_mesh_interfaces as mesh_mesh_interfaces_numpy
+
+HERE = os.path.dirname(__file__)
+EXAMPLES = os.path.join(HERE, "..", "docs", "examples")
+
+TMAX = 1e-3
+AMIN = 1e-2
+
+
+def load(name):
+    return compas.json_load(os.path.join(EXAMPLES, name))
+
+
+def edge_areas(assembly):
+    areas = {}
+    for edge in assembly.edges():
+        areas[frozenset(edge)] = sum(interface.size for interface in assembly.edge_interfaces(edge))
+    return areas
+
+
+EXAMPLE_NAMES = [
+    "arch_assembly.json",
+    "crossvault_assembly.json",
+    "dome_assembly.json",
+    "stack_assembly.json",
+    "two-blocks_assembly.json",
+    "wall_assembly.json",
+]
+
+
+@pytest.mark.parametrize("name", EXAMPLE_NAMES)
+def test_numpy_matches_python(name):
+    reference = load(name)
+    assembly_interfaces(reference, tmax=TMAX, amin=AMIN)
+    expected = edge_areas(reference)
+
+    assembly = load(name)
+    assembly_interfaces_numpy(assembly, tmax=TMAX, amin=AMIN)
+    result = edge_areas(assembly)
+
+    assert set(result) == set(expected)
+    for edge, area in expected.items():
+        assert result[edge] == pytest.approx(area, rel=1e-9)
+
+
+@pytest.mark.parametrize("name", ["arch_assembly.json", "crossvault_assembly.json", "wall_assembly.json"])
+def test_parallel_matches_python(name):
+    reference = load(name)
+    assembly_interfaces(reference, tmax=TMAX, amin=AMIN)
+    expected = edge_areas(reference)
+
+    assembly = load(name)
+    assembly_interfaces_parallel(assembly, tmax=TMAX, amin=AMIN, workers=2, chunksize=16)
+    result = edge_areas(assembly)
+
+    assert set(result) == set(expected)
+    for edge, area in expected.items():
+        assert result[edge] == pytest.approx(area, rel=1e-9)
+
+
+# the number of pairs of blocks with interfaces found by the original implementation, with the default parameters
+DEFAULT_EDGES = {
+    "arch_assembly.json": 29,
+    "crossvault_assembly.json": 343,
+    "stack_assembly.json": 9,
+    "two-blocks_assembly.json": 1,
+    "wall_assembly.json": 44,
+}
+
+
+@pytest.mark.parametrize("identify", [assembly_interfaces, assembly_interfaces_numpy])
+@pytest.mark.parametrize("name", sorted(DEFAULT_EDGES))
+def test_default_parameters(identify, name):
+    assembly = load(name)
+    identify(assembly)
+    assert assembly.graph.number_of_edges() == DEFAULT_EDGES[name]
+
+
+@pytest.mark.parametrize("interfaces", [mesh_mesh_interfaces, mesh_mesh_interfaces_numpy])
+def test_both_orientations(interfaces):
+    # the contact face of block 128 is not perfectly planar
+    # the flat contact face of block 81 lies in its plane, but not the other way around
+    assembly = load("crossvault_assembly.json")
+    a = assembly.node_block(81)
+    b = assembly.node_block(128)
+
+    ab = interfaces(a, b)
+    ba = interfaces(b, a)
+
+    assert len(ab) == len(ba) == 1
+    assert ab[0].size == pytest.approx(ba[0].size)
+    assert ab[0].frame.zaxis.dot(ba[0].frame.zaxis) == pytest.approx(-1.0)
+    # the frame points from the first block to the second block
+    assert ab[0].frame.zaxis.dot(b.centroid() - a.centroid()) > 0
+    assert ba[0].frame.zaxis.dot(a.centroid() - b.centroid()) > 0
@@ -0,0 +1,131 @@
+import pytest
+
+from compas.geometry import Translation
+from compas_assembly.algorithms import InterfaceCache
+from compas_assembly.algorithms import assembly_interfaces
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.algorithms import assembly_interfaces_parallel
+from compas_assembly.algorithms import assembly_profiler
+from compas_assembly.algorithms.interfaces_cache import decode_interfaces
+from compas_assembly.algorithms.interfaces_cache import encode_interfaces
+from compas_assembly.datastructures import Assembly
+from compas_assembly.geometry import Arch
+
+
+def arch():
+    return Assembly.from_template(Arch(rise=5, span=10, thickness=0.7, depth=0.5, n=12))
+
+
+def signature(assembly):
+    result = []
+    for edge in assembly.edges():
+        for interface in assembly.edge_interfaces(edge):
+            frame = interface.frame
+            result.append((edge, interface.size, [x for point in interface.points for x in point], list(frame.point) + list(frame.xaxis) + list(frame.yaxis)))
+    return result
+
+
+@pytest.mark.parametrize("identify", [assembly_interfaces_numpy, assembly_interfaces])
+def test_cache(tmp_path, identify):
+    reference = arch()
+    identify(reference, tmax=1e-3, amin=1e-2)
+
+    with InterfaceCache(str(tmp_path / "cache.sqlite")) as cache:
+        first = arch()
+        identify(first, tmax=1e-3, amin=1e-2, cache=cache)
+        pairs = cache.misses
+        assert cache.hits == 0
+        assert len(cache) == pairs
+
+        second = arch()
+        with assembly_profiler() as profiler:
+            identify(second, tmax=1e-3, amin=1e-2, cache=cache)
+        assert cache.hits == pairs
+        assert profiler.counts["cached pairs"] == pairs
+
+        assert signature(first) == signature(reference)
+        assert signature(second) == signature(reference)
+
+        identify(arch(), tmax=1e-2, amin=1e-2, cache=cache)
+        assert len(cache) == 2 * pairs
+
+    with InterfaceCache(str(tmp_path / "cache.sqlite")) as cache:
+        third = arch()
+        third.node_block(0).transform(Translation.from_vector([0, 0, 1e-6]))
+        identify(third, tmax=1e-3, amin=1e-2, cache=cache)
+        assert 0 < cache.misses < pairs
+        assert cache.hits == pairs - cache.misses
+
+
+@pytest.mark.parametrize("identify", [assembly_interfaces_numpy, assembly_interfaces])
+def test_cache_same_geometry(tmp_path, identify):
+    # the first two blocks are identical, such that their pairs with the third block have the same key
+    blocks = list(arch().blocks())
+    assembly = Assembly()
+    for block in (blocks[0], blocks[0].copy(), blocks[1]):
+        assembly.add_block(block)
+
+    with InterfaceCache(str(tmp_path / "cache.sqlite")) as cache:
+        for _ in range(2):
+            assembly.clear_interfaces()
+            identify(assembly, tmax=1e-3, amin=1e-2, nnbrs_mode="radius", cache=cache)
+            edges = [edge for edge in assembly.edges() if 2 in edge]
+            a, b = [assembly.edge_interfaces(edge) for edge in edges]
+
+            assert len(edges) == 2
+            assert len(a) == len(b) == 1
+            assert a[0] is not b[0]
+            assert a[0].size == pytest.approx(b[0].size)
+
+        assert cache.misses == cache.hits == len(cache)
+
+
+def test_parallel(tmp_path):
+    reference = arch()
+    assembly_interfaces_numpy(reference, tmax=1e-3, amin=1e-2)
+
+    with InterfaceCache(str(tmp_path / "cache.sqlite")) as cache:
+        assembly_interfaces_numpy(arch(), tmax=1e-3, amin=1e-2, cache=cache)
+        assembly = arch()
+        assembly_interfaces_parallel(assembly, tmax=1e-3, amin=1e-2, workers=1, cache=cache)
+        assert cache.misses == cache.hits
+
+    assert signature(assembly) == signature(reference)
+
+
+def test_eviction(tmp_path):
+    assembly = arch()
+    assembly_interfaces_numpy(assembly, tmax=1e-3, amin=1e-2)
+    interfaces = list(assembly.interfaces())[:1]
+    size = len(encode_interfaces(interfaces)) + 20
+
+    with InterfaceCache(str(tmp_path / "cache.sqlite"), max_size=3 * size) as cache:
+        cache.put(b"a" * 20, interfaces)
+        cache.put(b"b" * 20, interfaces)
+        cache.put(b"c" * 20, interfaces)
+        assert cache.get(b"a" * 20) is not None
+        cache.put(b"d" * 20, [])
+
+        assert cache.nbytes <= 3 * size
+        assert cache.get(b"b" * 20) is None
+        assert cache.get(b"a" * 20) is not None
+        assert cache.get(b"d" * 20) == []
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+def test_encoding():
+    assembly = arch()
+    assembly_interfaces_numpy(assembly, tmax=1e-3, amin=1e-2)
+    interfaces = list(assembly.interfaces())
+
+    decoded = decode_interfaces(encode_interfaces(interfaces))
+
+    assert len(decoded) == len(interfaces)
+    for a, b in zip(interfaces, decoded):
+        assert b.size == a.size
+        assert b.points == a.points
+        assert list(b.frame.point) == list(a.frame.point)
+        assert list(b.frame.zaxis) == pytest.approx(list(a.frame.zaxis))
+    assert decode_interfaces(encode_interfaces([])) == []
@@ -0,0 +1,95 @@
+import pytest
+
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Translation
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+from compas_assembly.geometry import Dome
+
+TMAX = 1e-6
+AMIN = 1e-2
+
+
+def brick(x, y, z):
+    return Block.from_shape(Box(1.0, 0.5, 0.3, Frame([x, y, z], [1, 0, 0], [0, 1, 0])))
+
+
+def wall(columns=6, courses=4):
+    assembly = Assembly()
+    for k in range(courses):
+        offset = 0.5 if k % 2 else 0.0
+        for i in range(columns):
+            assembly.add_block(brick(i + offset, 0, 0.15 + k * 0.3))
+    return assembly
+
+
+def interfaces_of(assembly):
+    result = {}
+    for u, v in assembly.edges():
+        result[u, v] = [(round(interface.size, 9), [[round(x, 9) for x in point] for point in interface.points]) for interface in assembly.edge_interfaces((u, v))]
+    return result
+
+
+def full_recompute(assembly):
+    reference = assembly.copy()
+    assembly_interfaces_numpy(reference, tmax=TMAX, amin=AMIN, nnbrs_mode="radius")
+    return interfaces_of(reference)
+
+
+@pytest.fixture
+def assembly():
+    assembly = wall()
+    assembly_interfaces_numpy(assembly, tmax=TMAX, amin=AMIN, nnbrs_mode="radius")
+    return assembly
+
+
+def test_update_without_changes(assembly):
+    before = interfaces_of(assembly)
+    assembly.update_interfaces([], tmax=TMAX, amin=AMIN)
+    assert interfaces_of(assembly) == before
+
+
+def test_update_moved_blocks(assembly):
+    nodes = list(assembly.nodes())
+    moved = [nodes[3], nodes[8]]
+    for node in moved:
+        assembly.node_block(node).transform(Translation.from_vector([0.25, 0, 0]))
+    assembly.update_interfaces(moved, tmax=TMAX, amin=AMIN)
+    assert interfaces_of(assembly) == full_recompute(assembly)
+
+
+def test_update_lifted_block(assembly):
+    node = list(assembly.nodes())[-1]
+    assembly.node_block(node).transform(Translation.from_vector([0, 0, 1.0]))
+    assembly.update_interfaces([node], tmax=TMAX, amin=AMIN)
+    assert assembly.graph.degree(node) == 0
+    assert interfaces_of(assembly) == full_recompute(assembly)
+
+
+def test_update_added_block(assembly):
+    node = assembly.add_block(brick(3.0, 0, 0.15 + 4 * 0.3))
+    assembly.update_interfaces([node], tmax=TMAX, amin=AMIN)
+    assert assembly.graph.degree(node) == 2
+    assert interfaces_of(assembly) == full_recompute(assembly)
+
+
+def test_update_removed_block(assembly):
+    node = list(assembly.nodes())[7]
+    assembly.remove_block(assembly.node_block(node))
+    assembly.update_interfaces([node], tmax=TMAX, amin=AMIN)
+    assert node not in assembly.spatial_index
+    assert interfaces_of(assembly) == full_recompute(assembly)
+
+
+def test_update_dome():
+    assembly = Assembly.from_template(Dome(meridians=12, hoops=6))
+    assembly_interfaces_numpy(assembly, tmax=1e-1, amin=1e-3, nnbrs_mode="radius")
+    nodes = list(assembly.nodes())[10:14]
+    for node in nodes:
+        assembly.node_block(node).transform(Translation.from_vector([0, 0, 0.05]))
+    assembly.update_interfaces(nodes, tmax=1e-1, amin=1e-3)
+    reference = assembly.copy()
+    assembly_interfaces_numpy(reference, tmax=1e-1, amin=1e-3, nnbrs_mode="radius")
+    assert interfaces_of(assembly) == interfaces_of(reference)
@@ -0,0 +1,42 @@
+import compas
+
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import assembly_json_chunks
+from compas_assembly.datastructures import assembly_json_dump
+from compas_assembly.datastructures import assembly_json_load
+from compas_assembly.geometry import Arch
+
+
+def arch():
+    assembly = Assembly.from_template(Arch(rise=5, span=10, thickness=0.7, depth=0.5, n=40))
+    assembly_interfaces_numpy(assembly, nmax=5, tmax=1e-3, amin=1e-3)
+    assembly.set_boundary_conditions([0])
+    return assembly
+
+
+def test_chunks_match_compas_json():
+    assembly = arch()
+    assert "".join(assembly_json_chunks(assembly)) == compas.json_dumps(assembly)
+
+
+def test_roundtrip(tmp_path):
+    assembly = arch()
+    filepath = str(tmp_path / "arch.json")
+    assembly_json_dump(assembly, filepath)
+
+    for chunksize in (7, 1 << 16):
+        loaded = assembly_json_load(filepath, chunksize=chunksize)
+        assert compas.json_dumps(loaded, minimal=True) == compas.json_dumps(compas.json_load(filepath), minimal=True)
+        assert loaded.guid == assembly.guid
+        assert [block.guid for block in loaded.blocks()] == [block.guid for block in assembly.blocks()]
+        assert all(loaded.has_block(block) for block in loaded.blocks())
+
+
+def test_load_compas_json(tmp_path):
+    assembly = arch()
+    filepath = str(tmp_path / "arch.json")
+    compas.json_dump(assembly, filepath, pretty=True)
+    loaded = assembly_json_load(filepath)
+
+    assert compas.json_dumps(loaded, minimal=True) == compas.json_dumps(compas.json_load(filepath), minimal=True)
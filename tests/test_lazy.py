@@ -0,0 +1,66 @@
+import json
+
+import compas
+
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+from compas_assembly.datastructures import Interface
+from compas_assembly.datastructures import LazyBlock
+from compas_assembly.datastructures import LazyInterface
+from compas_assembly.datastructures import assembly_json_load
+from compas_assembly.geometry import Arch
+
+
+def arch():
+    assembly = Assembly.from_template(Arch(rise=5, span=10, thickness=0.7, depth=0.5, n=20))
+    assembly_interfaces_numpy(assembly, nmax=5, tmax=1e-3, amin=1e-3)
+    assembly.set_boundary_conditions([0, 19])
+    return assembly
+
+
+def test_lazy_topology(tmp_path):
+    assembly = arch()
+    filepath = str(tmp_path / "arch.json")
+    compas.json_dump(assembly, filepath)
+
+    lazy = Assembly.from_json(filepath, lazy=True)
+
+    assert all(type(block) is LazyBlock for block in lazy.blocks())
+    assert all(type(interface) is LazyInterface for interface in lazy.interfaces())
+    assert sorted(lazy.edges()) == sorted(assembly.edges())
+    assert [node for node in lazy.nodes() if lazy.graph.node_attribute(node, "is_support")] == [0, 19]
+    assert [block.guid for block in lazy.blocks()] == [block.guid for block in assembly.blocks()]
+    assert all(lazy.has_block(block) for block in lazy.blocks())
+    # serialization doesn't require the payloads to be decoded
+    assert compas.json_dumps(lazy) == compas.json_dumps(assembly)
+    assert compas.json_dumps(lazy, minimal=True) == compas.json_dumps(assembly, minimal=True)
+    assert all(type(block) is LazyBlock for block in lazy.blocks())
+
+
+def test_lazy_access(tmp_path):
+    assembly = arch()
+    filepath = str(tmp_path / "arch.json")
+    compas.json_dump(assembly, filepath, pretty=True)
+
+    lazy = assembly_json_load(filepath, chunksize=64, lazy=True)
+    block = lazy.node_block(3)
+    guid = block.guid
+
+    assert block.volume() == assembly.node_block(3).volume()
+    assert type(block) is Block
+    assert block.guid == guid
+    assert lazy.node_block(3) is block
+    assert lazy.block_node(block) == 3
+    assert type(lazy.node_block(4)) is LazyBlock
+
+    interface = next(lazy.interfaces())
+    assert interface.size == next(assembly.interfaces()).size
+    assert type(interface) is Interface
+
+    # the payloads of the blocks that were not accessed keep the sorted keys of the file
+    assert json.loads(compas.json_dumps(lazy, minimal=True)) == json.loads(compas.json_dumps(assembly, minimal=True))
+
+    assembly_interfaces_numpy(lazy, nmax=5, tmax=1e-3, amin=1e-3)
+    assert lazy.number_of_interfaces() == assembly.number_of_interfaces()
+    assert all(type(block) is Block for block in lazy.blocks())
@@ -0,0 +1,118 @@
+import pytest
+
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.algorithms import merge_coplanar_interfaces
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+from compas_assembly.datastructures import Interface
+
+
+def strips(z, n, m):
+    # a unit cube with the top face split into n strips along x, and the bottom face into m strips along y
+    tx = [i / n for i in range(n + 1)]
+    ty = [j / m for j in range(m + 1)]
+    polygons = []
+    for i in range(n):
+        polygons.append([[tx[i], 0, z + 1], [tx[i + 1], 0, z + 1], [tx[i + 1], 1, z + 1], [tx[i], 1, z + 1]])
+    for j in range(m):
+        polygons.append([[0, ty[j], z], [0, ty[j + 1], z], [1, ty[j + 1], z], [1, ty[j], z]])
+    polygons.append([[0, 0, z], [1, 0, z]] + [[x, 0, z + 1] for x in reversed(tx)])
+    polygons.append([[1, 1, z], [0, 1, z]] + [[x, 1, z + 1] for x in tx])
+    polygons.append([[0, y, z] for y in reversed(ty)] + [[0, 0, z + 1], [0, 1, z + 1]])
+    polygons.append([[1, y, z] for y in ty] + [[1, 1, z + 1], [1, 0, z + 1]])
+    mesh = Mesh.from_polygons(polygons)
+    mesh.unify_cycles()
+    block = Block.from_vertices_and_faces(*mesh.to_vertices_and_faces())
+    if block.volume() < 0:
+        block.flip_cycles()
+    return block
+
+
+@pytest.mark.parametrize("n, m", [(1, 1), (3, 1), (1, 4), (3, 4)])
+def test_merge_coplanar_interfaces(n, m):
+    assembly = Assembly()
+    a = assembly.add_block(strips(0.0, n, 1))
+    b = assembly.add_block(strips(1.0, 1, m))
+    assembly_interfaces_numpy(assembly, tmax=1e-6, amin=1e-3, nnbrs_mode="radius")
+    edge = next(assembly.edges())
+
+    assert set(edge) == {a, b}
+    assert len(assembly.edge_interfaces(edge)) == n * m
+    zaxis = assembly.edge_interfaces(edge)[0].frame.zaxis
+
+    merge_coplanar_interfaces(assembly)
+    interfaces = assembly.edge_interfaces(edge)
+
+    assert len(interfaces) == 1
+    assert interfaces[0].size == pytest.approx(1.0)
+    assert list(interfaces[0].frame.point) == pytest.approx([0.5, 0.5, 1.0])
+    # the frame points in the same direction as the frames of the merged interfaces
+    assert interfaces[0].frame.zaxis.dot(zaxis) == pytest.approx(1.0)
+    # the corners of the strips on the boundary are kept
+    assert len(interfaces[0].points) == 4 + 2 * (n - 1) + 2 * (m - 1)
+
+
+def test_merge_coplanar_interfaces_not_coplanar():
+    assembly = Assembly()
+    assembly.add_block(strips(0.0, 2, 1))
+    assembly.add_block(strips(1.0, 1, 2))
+    assembly_interfaces_numpy(assembly, tmax=1e-6, amin=1e-3, nnbrs_mode="radius")
+    edge = next(assembly.edges())
+    interfaces = assembly.edge_interfaces(edge)
+    interfaces[0].points = [[x, y, z + 0.01] for x, y, z in interfaces[0].points]
+
+    first = interfaces[0]
+
+    merge_coplanar_interfaces(assembly)
+    interfaces = assembly.edge_interfaces(edge)
+
+    # the raised interface is kept, the other three are merged into an L-shaped interface
+    assert len(interfaces) == 2
+    assert interfaces[0] is first
+    assert interfaces[1].size == pytest.approx(0.75)
+    assert list(interfaces[1].frame.point) == pytest.approx([7 / 12, 7 / 12, 1.0])
+
+
+def pair(polygons):
+    # two blocks with the given polygons as interfaces
+    assembly = Assembly()
+    a = Block.from_shape(Box(1.0))
+    b = Block.from_shape(Box(1.0))
+    assembly.add_block(a)
+    assembly.add_block(b)
+    assembly.add_block_block_interfaces(a, b, [Interface(points=points) for points in polygons])
+    return assembly, next(assembly.edges())
+
+
+def square(x, y, z0=0.0, z1=None):
+    z1 = z0 if z1 is None else z1
+    return [[x, y, z0], [x + 1, y, z1], [x + 1, y + 1, z1], [x, y + 1, z0]]
+
+
+def test_merge_coplanar_interfaces_stepped():
+    # two adjacent squares at the bottom, and two adjacent squares at the top of a step
+    assembly, edge = pair([square(0, 0), square(2, 0, 0.5), square(0, 1), square(2, 1, 0.5)])
+
+    merge_coplanar_interfaces(assembly)
+    interfaces = assembly.edge_interfaces(edge)
+
+    assert len(interfaces) == 2
+    assert sorted(interface.size for interface in interfaces) == pytest.approx([2.0, 2.0])
+    assert sorted(interface.frame.point.z for interface in interfaces) == pytest.approx([0.0, 0.5])
+
+
+def test_merge_coplanar_interfaces_drift():
+    # a chain of squares with slowly increasing slope
+    # every square lies in the plane of its neighbours within the tolerance, but not in the plane of the first square of the chain
+    tol = 1e-3
+    d = 0.4 * tol
+    z = [0.5 * d * i**2 for i in range(5)]
+    assembly, edge = pair([square(i, 0, z[i], z[i + 1]) for i in range(4)])
+
+    merge_coplanar_interfaces(assembly, tol=tol)
+    interfaces = assembly.edge_interfaces(edge)
+
+    assert len(interfaces) == 2
+    assert [interface.size for interface in interfaces] == pytest.approx([2.0, 2.0])
@@ -0,0 +1,79 @@
+import pytest
+
+from compas.geometry import Frame
+from compas_assembly.algorithms import assembly_interface_moments_numpy
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.algorithms import interface_moments_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Interface
+from compas_assembly.geometry import Dome
+
+
+def rectangle(x, y, w, h):
+    points = [[x, y, 1.0], [x + w, y, 1.0], [x + w, y + h, 1.0], [x, y + h, 1.0]]
+    return Interface(points=points, frame=Frame([0, 0, 1.0], [1, 0, 0], [0, 1, 0]))
+
+
+def test_rectangle():
+    interface = rectangle(1.0, 2.0, 2.0, 3.0)
+
+    assert interface.M0 == pytest.approx(6.0)
+    assert list(interface.M1) == pytest.approx([6.0 * 2.0, 6.0 * 3.5, 0.0])
+    # second moment of area with respect to the origin
+    assert interface.M2[0][0] == pytest.approx(2.0 * 3.0 * (2.0**2 / 12 + 2.0**2))
+    assert interface.M2[1][1] == pytest.approx(2.0 * 3.0 * (3.0**2 / 12 + 3.5**2))
+
+
+def test_cache_invalidation():
+    interface = rectangle(0.0, 0.0, 1.0, 1.0)
+    assert interface.M0 == pytest.approx(1.0)
+
+    interface.points = [[0, 0, 1.0], [2.0, 0, 1.0], [2.0, 1.0, 1.0], [0, 1.0, 1.0]]
+    assert interface.M0 == pytest.approx(2.0)
+
+    interface.M2[0][0] = 100.0
+    assert interface.M2[0][0] != 100.0
+
+
+def test_numpy():
+    assembly = Assembly.from_template(Dome(meridians=12, hoops=6))
+    assembly_interfaces_numpy(assembly, nmax=20, tmax=1e-1, amin=1e-3)
+    interfaces = list(assembly.interfaces())
+    interfaces.append(rectangle(1.0, 2.0, 2.0, 3.0))
+    # the edge by edge computation used inside Rhino
+    reference = [interface._compute_moments() for interface in interfaces]
+
+    m0, m1, m2 = interface_moments_numpy(interfaces)
+
+    assert m0.shape == (len(interfaces),)
+    assert m1.shape == (len(interfaces), 3)
+    assert m2.shape == (len(interfaces), 3, 3)
+
+    for interface, (r0, r1, r2), a, b, c in zip(interfaces, reference, m0, m1, m2):
+        assert a == pytest.approx(r0, abs=1e-12)
+        assert b.tolist() == pytest.approx(r1, abs=1e-12)
+        assert c.ravel().tolist() == pytest.approx([x for row in r2 for x in row], abs=1e-12)
+        assert interface._moments is not None
+        assert interface.M0 == a
+
+
+def test_assembly():
+    assembly = Assembly.from_template(Dome(meridians=12, hoops=6))
+    assembly_interfaces_numpy(assembly, nmax=20, tmax=1e-1, amin=1e-3)
+
+    m0, m1, m2 = assembly_interface_moments_numpy(assembly, cache=False)
+
+    assert len(m0) == assembly.number_of_interfaces()
+    assert all(interface._moments is None for interface in assembly.interfaces())
+    assert m0 == pytest.approx([interface.M0 for interface in assembly.interfaces()])
+
+    assert interface_moments_numpy([])[0].shape == (0,)
+
+
+def test_single_interface_uses_numpy():
+    interface = rectangle(1.0, 2.0, 2.0, 3.0)
+    m0, m1, m2 = interface_moments_numpy([interface], cache=False)
+
+    assert interface.M0 == m0[0]
+    assert list(interface.M1) == m1[0].tolist()
+    assert interface.M2 == m2[0].tolist()
@@ -0,0 +1,96 @@
+import pytest
+from numpy import array
+from numpy.linalg import norm
+
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas_assembly.algorithms.nnbrs import find_block_pairs
+from compas_assembly.algorithms.nnbrs import find_nearest_neighbours
+from compas_assembly.algorithms.nnbrs import find_neighbours_in_radius
+from compas_assembly.datastructures import Block
+
+
+def bricks(columns=5, courses=4):
+    blocks = []
+    for k in range(courses):
+        offset = 0.5 if k % 2 else 0.0
+        for i in range(columns):
+            blocks.append(Block.from_shape(Box(1.0, 0.5, 0.3, Frame([i + offset, 0, 0.15 + k * 0.3], [1, 0, 0], [0, 1, 0]))))
+    return blocks
+
+
+def as_set(pairs):
+    return set(tuple(sorted(pair)) for pair in pairs.tolist())
+
+
+def test_nearest_neighbours_arrays():
+    cloud = [[0, 0, 0], [1, 0, 0], [3, 0, 0], [3, 2, 0]]
+    distances, indices = find_nearest_neighbours(cloud, 3)
+
+    assert distances.shape == (4, 3)
+    assert indices.shape == (4, 3)
+    assert indices[:, 0].tolist() == [0, 1, 2, 3]
+    assert (distances[:, 1:] >= distances[:, :-1]).all()
+    assert indices[2].tolist() == [2, 3, 1]
+
+
+def test_nearest_neighbours_dims():
+    cloud = [[0, 0, 0], [0, 0, 5], [2, 0, 0]]
+    _, indices = find_nearest_neighbours(cloud, 2, dims=2)
+    assert sorted(indices[0].tolist()) == [0, 1]
+
+    _, indices = find_nearest_neighbours(cloud, 2, dims=3)
+    assert indices[0].tolist() == [0, 2]
+
+
+def test_neighbours_in_radius_brute_force():
+    cloud = array([[0, 0, 0], [1.5, 0, 0], [4, 0, 0], [4, 3.5, 0], [0, 0, 10]], dtype=float)
+    radii = array([1.0, 0.4, 2.0, 1.6, 0.1])
+    pairs = find_neighbours_in_radius(cloud, radii)
+
+    expected = []
+    for i in range(len(cloud)):
+        for j in range(i + 1, len(cloud)):
+            if norm(cloud[i] - cloud[j]) <= radii[i] + radii[j]:
+                expected.append([i, j])
+
+    assert pairs.tolist() == expected
+
+
+def test_neighbours_in_radius_tol():
+    cloud = [[0, 0, 0], [2.05, 0, 0]]
+    assert find_neighbours_in_radius(cloud, [1.0, 1.0]).tolist() == []
+    assert find_neighbours_in_radius(cloud, [1.0, 1.0], tol=0.1).tolist() == [[0, 1]]
+
+
+def test_block_pairs_modes_agree():
+    blocks = bricks()
+    knn = find_block_pairs(blocks, nmax=len(blocks), mode="knn")
+    radius = find_block_pairs(blocks, mode="radius")
+    index = find_block_pairs(blocks, mode="index")
+
+    assert as_set(knn) == as_set(radius) == as_set(index)
+    # the neighbours in the same course and in the courses below and above
+    assert len(as_set(radius)) == 4 * 4 + 3 * 9
+
+
+def test_block_pairs_knn_subset():
+    blocks = bricks()
+    knn = as_set(find_block_pairs(blocks, nmax=3, mode="knn"))
+    radius = as_set(find_block_pairs(blocks, mode="radius"))
+
+    assert knn
+    assert knn <= radius
+
+
+def test_block_pairs_broadphase():
+    blocks = bricks(columns=3, courses=1)
+    blocks.append(Block.from_shape(Box(1.0, 0.5, 0.3, Frame([1, 0, 0.45 + 1e-3], [1, 0, 0], [0, 1, 0]))))
+
+    assert as_set(find_block_pairs(blocks, mode="radius", tmax=1e-6)) == {(0, 1), (1, 2)}
+    assert (1, 3) in as_set(find_block_pairs(blocks, mode="radius", tmax=1e-2))
+
+
+def test_block_pairs_mode_not_supported():
+    with pytest.raises(ValueError):
+        find_block_pairs(bricks(), mode="grid")
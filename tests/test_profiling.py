@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+import compas
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas_assembly.algorithms import active_profiler
+from compas_assembly.algorithms import assembly_interfaces
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.algorithms import assembly_profiler
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+
+
+def brick(x, y, z):
+    return Block.from_shape(Box(1.0, 0.5, 0.3, Frame([x, y, z], [1, 0, 0], [0, 1, 0])))
+
+
+def wall(columns=4, courses=3):
+    assembly = Assembly()
+    for k in range(courses):
+        offset = 0.5 if k % 2 else 0.0
+        for i in range(columns):
+            assembly.add_block(brick(i + offset, 0, 0.15 + k * 0.3))
+    return assembly
+
+
+@pytest.mark.parametrize("algorithm", [assembly_interfaces, assembly_interfaces_numpy])
+def test_profiler(algorithm, tmp_path):
+    reference = algorithm(wall(), tmax=1e-6, amin=1e-2, nnbrs_mode="radius")
+
+    reports = []
+    with assembly_profiler(nslowest=3, callback=reports.append) as profiler:
+        assert active_profiler() is profiler
+        assembly = algorithm(wall(), tmax=1e-6, amin=1e-2, nnbrs_mode="radius")
+
+    assert active_profiler() is None
+    assert reports == [profiler]
+    assert compas.json_dumps(assembly, minimal=True) == compas.json_dumps(reference, minimal=True)
+
+    assert set(profiler.timings) == {"neighbours", "frames", "projection", "intersection", "insertion"}
+    assert profiler.counts["blocks"] == 12
+    assert profiler.counts["interfaces"] == assembly.number_of_interfaces()
+    assert profiler.counts["pairs with interfaces"] == assembly.number_of_edges()
+    assert sum(profiler.rejections.values()) + profiler.counts["interfaces"] == profiler.counts["face pairs"]
+
+    slowest = profiler.slowest
+    assert len(slowest) == 3
+    assert [item[0] for item in slowest] == sorted([item[0] for item in slowest], reverse=True)
+
+    filepath = str(tmp_path / "profile.json")
+    profiler.to_json(filepath)
+    with open(filepath) as f:
+        data = json.load(f)
+    assert data["counts"] == profiler.counts
+    assert data["rejections"] == profiler.rejections
+    assert [item["pair"] for item in data["slowest"]] == [[u, v] for _, u, v in slowest]
+
+
+def test_profiler_nested():
+    with assembly_profiler() as outer:
+        with assembly_profiler() as inner:
+            assembly_interfaces_numpy(wall(), tmax=1e-6, amin=1e-2)
+        assert active_profiler() is outer
+
+    assert inner.counts["blocks"] == 12
+    assert not outer.counts
@@ -0,0 +1,144 @@
+import random
+
+import pytest
+
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import Block
+from compas_assembly.datastructures import SpatialIndex
+from compas_assembly.datastructures.spatialindex import box_point_distance
+from compas_assembly.datastructures.spatialindex import ray_box_intersection
+
+
+def random_boxes(n=200, seed=0):
+    rng = random.Random(seed)
+    boxes = {}
+    for i in range(n):
+        x, y, z = rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10)
+        dx, dy, dz = rng.uniform(0.1, 2), rng.uniform(0.1, 2), rng.uniform(0.1, 2)
+        boxes[i] = (x, y, z, x + dx, y + dy, z + dz)
+    return boxes
+
+
+def wall(columns=4, courses=3):
+    assembly = Assembly()
+    for k in range(courses):
+        offset = 0.5 if k % 2 else 0.0
+        for i in range(columns):
+            box = Box(1.0, 0.5, 0.3, Frame([i + offset, 0, 0.15 + k * 0.3], [1, 0, 0], [0, 1, 0]))
+            assembly.add_block(Block.from_shape(box))
+    return assembly
+
+
+def test_query_sphere():
+    boxes = random_boxes()
+    index = SpatialIndex()
+    index.build(boxes)
+
+    for point, radius in [([0, 0, 0], 3.0), ([5, -5, 2], 1.0), ([30, 30, 30], 5.0)]:
+        expected = [key for key, box in boxes.items() if box_point_distance(box, point) <= radius]
+        assert sorted(index.query_sphere(point, radius)) == expected
+
+
+@pytest.mark.parametrize("k", [1, 5, 20])
+def test_nearest(k):
+    boxes = random_boxes()
+    index = SpatialIndex()
+    index.build(boxes)
+
+    for point in ([0, 0, 0], [9, -9, 9], [100, 0, 0]):
+        expected = sorted(box_point_distance(box, point) for box in boxes.values())[:k]
+        assert [distance for distance, _ in index.nearest(point, k=k)] == pytest.approx(expected)
+
+    assert index.nearest([0, 0, 0], k=0) == []
+    assert len(index.nearest([0, 0, 0], k=1000)) == len(boxes)
+
+
+def test_query_ray():
+    boxes = random_boxes()
+    index = SpatialIndex()
+    index.build(boxes)
+
+    rays = [([-20, 0.5, 0.5], [1, 0, 0]), ([0, 0, 0], [1, 2, -3]), ([15, 15, 15], [-1, -1, -1]), ([0, 0, 20], [0, 0, -1])]
+    for origin, direction in rays:
+        expected = []
+        for key, box in boxes.items():
+            hit = ray_box_intersection(origin, direction, box)
+            if hit is not None and hit[1] >= 0:
+                expected.append((max(hit[0], 0.0), key))
+        expected.sort()
+        assert sorted(index.query_ray(origin, direction)) == expected
+
+    hits = index.query_ray([-20, 0.5, 0.5], [1, 0, 0], tmax=20.0)
+    assert all(t <= 20.0 for t, _ in hits)
+    assert index.query_ray([100, 100, 100], [1, 0, 0]) == []
+
+
+def test_index_after_updates():
+    index = SpatialIndex(cellsize=1.0)
+    index.insert("a", (0, 0, 0, 1, 1, 1))
+    index.insert("b", (5, 0, 0, 6, 1, 1))
+    index.update("a", (10, 0, 0, 11, 1, 1))
+    index.remove("b")
+
+    assert index.nearest([0, 0, 0]) == [(10.0, "a")]
+    assert index.query_ray([0, 0.5, 0.5], [1, 0, 0]) == [(10.0, "a")]
+
+
+def test_query_large_box():
+    boxes = random_boxes()
+    index = SpatialIndex()
+    index.build(boxes)
+
+    # a box covering far more cells than are occupied, and a box outside the grid
+    assert sorted(index.query_box((-1e6, -1e6, -1e6, 1e6, 1e6, 1e6))) == sorted(boxes)
+    assert index.query_box((1e5, 1e5, 1e5, 1e6, 1e6, 1e6)) == []
+    assert sorted(index.query_sphere([0, 0, 0], 1e6)) == sorted(boxes)
+
+
+def test_extent_after_remove():
+    index = SpatialIndex(cellsize=1.0)
+    index.insert("a", (0, 0, 0, 1, 1, 1))
+    index.insert("b", (1000, 0, 0, 1001, 1, 1))
+    assert index._extent == [0, 0, 0, 1001, 1, 1]
+
+    index.remove("b")
+    assert index._extent == [0, 0, 0, 1, 1, 1]
+
+    index.remove("a")
+    assert index._extent is None
+    assert index.query_box((0, 0, 0, 1, 1, 1)) == []
+
+    index.insert("c", (2, 2, 2, 3, 3, 3))
+    assert index._extent == [2, 2, 2, 3, 3, 3]
+    assert index.query_box((0, 0, 0, 5, 5, 5)) == ["c"]
+
+
+def test_assembly_queries():
+    assembly = wall()
+    nodes = list(assembly.nodes())
+
+    assert sorted(assembly.blocks_in_box((-0.1, -0.1, 0.0, 0.1, 0.1, 0.1))) == [nodes[0]]
+    assert sorted(assembly.blocks_near([0, 0, 0.15], 0.1)) == [nodes[0]]
+    assert assembly.k_nearest([1.0, 0, 0.15], k=1) == [nodes[1]]
+    assert set(assembly.k_nearest([0.0, 0, 0.15], k=3)) == {nodes[0], nodes[4], nodes[8]}
+
+    # blocks of the second course overlap the first course in x, but are higher
+    assert assembly.ray_pick([0.6, -5, 0.45], [0, 1, 0]) == nodes[4]
+    assert assembly.ray_pick([0.6, 5, 0.15], [0, -1, 0]) == nodes[1]
+    assert assembly.ray_pick([0.2, 0.0, 10.0], [0, 0, -1]) == nodes[8]
+    assert assembly.ray_pick([0.0, 0.0, -1.0], [0, 0, -1]) is None
+
+    block = assembly.node_block(nodes[8])
+    assembly.remove_block(block)
+    assert assembly.ray_pick([0.2, 0.0, 10.0], [0, 0, -1]) == nodes[4]
+
+
+def test_interfaces_index_mode():
+    reference = assembly_interfaces_numpy(wall(), tmax=1e-6, amin=1e-2, nnbrs_mode="radius")
+    assembly = assembly_interfaces_numpy(wall(), tmax=1e-6, amin=1e-2, nnbrs_mode="index")
+
+    assert sorted(assembly.edges()) == sorted(reference.edges())
+    assert assembly.number_of_interfaces() == reference.number_of_interfaces()
@@ -0,0 +1,36 @@
+import pytest
+
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import BlockView
+from compas_assembly.geometry import Arch
+from compas_assembly.geometry import Dome
+
+
+@pytest.mark.parametrize("template", [Dome(meridians=9, hoops=5), Arch(rise=5, span=10, thickness=0.7, depth=0.5, n=20), Arch(rise=3, span=10, thickness=0.5, depth=0.5, n=7)])
+def test_blocks_numpy(template):
+    vertices, faces = template.blocks_numpy()
+    blocks = template.blocks()
+
+    assert vertices.shape == (len(blocks), 8, 3)
+    for block, xyz in zip(blocks, vertices):
+        assert xyz.ravel().tolist() == pytest.approx([x for point in block.vertices_attributes("xyz") for x in point], abs=1e-12)
+        assert [block.face_vertices(face) for face in block.faces()] == faces
+
+
+def test_from_template_compact():
+    template = Dome(meridians=12, hoops=6)
+    reference = Assembly.from_template(template)
+    assembly = Assembly.from_template(template, compact=True)
+
+    assert assembly.buffer is not None
+    assert all(isinstance(block, BlockView) for block in assembly.blocks())
+    assert assembly.number_of_nodes() == reference.number_of_nodes()
+    for node in assembly.nodes():
+        a = assembly.graph.node_attributes(node, "xyz")
+        b = reference.graph.node_attributes(node, "xyz")
+        assert a == pytest.approx(b)
+
+    assembly_interfaces_numpy(assembly, nmax=20, tmax=1e-1, amin=1e-3)
+    assembly_interfaces_numpy(reference, nmax=20, tmax=1e-1, amin=1e-3)
+    assert sorted(assembly.edges()) == sorted(reference.edges())
@@ -0,0 +1,107 @@
+import pytest
+
+from compas.geometry import Rotation
+from compas.geometry import Scale
+from compas.geometry import Translation
+from compas_assembly.algorithms import assembly_interfaces_numpy
+from compas_assembly.datastructures import Assembly
+from compas_assembly.datastructures import InterfaceArrays
+from compas_assembly.geometry import Arch
+
+
+def flatten(points):
+    return [x for point in points for x in point]
+
+
+@pytest.fixture
+def assembly():
+    assembly = Assembly.from_template(Arch(rise=5, span=10, thickness=0.7, depth=0.5, n=10))
+    assembly_interfaces_numpy(assembly, nmax=20, tmax=1e-1, amin=1e-3)
+    return assembly
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_rigid(assembly, compact):
+    if compact:
+        assembly.compact()
+    R = Rotation.from_axis_and_angle([1.0, 1.0, 0], 0.7, point=[1.0, 2.0, 3.0])
+    blocks = {node: assembly.node_block(node).copy() for node in assembly.nodes()}
+    interfaces = [interface.copy() for interface in assembly.interfaces()]
+    arrays = assembly.interface_arrays()
+
+    assembly.transform(R)
+
+    for node, block in blocks.items():
+        block.transform(R)
+        result = assembly.node_block(node)
+        assert flatten(result.vertices_attributes("xyz")) == pytest.approx(flatten(block.vertices_attributes("xyz")))
+        assert list(result.centroid()) == pytest.approx(list(block.centroid()))
+    for interface, result in zip(interfaces, assembly.interfaces()):
+        frame = interface.frame.transformed(R)
+        assert flatten(result.points) == pytest.approx(flatten(interface.polygon.transformed(R).points))
+        assert flatten([result.frame.point, result.frame.xaxis, result.frame.yaxis]) == pytest.approx(flatten([frame.point, frame.xaxis, frame.yaxis]))
+        assert result.M0 == pytest.approx(interface.M0)
+        assert list(result.M1) == pytest.approx(list(interface.M1), abs=1e-9)
+
+    assert assembly.interface_arrays() is not arrays
+    reference = InterfaceArrays.from_assembly(assembly)
+    assert assembly.interface_arrays().points.ravel().tolist() == pytest.approx(reference.points.ravel().tolist())
+    assert assembly.interface_arrays().uvw.ravel().tolist() == pytest.approx(reference.uvw.ravel().tolist())
+    assert sorted(assembly.blocks_near(assembly.node_point(0), 1e-3)) == [0]
+
+
+def test_per_block(assembly):
+    from numpy import tile
+
+    nodes = list(assembly.nodes())
+    matrices = tile(Translation.from_vector([0, 0, 0]).matrix, (len(nodes), 1, 1))
+    matrices[:, 2, 3] = nodes
+    blocks = {node: assembly.node_block(node).copy() for node in nodes}
+    interfaces = {edge: [interface.copy() for interface in assembly.edge_interfaces(edge)] for edge in assembly.edges()}
+
+    assembly.transform(matrices)
+
+    for node, block in blocks.items():
+        block.transform(Translation.from_vector([0, 0, node]))
+        assert flatten(assembly.node_block(node).vertices_attributes("xyz")) == pytest.approx(flatten(block.vertices_attributes("xyz")))
+    for (u, v), items in interfaces.items():
+        for interface, result in zip(items, assembly.edge_interfaces((u, v))):
+            assert flatten(result.points) == pytest.approx(flatten(interface.polygon.transformed(Translation.from_vector([0, 0, u])).points))
+
+    with pytest.raises(ValueError):
+        assembly.transform(matrices[1:])
+
+
+def test_scale(assembly):
+    areas = [interface.M0 for interface in assembly.interfaces()]
+    assembly.interface_arrays()
+
+    assembly.transform(Scale.from_factors([2.0, 2.0, 2.0]))
+
+    assert assembly._interface_arrays is None
+    assert [interface.M0 for interface in assembly.interfaces()] == pytest.approx([4 * area for area in areas])
+
+
+def test_non_uniform_scale(assembly):
+    S = Scale.from_factors([2.0, 3.0, 0.5])
+    polygons = [interface.polygon.transformed(S) for interface in assembly.interfaces()]
+    signs = [1.0 if interface.M0 > 0 else -1.0 for interface in assembly.interfaces()]
+
+    assembly.transform(S)
+
+    for interface, polygon, sign in zip(assembly.interfaces(), polygons, signs):
+        assert interface.size == pytest.approx(polygon.area)
+        # the signed area keeps the orientation of the polygon with respect to the frame
+        assert interface.M0 == pytest.approx(sign * polygon.area)
+
+
+def test_copy_unaffected(assembly):
+    points = [flatten(interface.points) for interface in assembly.interfaces()]
+    transformed = assembly.transformed(Translation.from_vector([1.0, 0, 0]))
+
+    assert [flatten(interface.points) for interface in assembly.interfaces()] == points
+    assert [flatten(interface.points)[0] for interface in transformed.interfaces()] == pytest.approx([p[0] + 1.0 for p in points])
+
+    empty = Assembly.from_template(Arch(rise=5, span=10, thickness=0.7, depth=0.5, n=4))
+    empty.transform(Translation.from_vector([1.0, 0, 0]))
+    assert empty.number_of_interfaces() == 0